@@ -0,0 +1,52 @@
+"""
+Anthropic 클라이언트 풀
+- 요청마다 클라이언트(HTTP 커넥션 풀 포함)를 새로 만들지 않고 프로세스 전체에서 공유
+- anthropic.Anthropic 클라이언트는 스레드 안전하므로 반납 절차 없이 라운드로빈으로 나눠 사용
+"""
+
+import os
+import itertools
+import logging
+import threading
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AnthropicClientPool:
+    """API 키별로 최대 size개의 Anthropic 클라이언트를 만들어 나눠 쓰는 풀"""
+
+    def __init__(self, size: Optional[int] = None):
+        self.size = max(1, size or int(os.getenv("ANTHROPIC_CLIENT_POOL_SIZE", "4")))
+        self._clients: Dict[str, List] = {}
+        self._counters: Dict[str, itertools.count] = {}
+        self._lock = threading.Lock()
+
+    def get(self, api_key: Optional[str] = None):
+        """클라이언트 가져오기 (API 키가 없으면 None)"""
+        api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            return None
+
+        with self._lock:
+            clients = self._clients.setdefault(api_key, [])
+            counter = self._counters.setdefault(api_key, itertools.count())
+            index = next(counter) % self.size
+
+            if index >= len(clients):
+                import anthropic
+                clients.append(anthropic.Anthropic(api_key=api_key))
+                logger.info(f"Anthropic 클라이언트 생성 ({len(clients)}/{self.size})")
+
+            return clients[index]
+
+
+# 싱글톤 인스턴스
+_client_pool = None
+
+def get_client_pool() -> AnthropicClientPool:
+    """Anthropic 클라이언트 풀 싱글톤 인스턴스 가져오기"""
+    global _client_pool
+    if _client_pool is None:
+        _client_pool = AnthropicClientPool()
+    return _client_pool
@@ -7,15 +7,15 @@ import os
 import uuid
 import shutil
 import logging
-import zipfile
-import io
+import json
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List
 
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Request
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Request, Body
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.base import BaseHTTPMiddleware
 from urllib.parse import unquote, quote
@@ -24,15 +24,23 @@ from dotenv import load_dotenv
 from pdf_converter import PDFConverter
 from html_generator import HTMLGenerator
 from learning_system import get_learning_system
+from chat_history import get_chat_store
+from html_sections import find_sections, section_outline, apply_section_patch, SectionPatchError
 from universal_parser import get_universal_parser
 from template_engine import get_template_engine
 from localization import get_localization_manager
 from verification_system import get_verification_system, get_church_bulletin_verifier
 from intelligent_layout_engine import get_layout_engine
+from job_queue import get_job_manager, Job, JobQueueFullError, JOB_DONE
+from upload_storage import save_upload, StoredUpload, UploadSizeLimitMiddleware
+from zip_stream import iter_folder_zip
+from output_delivery import get_output_delivery
+from bulletin_models import get_bulletin_model_store
+from metrics import get_metrics, StageTimer
 
 # 데이터베이스 연결
 from database.db_connection import (
-    get_db, init_db,
+    get_db, init_db, get_write_queue,
     DocumentRepository, ChurchBulletinRepository, AuditLogger
 )
 
@@ -56,6 +64,9 @@ localization_manager = get_localization_manager()
 verification_system = get_verification_system()
 church_bulletin_verifier = get_church_bulletin_verifier()
 layout_engine = get_layout_engine()
+job_manager = get_job_manager()
+output_delivery = get_output_delivery()
+bulletin_models = get_bulletin_model_store()
 
 # 데이터베이스 초기화
 try:
@@ -63,6 +74,8 @@ try:
     doc_repo = DocumentRepository(db_manager)
     bulletin_repo = ChurchBulletinRepository(db_manager)
     audit_logger = AuditLogger(db_manager)
+    # 변환 기록(문서/주보/감사 로그)은 응답 후 백그라운드에서 일괄 저장
+    db_write_queue = get_write_queue()
     logger.info("데이터베이스 초기화 완료")
 except Exception as db_err:
     logger.warning(f"데이터베이스 초기화 실패: {db_err} - DB 기능 비활성화")
@@ -70,6 +83,7 @@ except Exception as db_err:
     doc_repo = None
     bulletin_repo = None
     audit_logger = None
+    db_write_queue = None
 
 # 환경변수 로드
 load_dotenv()
@@ -126,6 +140,17 @@ class KoreanURLMiddleware(BaseHTTPMiddleware):
 # 미들웨어 등록 (순서 중요: 가장 먼저 실행되어야 함)
 app.add_middleware(KoreanURLMiddleware)
 
+# 업로드 크기 제한: Content-Length가 제한을 넘으면 본문을 받기 전에 413 (CORS 헤더는 유지)
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    paths=[
+        "/api/convert", "/api/convert-pdf", "/api/convert/universal", "/api/convert/custom",
+        "/api/auto-convert", "/api/church-convert", "/api/church-convert-ai",
+        "/api/lecture-convert-ai", "/api/newsletter-convert-ai", "/api/catalog-convert-ai",
+        "/api/election-convert-ai", "/api/church-verify",
+    ],
+)
+
 # CORS 설정 (프론트엔드에서 접근 허용)
 app.add_middleware(
     CORSMiddleware,
@@ -156,6 +181,20 @@ TEMPLATES_DIR.mkdir(exist_ok=True)
 STATIC_DIR = BASE_DIR / "static"
 STATIC_DIR.mkdir(exist_ok=True)
 
+class ImmutableStaticFiles(StaticFiles):
+    """파일명에 내용 해시가 들어간 번들 - 내용이 바뀌면 파일명도 바뀌므로 오래 캐시"""
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+# 교회 주보 CSS/JS 번들 (CHURCH_EXTERNAL_ASSETS=1일 때 church_html_generator가 생성) - /static보다 먼저 등록
+BULLETIN_ASSET_DIR = STATIC_DIR / "bulletin"
+BULLETIN_ASSET_DIR.mkdir(exist_ok=True)
+app.mount("/static/bulletin", ImmutableStaticFiles(directory=str(BULLETIN_ASSET_DIR)), name="bulletin_assets")
+
 # static 폴더는 StaticFiles로 서빙 (영문 파일명만 있음)
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR), html=True), name="static")
 
@@ -270,6 +309,92 @@ def cleanup_temp_files(job_id: str = None, keep_outputs: bool = True, cleanup_ol
         return deleted_files
 
 
+def _submit_job(kind: str, fn, *args, job_id: Optional[str] = None,
+                upload: Optional[StoredUpload] = None, **kwargs) -> Job:
+    """변환 파이프라인을 작업 큐에 제출 (대기열이 가득 차면 503)"""
+    try:
+        return job_manager.submit(
+            kind, fn, *args, job_id=job_id,
+            upload_size=upload.size if upload else None, **kwargs
+        )
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=f"서버가 혼잡합니다. 잠시 후 다시 시도해주세요 ({e})")
+
+
+async def _respond_with_job(job: Job, async_mode: bool = False) -> JSONResponse:
+    """
+    작업 응답 생성
+
+    - async_mode: job_id를 즉시 반환 (202)
+    - 기본: 이벤트 루프를 막지 않고 작업 완료를 기다린 뒤 결과 반환 (기존 응답 형식 유지)
+    """
+    if async_mode:
+        return JSONResponse({
+            "success": True,
+            "job_id": job.job_id,
+            "status": job.status,
+            "status_url": f"/api/result/{job.job_id}?format=json",
+            "events_url": f"/api/jobs/{job.job_id}/events",
+            "message": "변환 작업이 등록되었습니다"
+        }, status_code=202)
+
+    result = await job_manager.wait(job)
+    return JSONResponse(result)
+
+
+def _render_pdf_for_vision(job: Job, pdf_path: Path, dpi: int = 150) -> List[bytes]:
+    """Vision 분석용 JPEG 렌더링 - 전체 페이지를 프로세스 풀에서 병렬 처리"""
+    import fitz
+
+    doc = fitz.open(str(pdf_path))
+    page_count = len(doc)
+    doc.close()
+
+    with job.stage("render", total=page_count):
+        return job_manager.render_pages(
+            str(pdf_path), list(range(page_count)), dpi=dpi, fmt="jpeg",
+            on_page=lambda idx: job.advance("render", page=idx + 1)
+        )
+
+
+def _extract_pages_with_vision(job: Job, pdf_path: Path, extract_fn) -> tuple:
+    """전체 페이지 렌더링 후 페이지별 Vision 분석 - (페이지별 결과, 페이지 JPEG 목록) 반환"""
+    import base64
+
+    page_images = _render_pdf_for_vision(job, pdf_path)
+    page_count = len(page_images)
+    all_pages = []
+
+    with job.stage("ocr", total=page_count):
+        for page_num, img_data in enumerate(page_images):
+            image_base64 = base64.b64encode(img_data).decode('utf-8')
+
+            logger.info(f"페이지 {page_num + 1}/{page_count} 분석 중...")
+            result = extract_fn(
+                image_base64=image_base64,
+                media_type="image/jpeg",
+                page_number=page_num + 1
+            )
+
+            all_pages.append({
+                "page": page_num + 1,
+                "text": result.get("text", ""),
+                "structured": result.get("structured", {})
+            })
+            job.advance("ocr", page=page_num + 1)
+
+    return all_pages, page_images
+
+
+@app.on_event("shutdown")
+async def shutdown_job_manager():
+    """서버 종료 시 워커 풀 정리 + 대기 중인 DB 기록 저장"""
+    job_manager.shutdown(wait=False)
+    output_delivery.shutdown(wait=False)
+    if db_write_queue:
+        db_write_queue.close()
+
+
 @app.get("/")
 async def root():
     """API 상태 확인"""
@@ -292,6 +417,15 @@ async def health_check():
     }
 
 
+@app.get("/metrics")
+async def metrics_endpoint():
+    """단계별 소요 시간/Vision 호출 계측 (Prometheus 텍스트 형식)"""
+    return PlainTextResponse(
+        get_metrics().render(),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
 # ============================================
 # 라이선스 관리 API (15일 체험판)
 # ============================================
@@ -606,8 +740,6 @@ async def serve_outputs_file(file_path: str, request: Request):
 
     예: /outputs/민주-류삼영/류삼영_with_images.html
     """
-    import mimetypes
-
     try:
         # URL 디코딩 (미들웨어에서 이미 처리되었을 수 있음)
         decoded_path = unquote(file_path, encoding='utf-8')
@@ -641,21 +773,8 @@ async def serve_outputs_file(file_path: str, request: Request):
         if full_path.is_dir():
             raise HTTPException(status_code=400, detail="디렉토리는 직접 접근할 수 없습니다")
 
-        # MIME 타입 결정
-        mime_type, _ = mimetypes.guess_type(str(full_path))
-        if mime_type is None:
-            mime_type = "application/octet-stream"
-
-        # 파일 반환
-        return FileResponse(
-            path=str(full_path),
-            media_type=mime_type,
-            filename=full_path.name,
-            headers={
-                "Cache-Control": "public, max-age=3600",
-                "Content-Disposition": f"inline; filename*=UTF-8''{quote(full_path.name)}"
-            }
-        )
+        # ETag/If-None-Match, Range, Accept-Encoding(미리 압축된 br/gzip) 처리 후 반환
+        return await asyncio.to_thread(output_delivery.response, full_path, request)
 
     except HTTPException:
         raise
@@ -669,7 +788,8 @@ async def convert_pdf(
     file: UploadFile = File(...),
     content_type: str = Form(default="general"),
     title: Optional[str] = Form(default=None),
-    exclude_pages: Optional[str] = Form(default=None)
+    exclude_pages: Optional[str] = Form(default=None),
+    async_mode: bool = Form(default=False)
 ):
     """
     PDF 파일을 모바일 최적화 HTML로 변환
@@ -678,18 +798,13 @@ async def convert_pdf(
     - content_type: 콘텐츠 유형 (lecture, election, church, general)
     - title: 결과물 제목 (선택사항)
     - exclude_pages: 제외할 페이지 번호 (쉼표로 구분, 예: "2,3,5")
+    - async_mode: true이면 job_id를 즉시 반환 (진행 상황은 /api/result/{job_id}?format=json)
     """
 
     # 파일 검증
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="PDF 파일만 업로드 가능합니다")
 
-    # 파일 크기 제한 (50MB)
-    MAX_FILE_SIZE = 50 * 1024 * 1024
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=400, detail="파일 크기는 50MB를 초과할 수 없습니다")
-
     # 고유 ID 생성
     job_id = str(uuid.uuid4())[:8]
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -699,29 +814,42 @@ async def convert_pdf(
     safe_filename = f"{job_id}_{timestamp}.pdf"
     upload_path = UPLOAD_DIR / safe_filename
 
-    try:
-        with open(upload_path, "wb") as f:
-            f.write(content)
+    # 청크 단위 저장 (50MB 초과 시 저장 중단, 413)
+    stored = await save_upload(file, upload_path)
 
+    # 제외할 페이지 처리
+    exclude_pages_list = []
+    if exclude_pages:
+        try:
+            exclude_pages_list = [int(p.strip()) for p in exclude_pages.split(',') if p.strip()]
+            logger.info(f"[{job_id}] 제외할 페이지: {exclude_pages_list}")
+        except ValueError:
+            logger.warning(f"[{job_id}] 잘못된 exclude_pages 형식: {exclude_pages}")
+
+    job = _submit_job(
+        "convert", _run_convert_job, upload_path, original_filename, content_type,
+        title, exclude_pages_list, timestamp, job_id=job_id, upload=stored, content_type=content_type
+    )
+    return await _respond_with_job(job, async_mode)
+
+
+def _run_convert_job(job: Job, upload_path: Path, original_filename: str, content_type: str,
+                     title: Optional[str], exclude_pages_list: list, timestamp: str) -> dict:
+    """일반 PDF 변환 파이프라인 (워커 스레드에서 실행)"""
+    job_id = job.job_id
+
+    try:
         # PDF 변환 처리
         logger.info(f"[{job_id}] PDF 변환 시작: {original_filename} (content_type: {content_type})")
 
-        # 제외할 페이지 처리
-        exclude_pages_list = []
-        if exclude_pages:
-            try:
-                exclude_pages_list = [int(p.strip()) for p in exclude_pages.split(',') if p.strip()]
-                logger.info(f"[{job_id}] 제외할 페이지: {exclude_pages_list}")
-            except ValueError:
-                logger.warning(f"[{job_id}] 잘못된 exclude_pages 형식: {exclude_pages}")
-
         # 1. PDF에서 텍스트와 이미지 추출
         try:
-            extracted_data = pdf_converter.extract_from_pdf(
-                str(upload_path),
-                content_type=content_type,
-                exclude_pages=exclude_pages_list
-            )
+            with job.stage("extract"):
+                extracted_data = pdf_converter.extract_from_pdf(
+                    str(upload_path),
+                    content_type=content_type,
+                    exclude_pages=exclude_pages_list
+                )
         except Exception as e:
             logger.error(f"[{job_id}] PDF 추출 실패: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500, detail=f"PDF 파일 처리 중 오류가 발생했습니다: {str(e)}")
@@ -738,45 +866,46 @@ async def convert_pdf(
         output_path = OUTPUT_DIR / output_filename
 
         try:
-            html_content = html_generator.generate_html(
-                extracted_data=extracted_data,
-                title=result_title,
-                content_type=content_type,
-                job_id=job_id
-            )
+            with job.stage("html"):
+                # 페이지 본문은 생성하면서 바로 파일에 기록 (문서 전체를 문자열로 만들지 않음)
+                html_chunks = html_generator.generate_html_chunks(
+                    extracted_data=extracted_data,
+                    title=result_title,
+                    content_type=content_type,
+                    job_id=job_id
+                )
+                output_delivery.write_output(output_path, html_chunks)
         except Exception as e:
             logger.error(f"[{job_id}] HTML 생성 실패: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500, detail=f"HTML 생성 중 오류가 발생했습니다: {str(e)}")
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-
         logger.info(f"[{job_id}] 변환 완료: {output_filename}")
 
         # 3. 자동 검증 시스템 실행
         verification_result = None
         try:
             logger.info(f"[{job_id}] 자동 검증 시작")
-            verification_result = verification_system.verify_conversion(
-                original_pdf_path=str(upload_path),
-                generated_html_path=str(output_path),
-                extracted_data=extracted_data
-            )
-
-            logger.info(f"[{job_id}] 검증 완료: {verification_result['status']} "
-                       f"(오류: {verification_result['statistics']['total_errors']}, "
-                       f"경고: {verification_result['statistics']['total_warnings']})")
-
-            # 자동 수정 적용
-            if verification_result.get("corrections"):
-                logger.info(f"[{job_id}] 자동 수정 적용 중 ({len(verification_result['corrections'])}개)")
-                correction_applied = verification_system.apply_corrections(
-                    str(output_path),
-                    verification_result["corrections"]
+            with job.stage("verify"):
+                verification_result = verification_system.verify_conversion(
+                    original_pdf_path=str(upload_path),
+                    generated_html_path=str(output_path),
+                    extracted_data=extracted_data
                 )
-                if correction_applied:
-                    logger.info(f"[{job_id}] 자동 수정 완료")
-                    verification_result["auto_corrected"] = True
+
+                logger.info(f"[{job_id}] 검증 완료: {verification_result['status']} "
+                           f"(오류: {verification_result['statistics']['total_errors']}, "
+                           f"경고: {verification_result['statistics']['total_warnings']})")
+
+                # 자동 수정 적용
+                if verification_result.get("corrections"):
+                    logger.info(f"[{job_id}] 자동 수정 적용 중 ({len(verification_result['corrections'])}개)")
+                    correction_applied = verification_system.apply_corrections(
+                        str(output_path),
+                        verification_result["corrections"]
+                    )
+                    if correction_applied:
+                        logger.info(f"[{job_id}] 자동 수정 완료")
+                        verification_result["auto_corrected"] = True
 
         except Exception as e:
             logger.error(f"[{job_id}] 검증 중 오류 (계속 진행): {str(e)}", exc_info=True)
@@ -800,7 +929,8 @@ async def convert_pdf(
                 "page_count": extracted_data.get("page_count", 0),
                 "is_image_based": extracted_data.get("is_image_based", False),
                 "ocr_used": extracted_data.get("ocr_used", False),
-                "processing_time": 0,  # TODO: 실제 처리 시간 추가
+                "processing_time": round(job.elapsed_ms() / 1000, 3),
+                "stage_timings": job.stage_timings(),
                 "structured_data": extracted_data.get("structured_data", {})
             })
         except Exception as e:
@@ -837,23 +967,26 @@ async def convert_pdf(
                 "recommendations": verification_result.get("recommendations", [])
             }
 
-        return JSONResponse(response_data)
+        return response_data
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"[{job_id}] 예상치 못한 오류: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"변환 중 오류가 발생했습니다: {str(e)}")
-    finally:
-        # 업로드 파일 정리 (선택적)
-        # if upload_path.exists():
-        #     upload_path.unlink()
-        pass
 
 
 @app.get("/api/result/{job_id}")
-async def get_result(job_id: str):
-    """변환 결과 조회"""
+async def get_result(job_id: str, format: Optional[str] = None):
+    """
+    변환 결과 조회
+
+    - 진행 중인 작업: 상태(queued/running/failed)와 단계별 진행률 JSON
+    - 완료된 작업: 결과 HTML 파일 (format=json이면 상태 JSON)
+    """
+    job = job_manager.get(job_id)
+    if job is not None and (format == "json" or job.status != JOB_DONE):
+        return JSONResponse(job.to_dict())
 
     # outputs 디렉토리에서 job_id로 시작하는 파일 찾기
     for file_path in OUTPUT_DIR.glob(f"{job_id}_*.html"):
@@ -863,9 +996,63 @@ async def get_result(job_id: str):
             filename=file_path.name
         )
 
+    # 하위 폴더에 저장되는 변환(교회 주보 등)은 상태 JSON으로 결과 URL 안내
+    if job is not None:
+        return JSONResponse(job.to_dict())
+
     raise HTTPException(status_code=404, detail="결과를 찾을 수 없습니다")
 
 
+# SSE keepalive 주석 전송 간격 (초)
+SSE_KEEPALIVE_SECONDS = 15
+
+
+def _format_sse(event: dict) -> str:
+    """진행 이벤트 하나를 text/event-stream 메시지로 변환"""
+    data = json.dumps(event, ensure_ascii=False, default=str)
+    return f"id: {event['seq']}\nevent: {event['event']}\ndata: {data}\n\n"
+
+
+@app.get("/api/jobs/{job_id}/events")
+async def stream_job_events(job_id: str, request: Request):
+    """
+    작업 진행 이벤트 스트림 (Server-Sent Events)
+
+    - uploaded / queued / running / stage_start / progress(page) / stage_done / done|failed 순서로 전송
+    - 각 이벤트의 t_ms는 작업 등록 후 경과 시간, elapsed_ms는 단계 소요 시간
+    - 재연결 시 Last-Event-ID 헤더 이후 이벤트부터 이어서 전송
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+
+    try:
+        after_seq = int(request.headers.get("last-event-id", "0"))
+    except ValueError:
+        after_seq = 0
+
+    async def event_stream():
+        loop = asyncio.get_running_loop()
+        last_sent = loop.time()
+        async for event in job_manager.iter_events(job, after_seq):
+            if event is not None:
+                last_sent = loop.time()
+                yield _format_sse(event)
+                continue
+            if await request.is_disconnected():
+                logger.info(f"[{job_id}] 진행 스트림 연결 종료")
+                return
+            if loop.time() - last_sent >= SSE_KEEPALIVE_SECONDS:
+                last_sent = loop.time()
+                yield ": keepalive\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.delete("/api/result/{job_id}")
 async def delete_result(job_id: str):
     """변환 결과 삭제"""
@@ -972,10 +1159,16 @@ async def submit_feedback(
 
 
 @app.get("/api/statistics")
-async def get_statistics():
-    """전체 변환 통계 및 학습 데이터 조회"""
+async def get_statistics(content_type: Optional[str] = None, since: Optional[str] = None,
+                         until: Optional[str] = None):
+    """전체 변환 통계 및 학습 데이터 조회
+
+    Parameters:
+    - content_type: 특정 콘텐츠 타입만 집계 (선택)
+    - since, until: 기록 시각 범위 (ISO 형식, 예: 2024-12-01, until은 미포함) (선택)
+    """
     try:
-        stats = learning_system.get_statistics()
+        stats = learning_system.get_statistics(content_type=content_type, since=since, until=until)
         suggestions = learning_system.get_improvement_suggestions()
 
         return JSONResponse({
@@ -990,6 +1183,30 @@ async def get_statistics():
         raise HTTPException(status_code=500, detail=f"통계 조회 실패: {str(e)}")
 
 
+@app.get("/api/cache/vision")
+async def get_vision_cache_stats():
+    """Vision OCR 캐시 적중/미스 통계 조회"""
+    from vision_cache import get_vision_cache
+
+    return JSONResponse({
+        "success": True,
+        "cache": get_vision_cache().get_stats()
+    })
+
+
+@app.delete("/api/cache/vision")
+async def clear_vision_cache():
+    """Vision OCR 캐시 전체 삭제"""
+    from vision_cache import get_vision_cache
+
+    removed = get_vision_cache().clear()
+    logger.info(f"Vision 캐시 삭제: {removed}개")
+    return JSONResponse({
+        "success": True,
+        "removed": removed
+    })
+
+
 @app.get("/api/learning/insights")
 async def get_learning_insights():
     """학습 시스템 인사이트 조회 - 개선 제안 및 패턴 분석"""
@@ -1267,15 +1484,14 @@ async def universal_convert(
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     try:
-        # 파일 저장
-        content = await file.read()
+        # 파일 저장 (청크 단위, 크기 제한 초과 시 413)
         original_filename = file.filename
         file_extension = Path(original_filename).suffix
         safe_filename = f"{job_id}_{timestamp}{file_extension}"
         upload_path = UPLOAD_DIR / safe_filename
 
-        with open(upload_path, "wb") as f:
-            f.write(content)
+        await save_upload(file, upload_path)
+        timer = StageTimer(content_type)
 
         logger.info(f"[{job_id}] 범용 변환 시작: {original_filename} (출력: {output_format})")
 
@@ -1292,7 +1508,8 @@ async def universal_convert(
             except:
                 pass
 
-        extracted_data = universal_parser.parse_document(str(upload_path), parse_options)
+        with timer.stage("parse"):
+            extracted_data = universal_parser.parse_document(str(upload_path), parse_options)
 
         if 'error' in extracted_data:
             raise HTTPException(status_code=400, detail=extracted_data['error'])
@@ -1314,21 +1531,20 @@ async def universal_convert(
             'metadata': extracted_data.get('metadata', {})
         }
 
-        output_content = template_engine.render(output_format, template_data)
+        with timer.stage("html"):
+            output_content = template_engine.render(output_format, template_data)
 
-        if output_content:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(output_content)
-        else:
-            # 템플릿이 없으면 기본 HTML 생성기 사용
-            html_content = html_generator.generate_html(
-                extracted_data=extracted_data,
-                title=result_title,
-                content_type=content_type,
-                job_id=job_id
-            )
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
+            if output_content:
+                output_delivery.write_output(output_path, output_content)
+            else:
+                # 템플릿이 없으면 기본 HTML 생성기 사용
+                html_chunks = html_generator.generate_html_chunks(
+                    extracted_data=extracted_data,
+                    title=result_title,
+                    content_type=content_type,
+                    job_id=job_id
+                )
+                output_delivery.write_output(output_path, html_chunks)
 
         # 학습 데이터 기록
         try:
@@ -1338,7 +1554,8 @@ async def universal_convert(
                 "page_count": extracted_data.get("page_count", 0),
                 "is_image_based": extracted_data.get("is_image_based", False),
                 "ocr_used": extracted_data.get("ocr_used", False),
-                "processing_time": 0,
+                "processing_time": round(timer.elapsed_ms() / 1000, 3),
+                "stage_timings": timer.timings,
                 "structured_data": extracted_data.get("structured_data", {}),
                 "format": extracted_data.get("detected_format", "unknown"),
                 "output_format": output_format
@@ -1493,15 +1710,14 @@ async def custom_convert(
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     try:
-        # 파일 저장
-        content = await file.read()
+        # 파일 저장 (청크 단위, 크기 제한 초과 시 413)
         original_filename = file.filename
         file_extension = Path(original_filename).suffix
         safe_filename = f"{job_id}_{timestamp}{file_extension}"
         upload_path = UPLOAD_DIR / safe_filename
 
-        with open(upload_path, "wb") as f:
-            f.write(content)
+        await save_upload(file, upload_path)
+        timer = StageTimer(content_type)
 
         logger.info(f"[{job_id}] 고급 커스터마이징 변환 시작: {original_filename}")
 
@@ -1517,7 +1733,8 @@ async def custom_convert(
         }
 
         # 범용 파서로 문서 파싱
-        extracted_data = universal_parser.parse_document(str(upload_path), custom_options)
+        with timer.stage("parse"):
+            extracted_data = universal_parser.parse_document(str(upload_path), custom_options)
 
         if 'error' in extracted_data:
             raise HTTPException(status_code=400, detail=extracted_data['error'])
@@ -1564,14 +1781,14 @@ async def custom_convert(
             template_data['custom_footer'] = custom_footer
 
         # 템플릿 렌더링
-        rendered_output = template_engine.render(output_format, template_data)
+        with timer.stage("html"):
+            rendered_output = template_engine.render(output_format, template_data)
 
         if not rendered_output:
             raise HTTPException(status_code=400, detail=f"템플릿 렌더링 실패: {output_format}")
 
         # 파일 저장
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(rendered_output)
+        output_delivery.write_output(output_path, rendered_output)
 
         logger.info(f"[{job_id}] 고급 커스터마이징 변환 완료: {output_filename}")
 
@@ -1582,6 +1799,8 @@ async def custom_convert(
             "page_count": extracted_data.get("page_count", 0),
             "is_image_based": extracted_data.get("is_image_based", False),
             "ocr_used": extracted_data.get("ocr_used", False),
+            "processing_time": round(timer.elapsed_ms() / 1000, 3),
+            "stage_timings": timer.timings,
             "structured_data": extracted_data.get("structured_data", {}),
         })
 
@@ -1952,7 +2171,6 @@ async def get_editor_file(filepath: str):
         raise HTTPException(status_code=500, detail=f"파일 읽기 실패: {str(e)}")
 
 
-
 @app.get("/api/serve/{file_path:path}")
 async def serve_file(file_path: str):
     """
@@ -2097,8 +2315,6 @@ async def list_html_files():
         raise HTTPException(status_code=500, detail=f"파일 목록 조회 실패: {str(e)}")
 
 
-
-
 @app.post("/api/convert-pdf")
 async def convert_pdf_for_editor(
     file: UploadFile = File(...),
@@ -2120,12 +2336,6 @@ async def convert_pdf_for_editor(
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="PDF 파일만 업로드 가능합니다")
     
-    # 파일 크기 제한 (50MB)
-    MAX_FILE_SIZE = 50 * 1024 * 1024
-    pdf_content = await file.read()
-    if len(pdf_content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=400, detail="파일 크기는 50MB를 초과할 수 없습니다")
-    
     # 고유 ID 생성
     job_id = str(uuid.uuid4())[:8]
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -2134,10 +2344,11 @@ async def convert_pdf_for_editor(
     original_filename = file.filename
     safe_filename = f"{job_id}_{timestamp}.pdf"
     upload_path = UPLOAD_DIR / safe_filename
-    
+
+    # 청크 단위 저장 (50MB 초과 시 저장 중단, 413)
+    await save_upload(file, upload_path)
+
     try:
-        with open(upload_path, "wb") as f:
-            f.write(pdf_content)
         
         logger.info(f"[{job_id}] 에디터 PDF 변환 시작: {original_filename}")
         
@@ -2178,20 +2389,18 @@ async def convert_pdf_for_editor(
         output_path = OUTPUT_DIR / output_filename
         
         try:
-            html_content = html_generator.generate_html(
+            html_chunks = html_generator.generate_html_chunks(
                 extracted_data=extracted_data,
                 title=result_title,
                 content_type="general",
                 job_id=job_id
             )
+            # HTML 파일 저장 (페이지 본문은 생성하면서 바로 기록)
+            output_delivery.write_output(output_path, html_chunks)
         except Exception as e:
             logger.error(f"[{job_id}] HTML 생성 실패: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500, detail=f"HTML 생성 중 오류가 발생했습니다: {str(e)}")
         
-        # HTML 파일 저장
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-        
         logger.info(f"[{job_id}] HTML 변환 완료: {output_filename}")
         
         # 임시 파일 정리
@@ -2243,10 +2452,6 @@ async def upload_image(file: UploadFile = File(...)):
 
         # 파일 크기 제한 (10MB)
         MAX_IMAGE_SIZE = 10 * 1024 * 1024
-        content = await file.read()
-
-        if len(content) > MAX_IMAGE_SIZE:
-            raise HTTPException(status_code=400, detail="이미지 크기는 10MB를 초과할 수 없습니다")
 
         # 고유 파일명 생성 (원본 이름 유지 + 타임스탬프)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -2262,13 +2467,12 @@ async def upload_image(file: UploadFile = File(...)):
         images_dir = STATIC_DIR / "images"
         images_dir.mkdir(exist_ok=True)
 
-        # 파일 저장
+        # 파일 저장 (청크 단위, 10MB 초과 시 저장 중단)
         file_path = images_dir / new_filename
 
-        with open(file_path, "wb") as f:
-            f.write(content)
+        stored = await save_upload(file, file_path, max_size=MAX_IMAGE_SIZE)
 
-        logger.info(f"이미지 업로드 완료: {new_filename} ({len(content)} bytes)")
+        logger.info(f"이미지 업로드 완료: {new_filename} ({stored.size} bytes)")
 
         return JSONResponse({
             "success": True,
@@ -2276,7 +2480,7 @@ async def upload_image(file: UploadFile = File(...)):
             "url": f"/static/images/{new_filename}",
             "filename": new_filename,
             "original_filename": original_filename,
-            "size": len(content)
+            "size": stored.size
         })
 
     except HTTPException:
@@ -2361,27 +2565,15 @@ async def download_folder_as_zip(folder_path: str):
         if not target_path.is_dir():
             raise HTTPException(status_code=400, detail="폴더가 아닙니다")
 
-        # ZIP 파일 생성 (메모리에)
-        zip_buffer = io.BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            # 폴더 내 모든 파일 추가
-            for file_path in target_path.rglob('*'):
-                if file_path.is_file():
-                    # ZIP 내 상대 경로 계산
-                    arcname = file_path.relative_to(target_path.parent)
-                    zip_file.write(file_path, arcname)
-
-        zip_buffer.seek(0)
-
         # 파일명 설정 (마지막 폴더명 사용)
         zip_filename = f"{target_path.name}.zip"
 
         # 한글 파일명 인코딩
         encoded_filename = quote(zip_filename)
 
+        # ZIP을 메모리에 만들지 않고 파일을 읽는 대로 압축해 전송 (압축은 스레드 풀에서 실행)
         return StreamingResponse(
-            zip_buffer,
+            iter_folder_zip(target_path),
             media_type="application/zip",
             headers={
                 "Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}"
@@ -3517,7 +3709,8 @@ async def auto_convert_election(
     file: UploadFile = File(...),
     title: Optional[str] = Form(default=None),
     save_folder: Optional[str] = Form(default=None),
-    create_images_folder: Optional[str] = Form(default=None)
+    create_images_folder: Optional[str] = Form(default=None),
+    async_mode: bool = Form(default=False)
 ):
     """
     완전 자동화 선거공보물 변환 API
@@ -3533,6 +3726,7 @@ async def auto_convert_election(
     - title: 출력 파일 제목 (선택사항)
     - save_folder: 저장할 하위 폴더명 (선택사항, 예: 민주-이광재)
     - create_images_folder: images 하위 폴더 생성 여부 (선택사항, "true"인 경우 생성)
+    - async_mode: true이면 job_id를 즉시 반환
 
     Returns:
     - success: 성공 여부
@@ -3548,11 +3742,9 @@ async def auto_convert_election(
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="PDF 파일만 업로드 가능합니다")
 
-    # 파일 크기 제한 (50MB)
-    MAX_FILE_SIZE = 50 * 1024 * 1024
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=400, detail="파일 크기는 50MB를 초과할 수 없습니다")
+    # 보안: 상위 디렉토리 접근 방지
+    if save_folder and ".." in save_folder:
+        raise HTTPException(status_code=400, detail="잘못된 폴더명입니다")
 
     # 고유 ID 생성
     job_id = str(uuid.uuid4())[:8]
@@ -3563,14 +3755,27 @@ async def auto_convert_election(
     safe_filename = f"{job_id}_{timestamp}.pdf"
     upload_path = UPLOAD_DIR / safe_filename
 
-    try:
-        with open(upload_path, "wb") as f:
-            f.write(content)
+    # 청크 단위 저장 (50MB 초과 시 저장 중단, 413)
+    stored = await save_upload(file, upload_path)
 
+    job = _submit_job(
+        "auto-convert", _run_auto_convert_job, upload_path, original_filename, title,
+        save_folder, create_images_folder, timestamp, job_id=job_id, upload=stored, content_type="election"
+    )
+    return await _respond_with_job(job, async_mode)
+
+
+def _run_auto_convert_job(job: Job, upload_path: Path, original_filename: str, title: Optional[str],
+                          save_folder: Optional[str], create_images_folder: Optional[str], timestamp: str) -> dict:
+    """완전 자동화 선거공보물 변환 파이프라인 (워커 스레드에서 실행)"""
+    job_id = job.job_id
+
+    try:
         logger.info(f"[{job_id}] 완전 자동화 변환 시작: {original_filename}")
 
         # 자동 변환 실행 (원본 파일명 전달)
-        brochure = auto_converter.convert(str(upload_path), original_filename=original_filename)
+        with job.stage("extract"):
+            brochure = auto_converter.convert(str(upload_path), original_filename=original_filename)
 
         # 출력 파일명 생성
         if title:
@@ -3583,9 +3788,6 @@ async def auto_convert_election(
 
         # 저장 경로 설정 (하위 폴더 지원)
         if save_folder:
-            # 보안: 상위 디렉토리 접근 방지
-            if ".." in save_folder:
-                raise HTTPException(status_code=400, detail="잘못된 폴더명입니다")
             # 하위 폴더 생성
             output_dir = OUTPUT_DIR / save_folder
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -3603,10 +3805,10 @@ async def auto_convert_election(
             output_url_path = f"/outputs/{output_filename}"
 
         # HTML 생성 (이미지 폴더 경로 전달)
-        html_content = auto_converter.generate_html(brochure, output_folder=str(output_dir))
+        with job.stage("html"):
+            html_chunks = auto_converter.generate_html_chunks(brochure, output_folder=str(output_dir))
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+            output_delivery.write_output(output_path, html_chunks)
 
         logger.info(f"[{job_id}] 완전 자동화 변환 완료: {output_filename}")
 
@@ -3623,6 +3825,8 @@ async def auto_convert_election(
                 "is_image_based": any(p.get("ocr_used") for p in brochure.raw_pages),
                 "ocr_used": any(p.get("ocr_used") for p in brochure.raw_pages),
                 "auto_converted": True,
+                "processing_time": round(job.elapsed_ms() / 1000, 3),
+                "stage_timings": job.stage_timings(),
                 "party_detected": brochure.candidate.party,
                 "candidate_name": brochure.candidate.name
             })
@@ -3647,7 +3851,7 @@ async def auto_convert_election(
         except Exception as e:
             logger.error(f"학습 데이터 기록 실패: {str(e)}")
 
-        return JSONResponse({
+        return {
             "success": True,
             "job_id": job_id,
             "message": "완전 자동화 변환이 완료되었습니다",
@@ -3674,7 +3878,7 @@ async def auto_convert_election(
                 },
                 "created_at": datetime.now().isoformat()
             }
-        })
+        }
 
     except HTTPException:
         raise
@@ -4242,94 +4446,88 @@ async def convert_church_bulletin(
         safe_pdf_filename = f"{job_id}_{timestamp}.pdf"
         upload_path = UPLOAD_DIR / safe_pdf_filename
 
-        content = await file.read()
-        with open(upload_path, "wb") as f:
-            f.write(content)
+        stored = await save_upload(file, upload_path)
+        timer = StageTimer("church")
 
-        # PDF 페이지 수 확인
+        # PDF 페이지 수 확인 + 페이지별 텍스트 추출 (문서는 한 번만 연다)
         page_count = 0
+        extracted_text = ""
+        page_texts = []
         try:
-            import fitz
-            doc = fitz.open(str(upload_path))
-            page_count = len(doc)
-            doc.close()
-        except:
-            pass
-
-        # 교회 HTML 생성기 사용
-        try:
-            from church_html_generator import ChurchBulletinGenerator, ChurchConfigManager
-
-            # 교회 프리셋 가져오기 (여의도순복음교회, 명성교회 등 사전 정의된 설정)
-            church_info = ChurchConfigManager.get_preset(church_name)
-            # 기본값 보완
-            if not church_info.get("name"):
-                church_info["name"] = church_name
-
-            generator = ChurchConfigManager.create_generator(church_name=church_name, church_info=church_info)
-
-            # PDF에서 텍스트 추출
-            extracted_text = ""
-            page_texts = []
-            try:
-                import fitz
-                doc = fitz.open(str(upload_path))
-                for page in doc:
+            from page_cache import get_page_cache
+            with timer.stage("extract"), get_page_cache().open(upload_path) as raster:
+                page_count = len(raster)
+                for page in raster.doc:
                     page_text = page.get_text()
                     page_texts.append(page_text)
                     extracted_text += page_text + "\n"
-                doc.close()
-            except Exception as text_err:
-                logger.warning(f"PDF 텍스트 추출 실패: {text_err}")
-
-            # 주보 텍스트 파싱하여 구조화된 데이터 추출
-            parsed_data = parse_bulletin_text(extracted_text, church_name)
-
-            # 추출된 데이터 구성
-            extracted_data = {
-                "date": bulletin_date,
-                "volume": parsed_data.get("volume", ""),
-                "issue": parsed_data.get("issue", ""),
-                "theme": theme,
-                "raw_text": extracted_text,
-                "pages": [{"text": t} for t in page_texts],
-                "structured_data": {
-                    "today_verse": parsed_data.get("today_verse", {}),
-                    "worship_services": parsed_data.get("worship_services", []),
-                    "sermon": parsed_data.get("sermon", {}),
-                    "choir": parsed_data.get("choir", []),
-                    "news": parsed_data.get("news", [])
-                },
-                "services": parsed_data.get("worship_services", []),
-                "news": parsed_data.get("news", []),
-                "sermon": parsed_data.get("sermon", {})
-            }
+        except Exception as text_err:
+            logger.warning(f"PDF 텍스트 추출 실패: {text_err}")
+
+        # 교회 HTML 생성기 사용
+        with timer.stage("html"):
+            try:
+                from church_html_generator import ChurchBulletinGenerator, ChurchConfigManager
+
+                # 교회 프리셋 가져오기 (여의도순복음교회, 명성교회 등 사전 정의된 설정)
+                church_info = ChurchConfigManager.get_preset(church_name)
+                # 기본값 보완
+                if not church_info.get("name"):
+                    church_info["name"] = church_name
+
+                generator = ChurchConfigManager.create_generator(church_name=church_name, church_info=church_info)
+
+                # 주보 텍스트 파싱하여 구조화된 데이터 추출
+                parsed_data = parse_bulletin_text(extracted_text, church_name)
+
+                # 추출된 데이터 구성
+                extracted_data = {
+                    "date": bulletin_date,
+                    "volume": parsed_data.get("volume", ""),
+                    "issue": parsed_data.get("issue", ""),
+                    "theme": theme,
+                    "raw_text": extracted_text,
+                    "pages": [{"text": t} for t in page_texts],
+                    "structured_data": {
+                        "today_verse": parsed_data.get("today_verse", {}),
+                        "worship_services": parsed_data.get("worship_services", []),
+                        "sermon": parsed_data.get("sermon", {}),
+                        "choir": parsed_data.get("choir", []),
+                        "news": parsed_data.get("news", [])
+                    },
+                    "services": parsed_data.get("worship_services", []),
+                    "news": parsed_data.get("news", []),
+                    "sermon": parsed_data.get("sermon", {})
+                }
 
-            # HTML 생성
-            html_content = generator.generate(extracted_data, title=f"{church_name} 주보", theme=theme)
+                # HTML 생성 (섹션 생성은 여기서 끝나고 저장 시 골격과 섹션을 이어서 기록)
+                html_content = generator.generate_chunks(extracted_data, title=f"{church_name} 주보", theme=theme)
 
-        except Exception as gen_err:
-            logger.warning(f"ChurchBulletinGenerator 사용 실패: {gen_err}, 기본 템플릿 사용")
-            # 기본 템플릿 사용
-            html_content = generate_basic_church_html(church_name, bulletin_date, theme)
+                # 섹션 모델 보관 (수정 시 바뀐 섹션만 다시 생성 - PATCH /api/church-model)
+                bulletin_models.save(church_name, bulletin_date, generator.last_model)
 
-        # HTML 파일 저장
-        output_filename = f"{bulletin_date}.html"
-        output_path = church_folder / output_filename
+            except Exception as gen_err:
+                logger.warning(f"ChurchBulletinGenerator 사용 실패: {gen_err}, 기본 템플릿 사용")
+                # 기본 템플릿 사용
+                html_content = generate_basic_church_html(church_name, bulletin_date, theme)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+            # HTML 파일 저장
+            output_filename = f"{bulletin_date}.html"
+            output_path = church_folder / output_filename
+
+            output_delivery.write_output(output_path, html_content)
 
         # 자동 검증 시스템 실행
         verification_result = None
         try:
             logger.info(f"교회 주보 자동 검증 시작: {church_name}")
-            verification_result = church_bulletin_verifier.verify_church_bulletin(
-                original_pdf_path=str(upload_path),
-                generated_html_path=str(output_path),
-                extracted_data=extracted_data,
-                church_name=church_name
-            )
+            with timer.stage("verify"):
+                verification_result = church_bulletin_verifier.verify_church_bulletin(
+                    original_pdf_path=str(upload_path),
+                    generated_html_path=str(output_path),
+                    extracted_data=extracted_data,
+                    church_name=church_name
+                )
             logger.info(f"검증 완료: {verification_result['status']} "
                        f"(오류: {verification_result['statistics']['total_errors']}, "
                        f"경고: {verification_result['statistics']['total_warnings']}, "
@@ -4338,25 +4536,24 @@ async def convert_church_bulletin(
             logger.warning(f"검증 실패 (변환은 완료): {verify_err}")
             verification_result = {"status": "error", "message": str(verify_err)}
 
-        # 데이터베이스에 변환 기록 저장
-        db_doc_id = None
-        if doc_repo and bulletin_repo:
-            try:
-                import time
-                start_time = time.time()
+        # 데이터베이스에 변환 기록 저장 (응답을 막지 않도록 write-behind 큐에서 일괄 처리)
+        if doc_repo and bulletin_repo and db_write_queue:
+            processing_time = timer.elapsed_ms()
+            stage_timings = dict(timer.timings)
 
+            def save_conversion_record():
                 # 문서 레코드 생성
                 db_doc_id = doc_repo.create_document(
                     service_code='church',
                     filename=file.filename,
                     file_path=str(upload_path),
-                    file_size=len(content),
+                    file_size=stored.size,
                     page_count=page_count,
-                    metadata={'church_name': church_name, 'bulletin_date': bulletin_date}
+                    metadata={'church_name': church_name, 'bulletin_date': bulletin_date,
+                              'stage_timings': stage_timings}
                 )
 
                 # 상태 업데이트 (완료)
-                processing_time = int((time.time() - start_time) * 1000)
                 doc_repo.update_document_status(
                     db_doc_id, 'completed',
                     output_path=str(output_path),
@@ -4385,8 +4582,8 @@ async def convert_church_bulletin(
                     )
 
                 logger.info(f"주보 변환 DB 저장 완료: doc_id={db_doc_id}")
-            except Exception as db_err:
-                logger.warning(f"DB 저장 실패 (기능은 정상 동작): {db_err}")
+
+            db_write_queue.submit(save_conversion_record)
 
         return JSONResponse({
             "success": True,
@@ -4396,7 +4593,7 @@ async def convert_church_bulletin(
             "bulletin_date": bulletin_date,
             "theme": theme,
             "page_count": page_count,
-            "doc_id": db_doc_id,
+            "stage_timings": timer.timings,
             "message": f"{church_name} 주보가 성공적으로 변환되었습니다.",
             "verification": {
                 "status": verification_result.get("status", "unknown") if verification_result else "skipped",
@@ -4408,6 +4605,8 @@ async def convert_church_bulletin(
             }
         })
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"교회 주보 변환 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"주보 변환 실패: {str(e)}")
@@ -4422,7 +4621,9 @@ async def convert_church_bulletin_ai(
     bulletin_date: str = Form(...),
     theme: str = Form("default"),
     license_key: Optional[str] = Form(None),
-    use_bulletin_ai: bool = Form(True)  # BulletinAI v4.0 사용 여부
+    use_bulletin_ai: bool = Form(True),  # BulletinAI v4.0 사용 여부
+    async_mode: bool = Form(default=False),
+    force_refresh: bool = Form(default=False)
 ):
     """
     Claude Vision AI를 사용한 교회 주보 PDF 변환
@@ -4435,41 +4636,54 @@ async def convert_church_bulletin_ai(
     Args:
         license_key: 라이선스 키 (체험판 사용 시 필수)
         use_bulletin_ai: BulletinAI v4.0 사용 여부 (기본값: True)
+        async_mode: true이면 job_id를 즉시 반환
+        force_refresh: true이면 Vision 캐시를 무시하고 다시 추출
     """
-    import fitz
-    from learning_data.church_bulletin import get_bulletin_ai, reset_bulletin_ai
-
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="PDF 파일만 지원됩니다")
 
-    try:
-        # 교회 폴더 생성
-        church_folder = OUTPUT_DIR / "Church" / church_name
-        church_folder.mkdir(parents=True, exist_ok=True)
+    # 교회 폴더 생성
+    church_folder = OUTPUT_DIR / "Church" / church_name
+    church_folder.mkdir(parents=True, exist_ok=True)
 
-        # PDF 저장
-        job_id = str(uuid.uuid4())[:8]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        upload_path = UPLOAD_DIR / f"{job_id}_{timestamp}.pdf"
+    # PDF 저장
+    job_id = str(uuid.uuid4())[:8]
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    upload_path = UPLOAD_DIR / f"{job_id}_{timestamp}.pdf"
 
-        content = await file.read()
-        with open(upload_path, "wb") as f:
-            f.write(content)
+    stored = await save_upload(file, upload_path)
 
+    job = _submit_job(
+        "church-ai", _run_church_ai_job, stored, church_folder,
+        church_name, bulletin_date, theme, use_bulletin_ai, force_refresh, job_id=job_id, upload=stored
+    )
+    return await _respond_with_job(job, async_mode)
+
+
+def _run_church_ai_job(job: Job, stored: StoredUpload, church_folder: Path,
+                       church_name: str, bulletin_date: str, theme: str, use_bulletin_ai: bool,
+                       force_refresh: bool = False) -> dict:
+    """AI 교회 주보 변환 파이프라인 (워커 스레드에서 실행)"""
+    from learning_data.church_bulletin import create_bulletin_session
+
+    job_id = job.job_id
+    bulletin_ai = None
+
+    try:
         # BulletinAI v4.0 사용
         if use_bulletin_ai:
             logger.info(f"[BulletinAI v4.0] AI 변환 시작: {church_name}")
 
-            # 새 인스턴스로 시작 (이전 캐시 제거)
-            reset_bulletin_ai()
-            bulletin_ai = get_bulletin_ai()
+            # 이 변환 전용 세션 (동시 변환 간 페이지/추출 데이터 공유 없음)
+            bulletin_ai = create_bulletin_session(force_refresh=force_refresh)
 
             if not bulletin_ai.client:
                 raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY가 설정되지 않았습니다")
 
             # PDF 로드
-            if not bulletin_ai.load_pdf(content):
-                raise HTTPException(status_code=500, detail="PDF 로드 실패")
+            with job.stage("render"):
+                if not bulletin_ai.load_pdf(stored.path, doc_hash=stored.sha256):
+                    raise HTTPException(status_code=500, detail="PDF 로드 실패")
 
             # 페이지 수 설정 (BulletinAI에서 로드된 이미지 수)
             page_count = len(bulletin_ai.page_images)
@@ -4477,7 +4691,10 @@ async def convert_church_bulletin_ai(
 
             # 모든 섹션 추출
             logger.info("[BulletinAI v4.0] 섹션별 데이터 추출 시작...")
-            extracted_sections = bulletin_ai.extract_all()
+            with job.stage("ocr", total=len(bulletin_ai.SECTION_EXTRACTORS)):
+                extracted_sections = bulletin_ai.extract_all(
+                    on_section=lambda key: job.advance("ocr", section=key)
+                )
 
             # merged_data 구성
             merged_data = {
@@ -4498,52 +4715,29 @@ async def convert_church_bulletin_ai(
             # 기존 방식 (vision_ocr.py 사용)
             from vision_ocr import VisionOCR
 
-            vision_ocr = VisionOCR()
+            vision_ocr = VisionOCR(force_refresh=force_refresh)
             if not vision_ocr.client:
                 raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY가 설정되지 않았습니다")
 
-            doc = fitz.open(str(upload_path))
-            page_count = len(doc)
-
-            all_extracted_data = []
-            combined_text = ""
-
-            logger.info(f"AI 변환 시작 (레거시 모드): {church_name}, {page_count}페이지")
-
-            for page_num in range(page_count):
-                page = doc[page_num]
-                mat = fitz.Matrix(150/72, 150/72)
-                pix = page.get_pixmap(matrix=mat)
-                img_data = pix.tobytes("jpeg")
-
-                import base64
-                image_base64 = base64.b64encode(img_data).decode('utf-8')
-
-                logger.info(f"페이지 {page_num + 1}/{page_count} 분석 중...")
-                result = vision_ocr.extract_church_bulletin_info(
-                    image_base64=image_base64,
-                    media_type="image/jpeg",
-                    page_number=page_num + 1
-                )
-
-                all_extracted_data.append({
-                    "page": page_num + 1,
-                    "text": result.get("text", ""),
-                    "structured": result.get("structured", {})
-                })
-                combined_text += result.get("text", "") + "\n\n"
+            logger.info(f"AI 변환 시작 (레거시 모드): {church_name}")
 
-            doc.close()
+            all_extracted_data, page_images = _extract_pages_with_vision(
+                job, stored.path, vision_ocr.extract_church_bulletin_info
+            )
+            page_count = len(page_images)
+            combined_text = "".join(p["text"] + "\n\n" for p in all_extracted_data)
 
             # 추출된 데이터 통합
-            merged_data = _merge_church_bulletin_data(all_extracted_data)
+            with job.stage("merge"):
+                merged_data = _merge_church_bulletin_data(all_extracted_data)
 
         # 다국어 번역 수행 (선택적 - API 호출 비용 고려)
         try:
             logger.info("다국어 번역 시작...")
             from vision_ocr import VisionOCR
             vision_ocr_for_translation = VisionOCR()
-            translations = vision_ocr_for_translation.translate_church_bulletin_content(merged_data)
+            with job.stage("translate"):
+                translations = vision_ocr_for_translation.translate_church_bulletin_content(merged_data)
             merged_data['translations'] = translations
             logger.info(f"번역 완료: {len(translations)} 언어")
         except Exception as trans_error:
@@ -4590,14 +4784,17 @@ async def convert_church_bulletin_ai(
         }
 
         # HTML 생성
-        html_content = generator.generate(extracted_data, title=f"{church_name} 주보", theme=theme)
+        with job.stage("html"):
+            html_chunks = generator.generate_chunks(
+                extracted_data, title=f"{church_name} 주보", theme=theme, bulletin_session=bulletin_ai
+            )
+            bulletin_models.save(church_name, bulletin_date, generator.last_model)
 
-        # HTML 파일 저장
-        output_filename = f"{bulletin_date}.html"
-        output_path = church_folder / output_filename
+            # HTML 파일 저장
+            output_filename = f"{bulletin_date}.html"
+            output_path = church_folder / output_filename
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+            output_delivery.write_output(output_path, html_chunks)
 
         logger.info(f"AI 변환 완료: {output_path}")
 
@@ -4612,8 +4809,9 @@ async def convert_church_bulletin_ai(
             "message": "개발 모드 - 무제한"
         }
 
-        return JSONResponse({
+        return {
             "success": True,
+            "job_id": job_id,
             "url": encoded_url,
             "filename": output_filename,
             "church_name": church_name,
@@ -4623,13 +4821,16 @@ async def convert_church_bulletin_ai(
             "ai_powered": True,
             "message": f"{church_name} 주보가 AI로 성공적으로 변환되었습니다.",
             "license": license_info
-        })
+        }
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"AI 교회 주보 변환 실패: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"AI 주보 변환 실패: {str(e)}")
+    finally:
+        if bulletin_ai is not None:
+            bulletin_ai.close()
 
 
 def _merge_church_bulletin_data(pages_data: list) -> dict:
@@ -4774,65 +4975,51 @@ async def convert_lecture_ai(
     file: UploadFile = File(...),
     title: str = Form(""),
     instructor: str = Form(""),
-    output_format: str = Form("html")
+    output_format: str = Form("html"),
+    async_mode: bool = Form(default=False),
+    force_refresh: bool = Form(default=False)
 ):
     """
     Claude Vision AI를 사용한 강의 자료 PDF 변환
     """
-    import fitz
     from vision_ocr import VisionOCR
 
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="PDF 파일만 지원됩니다")
 
-    try:
-        vision_ocr = VisionOCR()
-        if not vision_ocr.client:
-            raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY가 설정되지 않았습니다")
-
-        # PDF 저장
-        job_id = str(uuid.uuid4())[:8]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        upload_path = UPLOAD_DIR / f"{job_id}_{timestamp}.pdf"
-
-        content = await file.read()
-        with open(upload_path, "wb") as f:
-            f.write(content)
-
-        # PDF 분석
-        doc = fitz.open(str(upload_path))
-        page_count = len(doc)
+    vision_ocr = VisionOCR(force_refresh=force_refresh)
+    if not vision_ocr.client:
+        raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY가 설정되지 않았습니다")
 
-        all_pages = []
+    # PDF 저장
+    job_id = str(uuid.uuid4())[:8]
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    upload_path = UPLOAD_DIR / f"{job_id}_{timestamp}.pdf"
 
-        logger.info(f"강의 AI 변환 시작: {page_count}페이지")
+    stored = await save_upload(file, upload_path)
 
-        for page_num in range(page_count):
-            page = doc[page_num]
-            mat = fitz.Matrix(150/72, 150/72)
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("jpeg")
+    job = _submit_job(
+        "lecture-ai", _run_lecture_ai_job, vision_ocr, upload_path, title, instructor, timestamp,
+        job_id=job_id, upload=stored
+    )
+    return await _respond_with_job(job, async_mode)
 
-            import base64
-            image_base64 = base64.b64encode(img_data).decode('utf-8')
 
-            logger.info(f"페이지 {page_num + 1}/{page_count} 분석 중...")
-            result = vision_ocr.extract_lecture_info(
-                image_base64=image_base64,
-                media_type="image/jpeg",
-                page_number=page_num + 1
-            )
+def _run_lecture_ai_job(job: Job, vision_ocr, upload_path: Path, title: str, instructor: str,
+                        timestamp: str) -> dict:
+    """강의 자료 AI 변환 파이프라인 (워커 스레드에서 실행)"""
+    job_id = job.job_id
 
-            all_pages.append({
-                "page": page_num + 1,
-                "text": result.get("text", ""),
-                "structured": result.get("structured", {})
-            })
+    try:
+        logger.info(f"강의 AI 변환 시작: {upload_path.name}")
 
-        doc.close()
+        # PDF 분석
+        all_pages, page_images = _extract_pages_with_vision(job, upload_path, vision_ocr.extract_lecture_info)
+        page_count = len(page_images)
 
         # 강의 데이터 통합
-        merged_data = _merge_lecture_data(all_pages)
+        with job.stage("merge"):
+            merged_data = _merge_lecture_data(all_pages)
 
         # 제목/강사 오버라이드
         if title:
@@ -4840,39 +5027,39 @@ async def convert_lecture_ai(
         if instructor:
             merged_data["instructor"]["name"] = instructor
 
-        # HTML 생성
+        # HTML 생성 + 파일 저장
         from lecture_generator import LectureGenerator
 
         generator = LectureGenerator()
-        html_content = generator.generate({
-            "title": merged_data.get("title", "강의 자료"),
-            "subtitle": merged_data.get("subtitle", ""),
-            "instructor": merged_data.get("instructor", {}),
-            "learning_objectives": merged_data.get("learning_objectives", []),
-            "sections": merged_data.get("sections", []),
-            "key_terms": merged_data.get("key_terms", []),
-            "questions": merged_data.get("questions", []),
-            "ai_extracted": True
-        })
-
-        # 파일 저장
         output_filename = f"{job_id}_{timestamp}.html"
         output_path = OUTPUT_DIR / output_filename
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        with job.stage("html"):
+            # 챕터/이미지는 하나씩 생성하면서 바로 기록 (base64 이미지를 여러 번 복사하지 않음)
+            html_chunks = generator.generate_chunks({
+                "title": merged_data.get("title", "강의 자료"),
+                "subtitle": merged_data.get("subtitle", ""),
+                "instructor": merged_data.get("instructor", {}),
+                "learning_objectives": merged_data.get("learning_objectives", []),
+                "sections": merged_data.get("sections", []),
+                "key_terms": merged_data.get("key_terms", []),
+                "questions": merged_data.get("questions", []),
+                "ai_extracted": True
+            })
+            output_delivery.write_output(output_path, html_chunks)
 
         logger.info(f"강의 AI 변환 완료: {output_path}")
 
-        return JSONResponse({
+        return {
             "success": True,
+            "job_id": job_id,
             "url": f"/outputs/{output_filename}",
             "filename": output_filename,
             "page_count": page_count,
             "ai_powered": True,
             "extracted_data": merged_data,
             "message": "강의 자료가 AI로 성공적으로 변환되었습니다."
-        })
+        }
 
     except HTTPException:
         raise
@@ -4938,63 +5125,48 @@ def _merge_lecture_data(pages_data: list) -> dict:
 async def convert_newsletter_ai(
     file: UploadFile = File(...),
     publisher: str = Form(""),
-    issue: str = Form("")
+    issue: str = Form(""),
+    async_mode: bool = Form(default=False),
+    force_refresh: bool = Form(default=False)
 ):
     """
     Claude Vision AI를 사용한 뉴스레터 PDF 변환
     """
-    import fitz
     from vision_ocr import VisionOCR
 
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="PDF 파일만 지원됩니다")
 
-    try:
-        vision_ocr = VisionOCR()
-        if not vision_ocr.client:
-            raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY가 설정되지 않았습니다")
-
-        job_id = str(uuid.uuid4())[:8]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        upload_path = UPLOAD_DIR / f"{job_id}_{timestamp}.pdf"
+    vision_ocr = VisionOCR(force_refresh=force_refresh)
+    if not vision_ocr.client:
+        raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY가 설정되지 않았습니다")
 
-        content = await file.read()
-        with open(upload_path, "wb") as f:
-            f.write(content)
-
-        doc = fitz.open(str(upload_path))
-        page_count = len(doc)
+    job_id = str(uuid.uuid4())[:8]
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    upload_path = UPLOAD_DIR / f"{job_id}_{timestamp}.pdf"
 
-        all_pages = []
+    stored = await save_upload(file, upload_path)
 
-        logger.info(f"뉴스레터 AI 변환 시작: {page_count}페이지")
+    job = _submit_job(
+        "newsletter-ai", _run_newsletter_ai_job, vision_ocr, upload_path, publisher, issue, timestamp,
+        job_id=job_id, upload=stored
+    )
+    return await _respond_with_job(job, async_mode)
 
-        for page_num in range(page_count):
-            page = doc[page_num]
-            mat = fitz.Matrix(150/72, 150/72)
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("jpeg")
 
-            import base64
-            image_base64 = base64.b64encode(img_data).decode('utf-8')
+def _run_newsletter_ai_job(job: Job, vision_ocr, upload_path: Path, publisher: str, issue: str, timestamp: str) -> dict:
+    """뉴스레터 AI 변환 파이프라인 (워커 스레드에서 실행)"""
+    job_id = job.job_id
 
-            logger.info(f"페이지 {page_num + 1}/{page_count} 분석 중...")
-            result = vision_ocr.extract_newsletter_info(
-                image_base64=image_base64,
-                media_type="image/jpeg",
-                page_number=page_num + 1
-            )
-
-            all_pages.append({
-                "page": page_num + 1,
-                "text": result.get("text", ""),
-                "structured": result.get("structured", {})
-            })
+    try:
+        logger.info(f"뉴스레터 AI 변환 시작: {upload_path.name}")
 
-        doc.close()
+        all_pages, page_images = _extract_pages_with_vision(job, upload_path, vision_ocr.extract_newsletter_info)
+        page_count = len(page_images)
 
         # 뉴스레터 데이터 통합
-        merged_data = _merge_newsletter_data(all_pages)
+        with job.stage("merge"):
+            merged_data = _merge_newsletter_data(all_pages)
 
         # 오버라이드
         if publisher:
@@ -5003,25 +5175,26 @@ async def convert_newsletter_ai(
             merged_data["issue"] = issue
 
         # HTML 생성
-        html_content = _generate_newsletter_html(merged_data)
+        with job.stage("html"):
+            html_content = _generate_newsletter_html(merged_data)
 
         output_filename = f"{job_id}_{timestamp}_newsletter.html"
         output_path = OUTPUT_DIR / output_filename
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        output_delivery.write_output(output_path, html_content)
 
         logger.info(f"뉴스레터 AI 변환 완료: {output_path}")
 
-        return JSONResponse({
+        return {
             "success": True,
+            "job_id": job_id,
             "url": f"/outputs/{output_filename}",
             "filename": output_filename,
             "page_count": page_count,
             "ai_powered": True,
             "extracted_data": merged_data,
             "message": "뉴스레터가 AI로 성공적으로 변환되었습니다."
-        })
+        }
 
     except HTTPException:
         raise
@@ -5172,63 +5345,48 @@ def _generate_newsletter_html(data: dict) -> str:
 async def convert_catalog_ai(
     file: UploadFile = File(...),
     company: str = Form(""),
-    category: str = Form("")
+    category: str = Form(""),
+    async_mode: bool = Form(default=False),
+    force_refresh: bool = Form(default=False)
 ):
     """
     Claude Vision AI를 사용한 카탈로그/브로셔 PDF 변환
     """
-    import fitz
     from vision_ocr import VisionOCR
 
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="PDF 파일만 지원됩니다")
 
-    try:
-        vision_ocr = VisionOCR()
-        if not vision_ocr.client:
-            raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY가 설정되지 않았습니다")
-
-        job_id = str(uuid.uuid4())[:8]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        upload_path = UPLOAD_DIR / f"{job_id}_{timestamp}.pdf"
+    vision_ocr = VisionOCR(force_refresh=force_refresh)
+    if not vision_ocr.client:
+        raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY가 설정되지 않았습니다")
 
-        content = await file.read()
-        with open(upload_path, "wb") as f:
-            f.write(content)
+    job_id = str(uuid.uuid4())[:8]
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    upload_path = UPLOAD_DIR / f"{job_id}_{timestamp}.pdf"
 
-        doc = fitz.open(str(upload_path))
-        page_count = len(doc)
+    stored = await save_upload(file, upload_path)
 
-        all_pages = []
+    job = _submit_job(
+        "catalog-ai", _run_catalog_ai_job, vision_ocr, upload_path, company, category, timestamp,
+        job_id=job_id, upload=stored
+    )
+    return await _respond_with_job(job, async_mode)
 
-        logger.info(f"카탈로그 AI 변환 시작: {page_count}페이지")
 
-        for page_num in range(page_count):
-            page = doc[page_num]
-            mat = fitz.Matrix(150/72, 150/72)
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("jpeg")
+def _run_catalog_ai_job(job: Job, vision_ocr, upload_path: Path, company: str, category: str, timestamp: str) -> dict:
+    """카탈로그 AI 변환 파이프라인 (워커 스레드에서 실행)"""
+    job_id = job.job_id
 
-            import base64
-            image_base64 = base64.b64encode(img_data).decode('utf-8')
-
-            logger.info(f"페이지 {page_num + 1}/{page_count} 분석 중...")
-            result = vision_ocr.extract_catalog_info(
-                image_base64=image_base64,
-                media_type="image/jpeg",
-                page_number=page_num + 1
-            )
-
-            all_pages.append({
-                "page": page_num + 1,
-                "text": result.get("text", ""),
-                "structured": result.get("structured", {})
-            })
+    try:
+        logger.info(f"카탈로그 AI 변환 시작: {upload_path.name}")
 
-        doc.close()
+        all_pages, page_images = _extract_pages_with_vision(job, upload_path, vision_ocr.extract_catalog_info)
+        page_count = len(page_images)
 
         # 카탈로그 데이터 통합
-        merged_data = _merge_catalog_data(all_pages)
+        with job.stage("merge"):
+            merged_data = _merge_catalog_data(all_pages)
 
         # 오버라이드
         if company:
@@ -5237,25 +5395,26 @@ async def convert_catalog_ai(
             merged_data["category"] = category
 
         # HTML 생성
-        html_content = _generate_catalog_html(merged_data)
+        with job.stage("html"):
+            html_content = _generate_catalog_html(merged_data)
 
         output_filename = f"{job_id}_{timestamp}_catalog.html"
         output_path = OUTPUT_DIR / output_filename
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        output_delivery.write_output(output_path, html_content)
 
         logger.info(f"카탈로그 AI 변환 완료: {output_path}")
 
-        return JSONResponse({
+        return {
             "success": True,
+            "job_id": job_id,
             "url": f"/outputs/{output_filename}",
             "filename": output_filename,
             "page_count": page_count,
             "ai_powered": True,
             "extracted_data": merged_data,
             "message": "카탈로그가 AI로 성공적으로 변환되었습니다."
-        })
+        }
 
     except HTTPException:
         raise
@@ -5417,39 +5576,47 @@ def _generate_catalog_html(data: dict) -> str:
 async def convert_election_ai(
     file: UploadFile = File(...),
     save_folder: str = Form(""),
-    create_images_folder: bool = Form(False)
+    create_images_folder: bool = Form(False),
+    async_mode: bool = Form(default=False),
+    force_refresh: bool = Form(default=False)
 ):
     """
     Claude Vision AI를 사용한 선거 공보물 PDF 변환
     """
-    import fitz
     from vision_ocr import VisionOCR
 
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="PDF 파일만 지원됩니다")
 
-    try:
-        vision_ocr = VisionOCR()
-        if not vision_ocr.client:
-            raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY가 설정되지 않았습니다")
+    vision_ocr = VisionOCR(force_refresh=force_refresh)
+    if not vision_ocr.client:
+        raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY가 설정되지 않았습니다")
 
-        job_id = str(uuid.uuid4())[:8]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        upload_path = UPLOAD_DIR / f"{job_id}_{timestamp}.pdf"
+    job_id = str(uuid.uuid4())[:8]
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    upload_path = UPLOAD_DIR / f"{job_id}_{timestamp}.pdf"
 
-        content = await file.read()
-        with open(upload_path, "wb") as f:
-            f.write(content)
+    stored = await save_upload(file, upload_path)
+
+    job = _submit_job(
+        "election-ai", _run_election_ai_job, vision_ocr, upload_path, save_folder,
+        create_images_folder, timestamp, job_id=job_id, upload=stored
+    )
+    return await _respond_with_job(job, async_mode)
 
-        doc = fitz.open(str(upload_path))
-        page_count = len(doc)
 
-        all_pages = []
-        page_images = []
+def _run_election_ai_job(job: Job, vision_ocr, upload_path: Path, save_folder: str,
+                         create_images_folder: bool, timestamp: str) -> dict:
+    """선거공보물 AI 변환 파이프라인 (워커 스레드에서 실행)"""
+    import base64
 
-        logger.info(f"선거공보물 AI 변환 시작: {page_count}페이지")
+    job_id = job.job_id
+
+    try:
+        logger.info(f"선거공보물 AI 변환 시작: {upload_path.name}")
 
         # 저장 경로 설정
+        images_path = None
         if save_folder:
             save_path = OUTPUT_DIR / save_folder
             save_path.mkdir(parents=True, exist_ok=True)
@@ -5458,17 +5625,12 @@ async def convert_election_ai(
                 images_path.mkdir(exist_ok=True)
         else:
             save_path = OUTPUT_DIR
-            images_path = None
-
-        for page_num in range(page_count):
-            page = doc[page_num]
-            mat = fitz.Matrix(150/72, 150/72)
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("jpeg")
 
-            import base64
-            image_base64 = base64.b64encode(img_data).decode('utf-8')
+        all_pages, rendered_pages = _extract_pages_with_vision(job, upload_path, vision_ocr.extract_election_info)
+        page_count = len(rendered_pages)
 
+        page_images = []
+        for page_num, img_data in enumerate(rendered_pages):
             # 이미지 저장 (옵션)
             if images_path:
                 img_filename = f"page_{page_num + 1}.jpg"
@@ -5476,35 +5638,22 @@ async def convert_election_ai(
                     f.write(img_data)
                 page_images.append(f"images/{img_filename}")
             else:
+                image_base64 = base64.b64encode(img_data).decode('utf-8')
                 page_images.append(f"data:image/jpeg;base64,{image_base64[:50]}...")
 
-            logger.info(f"페이지 {page_num + 1}/{page_count} 분석 중...")
-            result = vision_ocr.extract_election_info(
-                image_base64=image_base64,
-                media_type="image/jpeg",
-                page_number=page_num + 1
-            )
-
-            all_pages.append({
-                "page": page_num + 1,
-                "text": result.get("text", ""),
-                "structured": result.get("structured", {})
-            })
-
-        doc.close()
-
         # 선거 공보물 데이터 통합
-        merged_data = _merge_election_data(all_pages)
-        merged_data["page_images"] = page_images
+        with job.stage("merge"):
+            merged_data = _merge_election_data(all_pages)
+            merged_data["page_images"] = page_images
 
         # HTML 생성
-        html_content = _generate_election_html(merged_data, page_count)
+        with job.stage("html"):
+            html_content = _generate_election_html(merged_data, page_count)
 
-        output_filename = f"{job_id}_{timestamp}_election.html"
-        output_path = save_path / output_filename
+            output_filename = f"{job_id}_{timestamp}_election.html"
+            output_path = save_path / output_filename
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+            output_delivery.write_output(output_path, html_content)
 
         logger.info(f"선거공보물 AI 변환 완료: {output_path}")
 
@@ -5514,8 +5663,9 @@ async def convert_election_ai(
         else:
             url = f"/outputs/{output_filename}"
 
-        return JSONResponse({
+        return {
             "success": True,
+            "job_id": job_id,
             "result": {
                 "url": url,
                 "filename": output_filename,
@@ -5530,7 +5680,7 @@ async def convert_election_ai(
             },
             "ai_powered": True,
             "message": "선거공보물이 AI로 성공적으로 변환되었습니다."
-        })
+        }
 
     except HTTPException:
         raise
@@ -5846,9 +5996,7 @@ async def verify_church_bulletin_endpoint(
     try:
         # PDF 임시 저장
         temp_pdf = UPLOAD_DIR / f"verify_{uuid.uuid4().hex[:8]}.pdf"
-        content = await pdf_file.read()
-        with open(temp_pdf, "wb") as f:
-            f.write(content)
+        await save_upload(pdf_file, temp_pdf)
 
         # HTML 경로 확인
         full_html_path = OUTPUT_DIR / html_path.lstrip("/outputs/")
@@ -5936,6 +6084,79 @@ async def verify_existing_bulletin(
         raise HTTPException(status_code=500, detail=f"검증 실패: {str(e)}")
 
 
+@app.get("/api/church-model/{church_name}/{date}")
+async def get_church_bulletin_model(church_name: str, date: str):
+    """
+    주보 섹션 모델 조회 (변환 시 추출된 info + 섹션별 입력 키)
+
+    수정할 값의 경로를 확인하는 용도 - 섹션 HTML은 포함하지 않음
+    """
+    try:
+        model = await asyncio.to_thread(bulletin_models.load, church_name, date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if model is None:
+        raise HTTPException(status_code=404, detail=f"주보 모델이 없습니다. 먼저 변환하세요: {church_name}/{date}")
+
+    return JSONResponse({
+        "success": True,
+        "church_name": church_name,
+        "bulletin_date": date,
+        "theme": model.get("theme", "default"),
+        "info": model.get("info", {}),
+        "sections": {part_id: part.get("keys", []) for part_id, part in model.get("parts", {}).items()},
+    })
+
+
+@app.patch("/api/church-model/{church_name}/{date}")
+async def regenerate_church_bulletin(church_name: str, date: str, changes: dict = Body(..., embed=True)):
+    """
+    주보 섹션 모델 수정 → 입력이 바뀐 섹션만 다시 생성해 결과물 갱신 (PDF 재분석 없음)
+
+    요청 예:
+        {"changes": {"slogan": "2025 표어", "worship_services.order_items.3.content": "찬송 305장"}}
+
+    키는 info 최상위 키 또는 점 경로 (목록은 숫자 인덱스)
+    """
+    from church_html_generator import ChurchConfigManager
+
+    church_info = ChurchConfigManager.get_preset(church_name)
+    if not church_info.get("name"):
+        church_info["name"] = church_name
+    generator = ChurchConfigManager.create_generator(church_name=church_name, church_info=church_info)
+
+    output_path = OUTPUT_DIR / "Church" / church_name / f"{date}.html"
+    timer = StageTimer("church")
+
+    def rebuild(model):
+        with timer.stage("html"):
+            html_content, new_model, rebuilt = generator.regenerate(model, changes)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_delivery.write_output(output_path, html_content)
+        return new_model, rebuilt
+
+    try:
+        rebuilt = await asyncio.to_thread(bulletin_models.update, church_name, date, rebuild)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"주보 모델이 없습니다. 먼저 변환하세요: {church_name}/{date}")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"주보 재생성 실패: {church_name}/{date} - {e}")
+        raise HTTPException(status_code=500, detail=f"주보 재생성 실패: {str(e)}")
+
+    logger.info(f"주보 재생성: {church_name}/{date} - 섹션 {rebuilt or '없음'} ({timer.elapsed_ms()}ms)")
+
+    return JSONResponse({
+        "success": True,
+        "url": f"/outputs/Church/{quote(church_name, safe='')}/{date}.html",
+        "church_name": church_name,
+        "bulletin_date": date,
+        "rebuilt_sections": rebuilt,
+        "stage_timings": timer.timings,
+    })
+
+
 def generate_basic_church_html(church_name: str, bulletin_date: str, theme: str = "default") -> str:
     """교회별 프리셋을 적용한 풍부한 주보 HTML 템플릿 생성"""
 
@@ -6553,18 +6774,15 @@ async def batch_convert_elections(
                 fail_count += 1
                 continue
 
-            content = await file.read()
-
-            # 파일 저장
+            # 파일 저장 (청크 단위, 크기 제한 초과 시 413)
             safe_filename = f"{job_id}_{timestamp}.pdf"
             upload_path = UPLOAD_DIR / safe_filename
 
-            with open(upload_path, "wb") as f:
-                f.write(content)
+            await save_upload(file, upload_path)
 
             # 자동 변환
             brochure = auto_converter.convert(str(upload_path))
-            html_content = auto_converter.generate_html(brochure)
+            html_chunks = auto_converter.generate_html_chunks(brochure)
 
             # 출력 저장
             if brochure.candidate.name:
@@ -6574,8 +6792,7 @@ async def batch_convert_elections(
 
             output_path = OUTPUT_DIR / output_filename
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
+            output_delivery.write_output(output_path, html_chunks)
 
             # 임시 파일 정리
             cleanup_temp_files(job_id=job_id, keep_outputs=True)
@@ -6621,6 +6838,10 @@ class ChatEditRequest(BaseModel):
     message: str
     html: str
     history: Optional[List[dict]] = []
+    # auto: <section id>가 있으면 섹션 단위 편집, 없으면 전체 HTML 편집 / sections / full
+    mode: Optional[str] = "auto"
+    # 수정할 섹션 id (생략 시 AI가 섹션 목록을 보고 선택)
+    section_ids: Optional[List[str]] = None
 
 class ChatEditResponse(BaseModel):
     success: bool
@@ -6628,9 +6849,144 @@ class ChatEditResponse(BaseModel):
     html: Optional[str] = None
     error: Optional[str] = None
 
-# 대화 학습 데이터 저장 경로
-CHAT_LEARNING_DIR = BASE_DIR / "learning_data" / "chat_history"
-CHAT_LEARNING_DIR.mkdir(parents=True, exist_ok=True)
+# 대화 학습 데이터 저장소 (learning_data/chat_history: 일별 JSONL + 집계/오프셋 인덱스)
+chat_store = get_chat_store()
+
+CHAT_EDIT_MODEL = "claude-sonnet-4-20250514"
+# 섹션 모드에서 한 번에 보내는 섹션 HTML 최대 길이 (첫 섹션은 길이와 무관하게 포함)
+CHAT_SECTION_BUDGET = 50000
+
+CHAT_SECTION_SELECT_PROMPT = """당신은 교회 주보 HTML 편집 도우미입니다.
+섹션 목록과 사용자 요청을 보고, 요청을 처리하는 데 필요한 섹션 id만 골라주세요.
+
+**응답 형식:** <sections>id1, id2</sections>
+수정이나 내용 확인이 필요 없는 질문이면 <sections></sections>"""
+
+CHAT_SECTION_EDIT_PROMPT = """당신은 교회 주보 HTML 편집 전문 AI입니다.
+
+사용자의 요청에 따라 주어진 섹션만 수정합니다. 전체 HTML을 다시 쓰지 말고 바뀌는 부분만 패치로 반환하세요.
+
+**규칙:**
+1. 수정 내용을 간단히 설명한 뒤, 패치 작업 목록(JSON 배열)을 <patch> 태그 안에 반환하세요.
+2. 가능하면 replace_text로 바뀌는 문자열만 바꾸세요. find는 해당 섹션 HTML에 그대로 있는 문자열이어야 합니다.
+3. 섹션 구조를 크게 바꿀 때만 replace로 섹션 전체(<section ...>...</section>)를 다시 쓰세요.
+4. HTML 구조를 깨뜨리지 말고, 한국어 텍스트와 기존 CSS 클래스를 유지하세요.
+
+**패치 작업:**
+- {"op": "replace_text", "id": "섹션id", "find": "기존 문자열", "replace": "새 문자열"}
+- {"op": "replace", "id": "섹션id", "html": "<section id=\"섹션id\" ...>...</section>"}
+- {"op": "insert_after" 또는 "insert_before", "id": "섹션id", "html": "추가할 HTML"}
+- {"op": "remove", "id": "섹션id"}
+
+**응답 형식:**
+수정 내용 설명
+
+<patch>
+[{"op": "replace_text", "id": "worship", "find": "오전 11시", "replace": "오전 11시 30분"}]
+</patch>
+
+수정이 필요 없는 질문이면 그냥 답변만 하세요."""
+
+
+def _tag_content(text: str, tag: str) -> Optional[str]:
+    """<tag>...</tag> 사이 내용 (없으면 None)"""
+    start = text.find(f"<{tag}>")
+    end = text.find(f"</{tag}>", start + 1)
+    if start < 0 or end < 0:
+        return None
+    return text[start + len(tag) + 2:end].strip()
+
+
+def _select_chat_sections(client, message: str, outline: List[dict]) -> List[str]:
+    """섹션 목록(id + 미리보기)만 보내 수정 대상 섹션 선택"""
+    outline_text = "\n".join(f"- {s['id']} ({s['length']}자): {s['preview']}" for s in outline)
+    response = client.messages.create(
+        model=CHAT_EDIT_MODEL,
+        max_tokens=256,
+        system=CHAT_SECTION_SELECT_PROMPT,
+        messages=[{"role": "user", "content": f"**섹션 목록:**\n{outline_text}\n\n**사용자 요청:**\n{message}"}]
+    )
+    selected = _tag_content(response.content[0].text, "sections") or ""
+    known = {s["id"] for s in outline}
+    return [sid.strip() for sid in selected.split(",") if sid.strip() in known]
+
+
+def _chat_edit_sections(client, request: ChatEditRequest, messages: List[dict], outline: List[dict]):
+    """섹션 단위 편집 - 대상 섹션 HTML만 보내고 패치를 받아 서버에서 적용
+
+    Returns:
+        (응답 설명, 수정된 HTML 또는 None, 대상 섹션 id 목록, 적용된 패치 작업 목록)
+    """
+    sections = find_sections(request.html)
+    known = [sid for sid in (request.section_ids or []) if sid in sections]
+    target_ids = known or _select_chat_sections(client, request.message, outline)
+
+    # 예산 안에서 대상 섹션 HTML 구성
+    included, section_blocks, total = [], [], 0
+    for sid in target_ids:
+        outer = sections[sid].outer_html(request.html)
+        if included and total + len(outer) > CHAT_SECTION_BUDGET:
+            logger.warning(f"채팅 편집 섹션 예산 초과, 제외: {sid} ({len(outer)}자)")
+            continue
+        included.append(sid)
+        section_blocks.append(f"### 섹션 {sid}\n```html\n{outer}\n```")
+        total += len(outer)
+
+    outline_text = "\n".join(f"- {s['id']}: {s['preview']}" for s in outline)
+    user_content = f"""**문서 섹션 목록:**
+{outline_text}
+
+**수정 대상 섹션 HTML:**
+{chr(10).join(section_blocks) if section_blocks else "(없음)"}
+
+**사용자 요청:**
+{request.message}"""
+
+    response = client.messages.create(
+        model=CHAT_EDIT_MODEL,
+        max_tokens=min(16384, 2048 + total // 2),
+        system=CHAT_SECTION_EDIT_PROMPT,
+        messages=messages + [{"role": "user", "content": user_content}]
+    )
+    ai_response = response.content[0].text
+
+    patch_text = _tag_content(ai_response, "patch")
+    if patch_text is None:
+        return ai_response.strip(), None, included, []
+
+    clean_response = ai_response[:ai_response.find("<patch>")].strip()
+    try:
+        ops = json.loads(patch_text)
+        if isinstance(ops, dict):
+            ops = [ops]
+        modified_html, applied = apply_section_patch(request.html, ops)
+    except (ValueError, SectionPatchError) as e:
+        logger.warning(f"채팅 편집 패치 적용 실패: {e}")
+        return f"{clean_response}\n\n(수정 적용 실패: {e})", None, included, []
+
+    return clean_response, modified_html, included, applied
+
+
+def _save_chat_log(request: ChatEditRequest, clean_response: str, modified_html: Optional[str],
+                   mode: str, sections: Optional[List[str]] = None):
+    """대화 학습 데이터 저장"""
+    try:
+        chat_log = {
+            "timestamp": datetime.now().isoformat(),
+            "user_message": request.message,
+            "ai_response": clean_response,
+            "html_modified": modified_html is not None,
+            "html_length_before": len(request.html),
+            "html_length_after": len(modified_html) if modified_html else len(request.html),
+            "edit_mode": mode
+        }
+        if sections is not None:
+            chat_log["sections"] = sections
+
+        chat_store.append(chat_log)
+    except Exception as e:
+        logger.warning(f"채팅 로그 저장 실패: {e}")
+
 
 @app.post("/api/chat/edit")
 async def chat_edit_html(request: ChatEditRequest):
@@ -6645,6 +7001,32 @@ async def chat_edit_html(request: ChatEditRequest):
 
         client = Anthropic()
 
+        # 대화 히스토리 구성
+        messages = []
+        for h in request.history[-10:]:  # 최근 10개만
+            messages.append({
+                "role": h.get("role", "user"),
+                "content": h.get("content", "")
+            })
+
+        # 섹션 단위 편집: 대상 섹션만 주고받아 비용이 문서 크기가 아닌 수정 범위에 비례
+        outline = section_outline(request.html) if request.mode != "full" else []
+        if request.mode == "sections" and not outline:
+            logger.info("섹션(<section id>)이 없는 HTML - 전체 편집으로 처리")
+        if outline:
+            clean_response, modified_html, edited_sections, patch = _chat_edit_sections(
+                client, request, messages, outline
+            )
+            _save_chat_log(request, clean_response, modified_html, "sections", edited_sections)
+            return JSONResponse({
+                "success": True,
+                "response": clean_response,
+                "html": modified_html,
+                "mode": "sections",
+                "sections": edited_sections,
+                "patch": patch
+            })
+
         # 시스템 프롬프트
         system_prompt = """당신은 교회 주보 HTML 편집 전문 AI입니다.
 
@@ -6666,14 +7048,6 @@ async def chat_edit_html(request: ChatEditRequest):
 
 또는 수정이 필요 없는 질문이면 그냥 답변만 하세요."""
 
-        # 대화 히스토리 구성
-        messages = []
-        for h in request.history[-10:]:  # 최근 10개만
-            messages.append({
-                "role": h.get("role", "user"),
-                "content": h.get("content", "")
-            })
-
         # 현재 HTML과 사용자 메시지
         user_content = f"""**현재 HTML:**
 ```html
@@ -6690,7 +7064,7 @@ async def chat_edit_html(request: ChatEditRequest):
 
         # Claude API 호출
         response = client.messages.create(
-            model="claude-sonnet-4-20250514",
+            model=CHAT_EDIT_MODEL,
             max_tokens=16384,
             system=system_prompt,
             messages=messages
@@ -6710,26 +7084,13 @@ async def chat_edit_html(request: ChatEditRequest):
             clean_response = ai_response
 
         # 학습 데이터 저장
-        try:
-            chat_log = {
-                "timestamp": datetime.now().isoformat(),
-                "user_message": request.message,
-                "ai_response": clean_response,
-                "html_modified": modified_html is not None,
-                "html_length_before": len(request.html),
-                "html_length_after": len(modified_html) if modified_html else len(request.html)
-            }
-
-            log_file = CHAT_LEARNING_DIR / f"chat_{datetime.now().strftime('%Y%m%d')}.jsonl"
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(chat_log, ensure_ascii=False) + "\n")
-        except Exception as e:
-            logger.warning(f"채팅 로그 저장 실패: {e}")
+        _save_chat_log(request, clean_response, modified_html, "full")
 
         return JSONResponse({
             "success": True,
             "response": clean_response,
-            "html": modified_html
+            "html": modified_html,
+            "mode": "full"
         })
 
     except Exception as e:
@@ -6742,31 +7103,20 @@ async def chat_edit_html(request: ChatEditRequest):
 
 
 @app.get("/api/chat/history")
-async def get_chat_history(date: str = None, limit: int = 100):
+async def get_chat_history(date: str = None, offset: Optional[int] = None, limit: int = 100):
     """
     채팅 학습 히스토리 조회 API
+
+    - date 지정 시 해당 날짜 기록을 offset부터 limit개 반환 (offset 생략 시 마지막 limit개)
+    - 다음 페이지는 응답의 next_offset으로 요청
     """
     try:
         if date:
-            log_file = CHAT_LEARNING_DIR / f"chat_{date}.jsonl"
-            if not log_file.exists():
-                return JSONResponse({"success": True, "history": [], "count": 0})
-
-            history = []
-            with open(log_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        history.append(json.loads(line))
-
-            return JSONResponse({
-                "success": True,
-                "history": history[-limit:],
-                "count": len(history)
-            })
+            page = chat_store.history(date, offset=offset, limit=limit)
+            return JSONResponse({"success": True, **page})
         else:
             # 모든 날짜의 히스토리 파일 목록
-            files = sorted(CHAT_LEARNING_DIR.glob("chat_*.jsonl"), reverse=True)
-            dates = [f.stem.replace("chat_", "") for f in files]
+            dates = chat_store.dates()
 
             return JSONResponse({
                 "success": True,
@@ -6783,44 +7133,26 @@ async def get_chat_history(date: str = None, limit: int = 100):
 
 
 @app.get("/api/chat/insights")
-async def get_chat_insights():
+async def get_chat_insights(since: Optional[str] = None, until: Optional[str] = None):
     """
     채팅 학습 데이터 분석 - 자주 요청되는 수정 패턴 분석
+
+    일별 집계만 합산하므로 대화 기록이 쌓여도 조회 비용이 늘지 않음
+    (since/until: YYYYMMDD, 지정 시 해당 기간만)
     """
     try:
-        all_history = []
+        insights = chat_store.insights(since=since, until=until)
 
-        for log_file in CHAT_LEARNING_DIR.glob("chat_*.jsonl"):
-            with open(log_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        all_history.append(json.loads(line))
-
-        if not all_history:
+        if not insights["total_conversations"]:
             return JSONResponse({
                 "success": True,
                 "total_conversations": 0,
                 "insights": {}
             })
 
-        # 통계 분석
-        total = len(all_history)
-        modified_count = sum(1 for h in all_history if h.get("html_modified"))
-
-        # 자주 사용되는 키워드 분석
-        keywords = {}
-        for h in all_history:
-            msg = h.get("user_message", "").lower()
-            for word in ["바꿔", "변경", "수정", "추가", "삭제", "제목", "설교", "찬송", "예배", "목사", "시간"]:
-                if word in msg:
-                    keywords[word] = keywords.get(word, 0) + 1
-
         return JSONResponse({
             "success": True,
-            "total_conversations": total,
-            "html_modifications": modified_count,
-            "modification_rate": round(modified_count / total * 100, 1) if total > 0 else 0,
-            "common_keywords": dict(sorted(keywords.items(), key=lambda x: x[1], reverse=True)[:10]),
+            **insights,
             "insights": {
                 "description": "사용자들이 자주 요청하는 수정 패턴을 분석한 결과입니다.",
                 "recommendation": "자주 요청되는 패턴은 자동화 기능으로 추가할 수 있습니다."
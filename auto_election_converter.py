@@ -15,7 +15,7 @@ import json
 import base64
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
@@ -25,7 +25,8 @@ except ImportError:
     fitz = None
 
 from PIL import Image
-import io
+
+from html_stream import iter_slots, slot
 
 # 향상된 변환기 모듈 임포트
 try:
@@ -428,22 +429,21 @@ class AutoElectionConverter:
             logger.info(f"파일명에서 추출: 정당={filename_info.get('party')}, 후보={filename_info.get('name')}")
 
         try:
-            doc = fitz.open(pdf_path)
+            from page_cache import get_page_cache
+
             all_text = ""
             first_page_image = None
 
-            # 1단계: 모든 페이지 처리
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                page_data = self._process_page(page, page_num + 1)
-                brochure.raw_pages.append(page_data)
-                all_text += page_data.get("text", "") + "\n"
+            # 1단계: 모든 페이지 처리 (렌더링 결과는 공유 페이지 캐시로 재사용)
+            with get_page_cache().open(pdf_path) as raster:
+                for page_num in range(len(raster)):
+                    page_data = self._process_page(raster, page_num)
+                    brochure.raw_pages.append(page_data)
+                    all_text += page_data.get("text", "") + "\n"
 
-                # 첫 페이지 이미지 저장 (정당 색상 분석용)
-                if page_num == 0:
-                    first_page_image = self._render_page_to_image(page)
-
-            doc.close()
+                    # 첫 페이지 이미지 저장 (정당 색상 분석용, OCR에서 렌더링했으면 캐시 적중)
+                    if page_num == 0:
+                        first_page_image = self._render_page_to_image(raster, page_num)
 
             # v2.0: OCR 후처리 (오타 수정)
             if self.enhanced:
@@ -553,9 +553,12 @@ class AutoElectionConverter:
             logger.error(f"변환 오류: {e}", exc_info=True)
             raise
 
-    def _process_page(self, page, page_num: int) -> Dict[str, Any]:
+    def _process_page(self, raster, page_index: int) -> Dict[str, Any]:
         """페이지 처리 - OCR 포함"""
+        page_num = page_index + 1
         try:
+            page = raster.doc[page_index]
+
             # 먼저 텍스트 추출 시도
             text = page.get_text("text").strip()
 
@@ -563,23 +566,9 @@ class AutoElectionConverter:
             if len(text) < 50 and self.vision_ocr:
                 logger.info(f"페이지 {page_num}: OCR 처리 시작")
 
-                # 페이지를 이미지로 렌더링
-                zoom = self.dpi / 72
-                mat = fitz.Matrix(zoom, zoom)
-                pix = page.get_pixmap(matrix=mat)
-
-                img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-
-                # 리사이즈
-                if img.width > self.max_width:
-                    ratio = self.max_width / img.width
-                    new_height = int(img.height * ratio)
-                    img = img.resize((self.max_width, new_height), Image.LANCZOS)
-
-                # Base64 인코딩
-                buffer = io.BytesIO()
-                img.save(buffer, format="JPEG", quality=85)
-                base64_img = base64.b64encode(buffer.getvalue()).decode()
+                # 페이지를 모바일 크기 JPEG로 렌더링 후 Base64 인코딩
+                jpeg_bytes = raster.mobile_jpeg(page_index, dpi=self.dpi, max_width=self.max_width, quality=85)
+                base64_img = base64.b64encode(jpeg_bytes).decode()
 
                 # Vision OCR 호출
                 if hasattr(self.vision_ocr, 'extract_election_info'):
@@ -621,13 +610,10 @@ class AutoElectionConverter:
                 "error": str(e)
             }
 
-    def _render_page_to_image(self, page) -> Optional[Image.Image]:
-        """페이지를 PIL 이미지로 렌더링"""
+    def _render_page_to_image(self, raster, page_index: int) -> Optional[Image.Image]:
+        """페이지를 PIL 이미지로 렌더링 (공유 페이지 캐시 사용)"""
         try:
-            zoom = self.dpi / 72
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
-            return Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+            return raster.pil_image(page_index, dpi=self.dpi)
         except Exception as e:
             logger.error(f"이미지 렌더링 오류: {e}")
             return None
@@ -956,6 +942,13 @@ class AutoElectionConverter:
             brochure: 변환된 선거 공보 데이터
             output_folder: 이미지가 저장된 폴더 경로 (이미지 자동 포함용)
         """
+        return "".join(self.generate_html_chunks(brochure, output_folder))
+
+    def generate_html_chunks(self, brochure: ElectionBrochure, output_folder: str = None) -> Iterator[str]:
+        """generate_html의 청크 버전 - 전문보기/이미지 갤러리는 페이지/이미지 하나씩 내보냄
+
+        학습된 규칙(정규식 치환)이 있으면 문서 전체가 필요하므로 합쳐서 적용한 뒤 한 청크로 반환
+        """
         theme = brochure.theme or PartyTheme.from_party(PartyType.UNKNOWN)
         candidate = brochure.candidate
 
@@ -984,7 +977,7 @@ class AutoElectionConverter:
             gallery_images = folder_images
 
         # 이미지 갤러리 HTML (모든 이미지 모아서 보기)
-        image_gallery_html = self._generate_image_gallery_html(gallery_images) if gallery_images else ""
+        image_gallery_html = self._iter_image_gallery_html(gallery_images)
 
         # 공약 HTML 생성
         pledges_html = self._generate_pledges_html(brochure.core_pledges)
@@ -1002,7 +995,7 @@ class AutoElectionConverter:
         highlights_html = self._generate_highlights_html(brochure)
 
         # 전문보기 HTML
-        fulltext_html = self._generate_fulltext_html(brochure.raw_pages)
+        fulltext_html = self._iter_fulltext_html(brochure.raw_pages)
 
         # v2.0: 지역 지도 섹션 HTML
         # 조건: 지역별 공약(region_pledges)이 있거나 기초단체장/국회의원인 경우에만 표시
@@ -1035,7 +1028,7 @@ class AutoElectionConverter:
                 logger.warning(f"지역 지도 생성 실패: {e}")
 
         # HTML 생성
-        html_output = f'''<!DOCTYPE html>
+        skeleton = f'''<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
@@ -1630,11 +1623,11 @@ class AutoElectionConverter:
     <!-- Full Text Section -->
     <section class="section" id="fulltext">
         <h2 class="section-title"><span class="icon">📄</span> 전문보기</h2>
-        {fulltext_html}
+        {slot("fulltext")}
     </section>
 
     <!-- Image Gallery Section (모든 이미지 모아보기) -->
-    {image_gallery_html}
+    {slot("image-gallery")}
 
     <!-- Contact Section (맨 마지막) -->
     {contact_html}
@@ -1725,22 +1718,38 @@ class AutoElectionConverter:
 </body>
 </html>'''
 
+        chunks = iter_slots(skeleton, {"fulltext": fulltext_html, "image-gallery": image_gallery_html})
+
         # 능동형 AI 학습 엔진: 학습된 규칙 적용
+        learning_engine = None
         if ACTIVE_LEARNING_AVAILABLE:
             try:
                 learning_engine = get_learning_engine()
-                # 선거공보 카테고리로 학습된 규칙 적용
-                html_output, applied_rules = learning_engine.apply_rules_to_html(
-                    html_output, category="선거공보"
-                )
-                if applied_rules:
-                    logger.info(f"🧠 학습된 규칙 {len(applied_rules)}개 적용됨: {', '.join(applied_rules)}")
-                else:
+                if not learning_engine.get_applicable_rules("선거공보"):
+                    learning_engine = None
                     logger.debug("적용할 학습된 규칙 없음")
             except Exception as e:
+                learning_engine = None
                 logger.warning(f"학습 규칙 적용 실패: {e}")
 
-        return html_output
+        if learning_engine is None:
+            return chunks
+
+        # 규칙은 문서 전체에 대한 정규식 치환 → 이 경우에만 하나의 문자열로 합침
+        html_output = "".join(chunks)
+        try:
+            # 선거공보 카테고리로 학습된 규칙 적용
+            html_output, applied_rules = learning_engine.apply_rules_to_html(
+                html_output, category="선거공보"
+            )
+            if applied_rules:
+                logger.info(f"🧠 학습된 규칙 {len(applied_rules)}개 적용됨: {', '.join(applied_rules)}")
+            else:
+                logger.debug("적용할 학습된 규칙 없음")
+        except Exception as e:
+            logger.warning(f"학습 규칙 적용 실패: {e}")
+
+        return iter((html_output,))
 
     def _generate_vision_html(self, vision: Vision) -> str:
         """비전 섹션 HTML 생성 (아코디언 방식)"""
@@ -1889,26 +1898,20 @@ class AutoElectionConverter:
         {raw_text_html}
     </section>'''
 
-    def _generate_fulltext_html(self, pages: List[Dict]) -> str:
-        """전문보기 HTML 생성"""
-        if not pages:
-            return ""
-
-        html = ""
-        for page in pages:
+    def _iter_fulltext_html(self, pages: List[Dict]) -> Iterator[str]:
+        """전문보기 HTML 생성 (페이지 하나씩)"""
+        for page in pages or []:
             page_num = page.get("page_number", 1)
             text = page.get("text", "").strip()
 
             if text:
                 formatted_text = self._escape_html(text).replace("\n", "<br>")
-                html += f'''
+                yield f'''
         <div class="page-content">
             <h4>📄 페이지 {page_num}</h4>
             <p>{formatted_text}</p>
         </div>'''
 
-        return html
-
     def _escape_html(self, text: str) -> str:
         """HTML 이스케이프"""
         if not text:
@@ -1939,28 +1942,27 @@ class AutoElectionConverter:
         images.sort(key=lambda x: x['filename'])
         return images
 
-    def _generate_image_gallery_html(self, images: List[Dict[str, str]]) -> str:
-        """이미지 갤러리 섹션 HTML 생성"""
+    def _iter_image_gallery_html(self, images: List[Dict[str, str]]) -> Iterator[str]:
+        """이미지 갤러리 섹션 HTML 생성 (이미지 하나씩)"""
         if not images:
-            return ""
+            return
 
-        gallery_html = '''
+        yield '''
     <!-- 이미지 갤러리 -->
     <section class="section" id="gallery">
         <h2 class="section-title"><span class="icon">📸</span> 주요 이미지</h2>
         <div class="image-gallery">
 '''
         for img in images:
-            gallery_html += f'''
+            yield f'''
             <div class="gallery-item" onclick="showFullImage('{img['path']}')">
                 <img src="{img['path']}" alt="{img['name']}" loading="lazy">
             </div>
 '''
-        gallery_html += '''
+        yield '''
         </div>
     </section>
 '''
-        return gallery_html
 
     def _generate_inline_image_html(self, image: Dict[str, str], position: str = "center") -> str:
         """문맥에 맞는 인라인 이미지 HTML 생성"""
@@ -0,0 +1,108 @@
+"""
+주보 섹션 모델 저장소 - (교회, 날짜)별로 생성기의 중간 모델(info + 섹션별 HTML/입력 지문)을 보관
+
+- 주보 변환 후 ChurchBulletinGenerator.last_model을 저장해 두면
+  수정/피드백 반영 시 PDF 분석 없이 바뀐 섹션만 다시 생성 (ChurchBulletinGenerator.regenerate)
+- cache/bulletins/<교회>/<날짜>.json 에 원자적으로 저장 (없으면 전체 변환 필요)
+- 같은 주보의 읽기-수정-저장은 한 번에 하나씩 (update)
+
+사용법:
+    from bulletin_models import get_bulletin_model_store
+
+    store = get_bulletin_model_store()
+    store.save(church_name, bulletin_date, generator.last_model)
+
+    def rebuild(model):
+        html, new_model, rebuilt = generator.regenerate(model, changes)
+        return new_model, (html, rebuilt)
+
+    html, rebuilt = store.update(church_name, bulletin_date, rebuild)
+"""
+
+import os
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_DIR = Path(__file__).parent / "cache" / "bulletins"
+
+
+class BulletinModelStore:
+    """(교회, 날짜)별 주보 섹션 모델 JSON 저장소"""
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory or os.getenv("BULLETIN_MODEL_DIR") or DEFAULT_MODEL_DIR)
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _path(self, church_name: str, bulletin_date: str) -> Path:
+        for name in (church_name, bulletin_date):
+            if not name or name in (".", "..") or "/" in name or "\\" in name:
+                raise ValueError(f"잘못된 교회명/날짜: {name!r}")
+        return self.directory / church_name / f"{bulletin_date}.json"
+
+    def _lock(self, church_name: str, bulletin_date: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault((church_name, bulletin_date), threading.Lock())
+
+    def load(self, church_name: str, bulletin_date: str) -> Optional[Dict[str, Any]]:
+        """저장된 모델 (없거나 손상되었으면 None)"""
+        path = self._path(church_name, bulletin_date)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (ValueError, OSError) as e:
+            logger.warning(f"주보 모델 손상: {path} ({e})")
+            return None
+
+    def _save_locked(self, church_name: str, bulletin_date: str, model: Dict[str, Any]) -> None:
+        path = self._path(church_name, bulletin_date)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(model, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+
+    def save(self, church_name: str, bulletin_date: str, model: Optional[Dict[str, Any]]) -> bool:
+        """모델 저장 (실패해도 변환 결과에는 영향 없음 → False 반환)"""
+        if not model:
+            return False
+        try:
+            with self._lock(church_name, bulletin_date):
+                self._save_locked(church_name, bulletin_date, model)
+            return True
+        except (ValueError, OSError, TypeError) as e:
+            logger.warning(f"주보 모델 저장 실패: {church_name}/{bulletin_date} ({e})")
+            return False
+
+    def update(self, church_name: str, bulletin_date: str,
+               fn: Callable[[Dict[str, Any]], Tuple[Dict[str, Any], Any]]) -> Any:
+        """모델을 읽어 fn(model) -> (새 모델, 결과)를 실행하고 저장 후 결과 반환
+
+        Raises:
+            KeyError: 저장된 모델이 없음 (전체 변환을 먼저 해야 함)
+        """
+        with self._lock(church_name, bulletin_date):
+            model = self.load(church_name, bulletin_date)
+            if model is None:
+                raise KeyError(f"{church_name}/{bulletin_date}")
+            new_model, result = fn(model)
+            self._save_locked(church_name, bulletin_date, new_model)
+            return result
+
+
+# 싱글톤 인스턴스
+_bulletin_model_store = None
+
+def get_bulletin_model_store() -> BulletinModelStore:
+    """주보 섹션 모델 저장소 싱글톤 인스턴스 가져오기"""
+    global _bulletin_model_store
+    if _bulletin_model_store is None:
+        _bulletin_model_store = BulletinModelStore()
+    return _bulletin_model_store
@@ -0,0 +1,278 @@
+"""
+채팅 학습 기록 저장소 - AI 대화 편집 기록(chat_YYYYMMDD.jsonl)의 일별 집계와 페이지 단위 조회
+
+- 기록 추가 시 그날의 집계(요청 유형별 건수, HTML 수정 건수, HTML 크기 변화)를 바로 갱신
+  → 인사이트 조회는 일별 집계 파일만 읽음 (대화 수와 무관)
+- 일별 줄 오프셋 인덱스(chat_YYYYMMDD.idx, 8바이트/줄)로 원하는 위치부터 seek 후 limit개만 읽음
+- 집계/인덱스는 JSONL에서 다시 만들 수 있는 파생 데이터: 없거나 JSONL보다 뒤처지면 이어서 재구성
+
+사용법:
+    from chat_history import get_chat_store
+
+    store = get_chat_store()
+    store.append({"user_message": ..., "html_modified": True, ...})
+    page = store.history("20251210", offset=0, limit=50)
+    insights = store.insights()
+"""
+
+import os
+import json
+import logging
+import threading
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHAT_DIR = Path(__file__).parent / "learning_data" / "chat_history"
+
+# 요청 유형 (사용자 메시지에 포함된 키워드 기준)
+CHAT_KEYWORDS = ("바꿔", "변경", "수정", "추가", "삭제", "제목", "설교", "찬송", "예배", "목사", "시간")
+
+OFFSET_TYPECODE = "Q"  # 줄 시작 바이트 오프셋 (uint64)
+
+
+def _empty_rollup() -> Dict[str, Any]:
+    return {
+        "bytes": 0,                 # 집계에 반영된 JSONL 크기
+        "total": 0,
+        "modified": 0,
+        "keywords": {},
+        "html_delta_sum": 0,        # 수정된 대화의 (수정 후 - 수정 전) HTML 길이 합
+        "html_before_sum": 0,
+    }
+
+
+class ChatHistoryStore:
+    """일별 채팅 JSONL + 집계/오프셋 인덱스"""
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory or DEFAULT_CHAT_DIR)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # 날짜(YYYYMMDD) -> 집계 / 줄 오프셋
+        self._rollups: Dict[str, Dict[str, Any]] = {}
+        self._offsets: Dict[str, array] = {}
+        self._lock = threading.Lock()
+
+    # ---------- 파일 경로 ----------
+
+    def _log_path(self, date: str) -> Path:
+        return self.directory / f"chat_{date}.jsonl"
+
+    def _index_path(self, date: str) -> Path:
+        return self.directory / f"chat_{date}.idx"
+
+    def _rollup_path(self, date: str) -> Path:
+        return self.directory / f"chat_{date}.rollup.json"
+
+    def dates(self) -> List[str]:
+        """기록이 있는 날짜 목록 (최신순)"""
+        return sorted((p.stem[len("chat_"):] for p in self.directory.glob("chat_*.jsonl")), reverse=True)
+
+    # ---------- 집계 ----------
+
+    @staticmethod
+    def _apply(rollup: Dict[str, Any], entry: Dict[str, Any]) -> None:
+        rollup["total"] += 1
+        message = (entry.get("user_message") or "").lower()
+        for word in CHAT_KEYWORDS:
+            if word in message:
+                rollup["keywords"][word] = rollup["keywords"].get(word, 0) + 1
+        if entry.get("html_modified"):
+            rollup["modified"] += 1
+            before = int(entry.get("html_length_before") or 0)
+            rollup["html_before_sum"] += before
+            rollup["html_delta_sum"] += int(entry.get("html_length_after") or before) - before
+
+    def _load_day_locked(self, date: str) -> Dict[str, Any]:
+        """날짜별 집계/인덱스 로드 - JSONL보다 뒤처져 있으면 남은 부분만 읽어 따라잡음"""
+        rollup = self._rollups.get(date)
+        log_path = self._log_path(date)
+        size = log_path.stat().st_size if log_path.exists() else 0
+        if rollup is not None and rollup["bytes"] == size:
+            return rollup
+
+        if rollup is None:
+            rollup, offsets = self._read_day_files(date)
+        else:
+            offsets = self._offsets[date]
+
+        rebuild = rollup["bytes"] > size or len(offsets) != rollup["total"]
+        if rebuild:
+            # JSONL이 줄었거나 인덱스가 맞지 않으면 처음부터 재구성
+            rollup, offsets = _empty_rollup(), array(OFFSET_TYPECODE)
+
+        added = self._scan(log_path, rollup, offsets) if rollup["bytes"] < size else array(OFFSET_TYPECODE)
+        if rebuild or added:
+            full = rebuild or len(added) == len(offsets)
+            self._write_day_files(date, rollup, offsets if full else added, append=not full)
+
+        self._rollups[date] = rollup
+        self._offsets[date] = offsets
+        return rollup
+
+    def _read_day_files(self, date: str):
+        rollup, offsets = _empty_rollup(), array(OFFSET_TYPECODE)
+        try:
+            with open(self._rollup_path(date), "r", encoding="utf-8") as f:
+                rollup = {**rollup, **json.load(f)}
+            with open(self._index_path(date), "rb") as f:
+                offsets.frombytes(f.read())
+        except FileNotFoundError:
+            return _empty_rollup(), array(OFFSET_TYPECODE)
+        except (ValueError, OSError) as e:
+            logger.warning(f"채팅 집계 파일 손상, 재구성: {date} ({e})")
+            return _empty_rollup(), array(OFFSET_TYPECODE)
+        return rollup, offsets
+
+    def _scan(self, log_path: Path, rollup: Dict[str, Any], offsets: array) -> array:
+        """rollup["bytes"] 이후의 완결된 줄을 집계/인덱스에 반영하고 새로 추가된 오프셋 반환"""
+        added = array(OFFSET_TYPECODE)
+        with open(log_path, "rb") as f:
+            f.seek(rollup["bytes"])
+            position = rollup["bytes"]
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # 쓰는 중인 마지막 줄은 다음에 반영
+                if line.strip():
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        entry = None
+                    if isinstance(entry, dict):
+                        added.append(position)
+                        self._apply(rollup, entry)
+                    else:
+                        logger.warning(f"손상된 채팅 기록 건너뜀: {log_path.name}@{position}")
+                position += len(line)
+            rollup["bytes"] = position
+        offsets.extend(added)
+        return added
+
+    def _write_day_files(self, date: str, rollup: Dict[str, Any], offsets: array, append: bool = True) -> None:
+        """인덱스는 새 오프셋만 추가(append=False면 전체 기록), 집계는 원자적으로 교체"""
+        try:
+            with open(self._index_path(date), "ab" if append else "wb") as f:
+                f.write(offsets.tobytes())
+
+            rollup_path = self._rollup_path(date)
+            tmp_path = rollup_path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(rollup, f, ensure_ascii=False)
+            os.replace(tmp_path, rollup_path)
+        except OSError as e:
+            logger.warning(f"채팅 집계 저장 실패: {date} ({e})")
+
+    # ---------- 기록 ----------
+
+    def append(self, entry: Dict[str, Any], date: Optional[str] = None) -> None:
+        """대화 기록 추가 + 그날 집계/인덱스 갱신"""
+        date = date or datetime.now().strftime("%Y%m%d")
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+
+        with self._lock:
+            rollup = self._load_day_locked(date)
+            log_path = self._log_path(date)
+            with open(log_path, "ab") as f:
+                position = f.tell()
+                f.write(line)
+
+            if position != rollup["bytes"]:
+                # 다른 프로세스가 사이에 기록함 → 뒤처진 부분부터 다시 읽어 반영
+                self._load_day_locked(date)
+                return
+
+            self._apply(rollup, entry)
+            rollup["bytes"] = position + len(line)
+            self._offsets[date].append(position)
+            self._write_day_files(date, rollup, array(OFFSET_TYPECODE, [position]))
+
+    # ---------- 조회 ----------
+
+    def history(self, date: str, offset: Optional[int] = None, limit: int = 100) -> Dict[str, Any]:
+        """날짜별 기록 페이지 조회 (offset 생략 시 마지막 limit개)"""
+        limit = max(0, limit)
+        with self._lock:
+            if not (len(date) == 8 and date.isdigit()) or not self._log_path(date).exists():
+                return {"history": [], "count": 0, "offset": 0, "next_offset": None}
+            self._load_day_locked(date)
+            offsets = self._offsets[date]
+            count = len(offsets)
+            if offset is None:
+                offset = max(0, count - limit)
+            offset = min(max(0, offset), count)
+            page_offsets = offsets[offset:offset + limit]
+
+            history = []
+            if page_offsets:
+                # 인덱스에 있는 줄(_scan에서 객체로 확인된 기록)만 오프셋별로 읽음
+                with open(self._log_path(date), "rb") as f:
+                    for position in page_offsets:
+                        f.seek(position)
+                        try:
+                            entry = json.loads(f.readline())
+                        except ValueError:
+                            continue
+                        if isinstance(entry, dict):
+                            history.append(entry)
+
+        end = offset + len(page_offsets)
+        return {
+            "history": history,
+            "count": count,
+            "offset": offset,
+            "next_offset": end if end < count else None,
+        }
+
+    def daily_rollups(self, since: Optional[str] = None, until: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """날짜별 집계 (since/until: YYYYMMDD, 둘 다 포함)"""
+        with self._lock:
+            return {
+                date: {k: v for k, v in self._load_day_locked(date).items() if k != "bytes"}
+                for date in sorted(self.dates())
+                if (not since or date >= since) and (not until or date <= until)
+            }
+
+    def insights(self, since: Optional[str] = None, until: Optional[str] = None) -> Dict[str, Any]:
+        """일별 집계 합산 - 요청 유형 빈도, HTML 수정률, 평균 HTML 크기 변화"""
+        daily = self.daily_rollups(since, until)
+        total = sum(day["total"] for day in daily.values())
+        modified = sum(day["modified"] for day in daily.values())
+        keywords: Dict[str, int] = {}
+        html_delta_sum = html_before_sum = 0
+        for day in daily.values():
+            for word, count in day["keywords"].items():
+                keywords[word] = keywords.get(word, 0) + count
+            html_delta_sum += day["html_delta_sum"]
+            html_before_sum += day["html_before_sum"]
+
+        return {
+            "total_conversations": total,
+            "html_modifications": modified,
+            "modification_rate": round(modified / total * 100, 1) if total > 0 else 0,
+            "common_keywords": dict(sorted(keywords.items(), key=lambda x: x[1], reverse=True)[:10]),
+            "average_html_delta": round(html_delta_sum / modified) if modified else 0,
+            "html_delta_rate": round(html_delta_sum / html_before_sum * 100, 1) if html_before_sum else 0,
+            "daily": {
+                date: {
+                    "total": day["total"],
+                    "modified": day["modified"],
+                    "modification_rate": round(day["modified"] / day["total"] * 100, 1) if day["total"] else 0,
+                    "average_html_delta": round(day["html_delta_sum"] / day["modified"]) if day["modified"] else 0,
+                }
+                for date, day in daily.items()
+            },
+        }
+
+
+# 싱글톤 인스턴스
+_chat_store = None
+
+def get_chat_store() -> ChatHistoryStore:
+    """채팅 학습 기록 저장소 싱글톤 인스턴스 가져오기"""
+    global _chat_store
+    if _chat_store is None:
+        _chat_store = ChatHistoryStore()
+    return _chat_store
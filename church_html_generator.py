@@ -4,14 +4,144 @@
 참조 템플릿의 완성도를 그대로 재현하는 프로덕션 레벨 생성기
 """
 
+import os
+import copy
 import json
+import hashlib
 import logging
 import re
-from typing import Dict, List, Any, Optional
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Any, Optional
 from datetime import datetime
 
+from html_stream import iter_slots, slot
+
 logger = logging.getLogger(__name__)
 
+# 외부 CSS/JS 번들 - 모든 주보가 공유하는 CSS/JS를 내용 해시 파일명으로 한 번만 저장
+# (CHURCH_EXTERNAL_ASSETS=1이면 사용, 기본값은 HTML 하나로 완결되는 인라인 모드)
+ASSET_DIR = Path(__file__).parent / "static" / "bulletin"
+ASSET_URL = "/static/bulletin"
+
+_asset_lock = threading.Lock()
+
+# (생성기 클래스, 프리셋 이름, 테마 이름, 추수감사 여부) -> <style> 블록 / CSS 번들 URL
+# 조합은 교회 프리셋 × THEMES 수뿐이라 처음 쓰일 때 만들어 두고 계속 재사용
+_css_cache: Dict[tuple, str] = {}
+_css_links: Dict[tuple, str] = {}
+
+
+def external_assets_enabled() -> bool:
+    return os.getenv("CHURCH_EXTERNAL_ASSETS", "").lower() in ("1", "true", "yes", "on")
+
+
+def write_asset_bundle(content: str, suffix: str) -> str:
+    """bulletin-<sha256 앞 12자리><suffix>로 저장하고 URL 반환 (같은 내용은 한 번만 기록)
+
+    서버 실행 중에 static/bulletin/이 정리될 수 있으므로 메모 없이 매번 파일 존재를 확인
+    """
+    data = content.encode("utf-8")
+    name = f"bulletin-{hashlib.sha256(data).hexdigest()[:12]}{suffix}"
+    with _asset_lock:
+        path = ASSET_DIR / name
+        if not path.exists():
+            ASSET_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{name}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            logger.info(f"주보 번들 저장: {name} ({len(data):,} bytes)")
+    return f"{ASSET_URL}/{name}"
+
+
+# 섹션 모델 (증분 재생성) - 모델 구조가 바뀌면 올림
+MODEL_VERSION = 1
+
+
+def _code_version() -> str:
+    """생성 코드가 바뀌면(배포) 캐시된 섹션 HTML을 쓰지 않도록 모듈 파일 상태를 지문에 포함"""
+    versions = []
+    for path in (Path(__file__), Path(__file__).parent / "learning_data" / "church_bulletin" / "bulletin_ai.py"):
+        try:
+            stat = path.stat()
+            versions.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        except OSError:
+            versions.append("")
+    return "/".join(versions)
+
+
+_CODE_VERSION = _code_version()
+
+
+class _TrackedInfo(dict):
+    """섹션 생성 중 읽은 info 최상위 키 기록 - 전체를 순회하면 '*'"""
+
+    def __init__(self, data: Dict):
+        super().__init__(data)
+        self.accessed = set()
+
+    def __getitem__(self, key):
+        self.accessed.add(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.accessed.add(key)
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        self.accessed.add(key)
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self.accessed.add("*")
+        return super().__iter__()
+
+    def keys(self):
+        self.accessed.add("*")
+        return super().keys()
+
+    def values(self):
+        self.accessed.add("*")
+        return super().values()
+
+    def items(self):
+        self.accessed.add("*")
+        return super().items()
+
+
+def _fingerprint(data: Dict, keys: List[str]) -> str:
+    """data에서 keys 값만 뽑아 만든 지문 ('*'이면 전체)"""
+    selected = data if "*" in keys else {key: data.get(key) for key in keys}
+    encoded = json.dumps(selected, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def apply_model_changes(info: Dict, changes: Dict) -> Dict:
+    """info 사본에 변경 내용 적용 - 키는 최상위 키 또는 점 경로 (리스트는 숫자 인덱스)
+
+    Raises:
+        ValueError: 경로가 잘못됨 (없는 리스트 인덱스, dict/list가 아닌 값 아래 경로 등)
+    """
+    updated = copy.deepcopy(info)
+    for path, value in changes.items():
+        keys = str(path).split(".")
+        target = updated
+        for depth, key in enumerate(keys):
+            last = depth == len(keys) - 1
+            if isinstance(target, list):
+                if not key.lstrip("-").isdigit() or not -len(target) <= int(key) < len(target):
+                    raise ValueError(f"잘못된 목록 위치: {path}")
+                key = int(key)
+            elif not isinstance(target, dict):
+                raise ValueError(f"값을 바꿀 수 없는 경로: {path}")
+            if last:
+                target[key] = value
+            else:
+                if isinstance(target, dict) and not isinstance(target.get(key), (dict, list)):
+                    target[key] = {}
+                target = target[key]
+    return updated
+
 
 class ChurchBulletinGenerator:
     """교회 주보 HTML 생성기"""
@@ -208,16 +338,19 @@ class ChurchBulletinGenerator:
         }
     }
 
-    def __init__(self, church_info: Dict = None):
+    def __init__(self, church_info: Dict = None, external_assets: Optional[bool] = None):
         self.church_info = church_info or self.DEFAULT_CHURCH_INFO
+        # CSS/JS를 static/bulletin/ 번들로 분리할지 (None이면 CHURCH_EXTERNAL_ASSETS 환경변수)
+        self.external_assets = external_assets_enabled() if external_assets is None else external_assets
+        # 마지막 생성의 섹션 모델 (regenerate()/BulletinModelStore용)
+        self.last_model: Optional[Dict] = None
         # 교회별 프리셋 적용
         church_name = self.church_info.get("name", "")
-        if church_name in self.CHURCH_PRESETS:
-            self.preset = self.CHURCH_PRESETS[church_name]
-        else:
-            self.preset = self.CHURCH_PRESETS.get("여의도순복음교회")
+        self.preset_name = church_name if church_name in self.CHURCH_PRESETS else "여의도순복음교회"
+        self.preset = self.CHURCH_PRESETS.get(self.preset_name)
 
-    def generate(self, extracted_data: Dict, title: str = "", theme: str = "default") -> str:
+    def generate(self, extracted_data: Dict, title: str = "", theme: str = "default",
+                 bulletin_session=None) -> str:
         """
         주보 HTML 생성
 
@@ -225,10 +358,20 @@ class ChurchBulletinGenerator:
             extracted_data: OCR로 추출된 주보 데이터
             title: 주보 제목
             theme: 테마 (default, harvest, christmas, easter)
+            bulletin_session: 이번 변환에 쓰는 BulletinAI 세션 (없으면 새 세션 생성)
 
         Returns:
             완성된 HTML 문자열
         """
+        return "".join(self.generate_chunks(extracted_data, title, theme, bulletin_session))
+
+    def generate_chunks(self, extracted_data: Dict, title: str = "", theme: str = "default",
+                        bulletin_session=None) -> Iterator[str]:
+        """
+        주보 HTML을 청크 단위로 생성 (OutputDelivery.write_output / StreamingResponse에 그대로 전달)
+
+        섹션 생성과 last_model 기록은 호출 시점에 끝나고, 반환된 이터레이터는 골격과 섹션을 이어 붙이기만 함
+        """
         # 주보 정보 추출
         info = self._extract_bulletin_info(extracted_data)
 
@@ -240,9 +383,9 @@ class ChurchBulletinGenerator:
         is_harvest = theme_vars.get("is_harvest", False)
 
         # HTML 생성
-        html = self._build_html(info, theme_vars, theme, is_harvest)
+        parts = self._build_parts(info, theme_vars, theme, is_harvest, bulletin_session)
 
-        return html
+        return self._iter_html(parts)
 
     def _extract_bulletin_info(self, extracted_data: Dict) -> Dict:
         """OCR 데이터에서 주보 정보 추출"""
@@ -1000,12 +1143,17 @@ class ChurchBulletinGenerator:
 
         return news[:8]  # 최대 8개
 
-    def _build_html(self, info: Dict, theme: Dict, theme_name: str, is_harvest: bool) -> str:
-        """HTML 구조 생성 - 전문가 템플릿 기반"""
+    def _build_parts(self, info: Dict, theme: Dict, theme_name: str, is_harvest: bool,
+                     bulletin_session=None) -> Dict[str, str]:
+        """섹션별 HTML 생성 - 전문가 템플릿 기반 (골격 배치는 _iter_html)
+
+        생성 후 섹션 모델(info + 섹션별 HTML/입력 지문)을 self.last_model에 남겨
+        regenerate()로 바뀐 섹션만 다시 만들 수 있게 함
+        """
 
         # ========== BulletinAI v3.0: 섹션별 데이터 추출 ==========
-        from learning_data.church_bulletin import get_bulletin_ai
-        ai = get_bulletin_ai()
+        from learning_data.church_bulletin import create_bulletin_session
+        ai = bulletin_session or create_bulletin_session()
 
         # 원본 extracted_data 가져오기 (info에 저장되어 있음)
         extracted_data = info.get("_extracted_data", {})
@@ -1020,17 +1168,109 @@ class ChurchBulletinGenerator:
         info["sermon_word"] = sermon_word_data
         print(f"[BulletinAI] 생명의 말씀: {sermon_word_data.get('title', '없음')}")
 
-        # 명성교회: '지난주 말씀'을 '새벽기도회' 뒤에 배치
-        show_sermon_card = self.preset.get("show_sermon_card", True)
+        # 섹션 3: 예배 순서 - 세션에서 추출된 데이터도 모델에 보관 (재생성 시 세션 없이 사용)
+        info["worship_order"] = ai.extracted_data.get("worship_services", {})
 
-        # 지난주 말씀 섹션 (위치에 따라 다르게 배치)
-        last_week_sermon_early = self._build_last_week_sermon(info) if show_sermon_card else ""
-        last_week_sermon_late = self._build_last_week_sermon(info) if not show_sermon_card else ""
+        model_info = {key: value for key, value in info.items() if key != "_extracted_data"}
+        parts = {}
+        for part_id, builder in self._html_parts(theme, theme_name, is_harvest, ai):
+            parts[part_id] = self._render_part(builder, model_info)
 
-        return f'''<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
+        self.last_model = {
+            "version": MODEL_VERSION,
+            "context": self._model_context(theme_name),
+            "theme": theme_name,
+            "info": model_info,
+            "parts": parts,
+        }
+        return {part_id: part["html"] for part_id, part in parts.items()}
+
+    def _html_parts(self, theme: Dict, theme_name: str, is_harvest: bool, ai=None) -> List[tuple]:
+        """(섹션 id, info -> HTML) 목록 - 각 섹션은 info에서 읽은 키로만 다시 생성 여부를 판단"""
+        def session():
+            # 재생성 시에는 필요한 섹션이 있을 때만 세션 생성 (HTML 생성은 API를 호출하지 않음)
+            nonlocal ai
+            if ai is None:
+                from learning_data.church_bulletin import create_bulletin_session
+                ai = create_bulletin_session()
+            return ai
+
+        return [
+            ("head", lambda info: self._build_head(info, theme)),
+            ("style", lambda info: self._get_style(theme, is_harvest, theme_name)),
+            ("header", lambda info: self._build_header(info, theme, is_harvest, theme_name)),
+            ("nav-tabs", lambda info: self._build_nav_tabs()),
+            ("dark-mode-toggle", lambda info: self._build_dark_mode_toggle()),
+            ("todays-word", lambda info: self._generate_verse_section_via_bulletinai(info, theme, session())),
+            ("worship", lambda info: self._generate_worship_section_via_bulletinai(info, theme, session())),
+            ("life-word", lambda info: self._build_life_word_section(info, theme_name)),
+            ("sermon-replay", lambda info: self._build_sermon_replay_section(info, theme_name)),
+            ("contact", lambda info: self._build_contact_section(info)),
+            ("sns-offering", lambda info: self._build_sns_offering_section()),
+            ("share", lambda info: self._build_share_section(is_harvest, theme_name)),
+            ("footer", lambda info: self._build_footer(info, is_harvest)),
+            ("modals", lambda info: self._build_modals()),
+            ("script", lambda info: self._get_javascript(info)),
+        ]
+
+    @staticmethod
+    def _render_part(builder, info: Dict) -> Dict:
+        """섹션 하나 생성 + 읽은 info 키와 그 값의 지문 기록"""
+        tracked = _TrackedInfo(info)
+        html = builder(tracked)
+        keys = sorted(tracked.accessed)
+        return {"keys": keys, "fingerprint": _fingerprint(info, keys), "html": html}
+
+    def _model_context(self, theme_name: str) -> str:
+        """info 밖에서 HTML에 영향을 주는 값 (생성기/프리셋/교회 정보/테마/번들 모드/코드 버전)"""
+        return _fingerprint({
+            "generator": type(self).__qualname__,
+            "preset": self.preset_name,
+            "church_info": self.church_info,
+            "theme": theme_name,
+            "external_assets": self.external_assets,
+            "code": _CODE_VERSION,
+        }, ["generator", "preset", "church_info", "theme", "external_assets", "code"])
+
+    def regenerate(self, model: Dict, changes: Optional[Dict] = None) -> tuple:
+        """
+        캐시된 섹션 모델에서 입력이 바뀐 섹션만 다시 생성 (PDF 분석/BulletinAI 추출 없음)
+
+        Args:
+            model: 이전 생성의 last_model (BulletinModelStore에서 읽은 모델)
+            changes: info 변경 내용 - 최상위 키 {"slogan": "..."} 또는 점 경로
+                     {"worship_order.order_items.3.content": "찬송 305장"}
+
+        Returns:
+            (HTML, 새 모델, 다시 생성한 섹션 id 목록)
+        """
+        theme_name = model.get("theme", "default")
+        theme = self.THEMES.get(theme_name, self.THEMES["default"])
+        is_harvest = theme.get("is_harvest", False)
+
+        info = apply_model_changes(model.get("info", {}), changes or {})
+        context = self._model_context(theme_name)
+        # 생성기/프리셋/코드가 바뀌었으면 모든 섹션을 다시 생성
+        old_parts = model.get("parts", {}) if (model.get("version") == MODEL_VERSION
+                                                and model.get("context") == context) else {}
+
+        parts = {}
+        rebuilt = []
+        for part_id, builder in self._html_parts(theme, theme_name, is_harvest):
+            old = old_parts.get(part_id)
+            if old and _fingerprint(info, old["keys"]) == old["fingerprint"]:
+                parts[part_id] = old
+                continue
+            parts[part_id] = self._render_part(builder, info)
+            rebuilt.append(part_id)
+
+        new_model = {**model, "version": MODEL_VERSION, "context": context, "info": info, "parts": parts}
+        self.last_model = new_model
+        return self._assemble_html({part_id: part["html"] for part_id, part in parts.items()}), new_model, rebuilt
+
+    def _build_head(self, info: Dict, theme: Dict) -> str:
+        """<head> 메타 태그 (제목/설명/PWA)"""
+        return f'''    <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0, minimum-scale=1.0, maximum-scale=5.0, user-scalable=yes">
     <title>{info["church_name"]} 주보 - {info["date"]}</title>
     <meta name="description" content="{info["church_name"]} {info["date"]} 주보 - {info.get('sermon', {}).get('title', '')}">
@@ -1040,30 +1280,46 @@ class ChurchBulletinGenerator:
     <meta name="apple-mobile-web-app-status-bar-style" content="black-translucent">
     <meta name="apple-mobile-web-app-title" content="{info["church_name"]}">
     <link rel="apple-touch-icon" href="data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>⛪</text></svg>">
-    <meta name="theme-color" content="{theme["theme_color"]}">
-    {self._get_css(theme, is_harvest, theme_name)}
+    <meta name="theme-color" content="{theme["theme_color"]}">'''
+
+    def _assemble_html(self, parts: Dict[str, str]) -> str:
+        """섹션별 HTML을 페이지 골격에 배치"""
+        return "".join(self._iter_html(parts))
+
+    def _iter_html(self, parts: Dict[str, str]) -> Iterator[str]:
+        """페이지 골격 조각과 섹션 HTML을 순서대로 반환 (문서 전체를 한 문자열로 합치지 않음)"""
+        return iter_slots(self._layout(), parts)
+
+    @staticmethod
+    def _layout() -> str:
+        """페이지 골격 - 섹션 자리는 slot(섹션 id)"""
+        return f'''<!DOCTYPE html>
+<html lang="ko">
+<head>
+{slot("head")}
+    {slot("style")}
 </head>
 <body>
-    {self._build_header(info, theme, is_harvest, theme_name)}
-    {self._build_nav_tabs()}
-    {self._build_dark_mode_toggle()}
+    {slot("header")}
+    {slot("nav-tabs")}
+    {slot("dark-mode-toggle")}
 
     <main class="container">
         <!-- 오늘의 말씀 (BulletinAI 생성) -->
         <section id="todays-word" class="section" style="padding: 0;">
-            {self._generate_verse_section_via_bulletinai(info, theme)}
+            {slot("todays-word")}
         </section>
 
         <!-- 예배 안내 (BulletinAI 생성) -->
         <section id="worship" class="section" style="padding: 0;">
-            {self._generate_worship_section_via_bulletinai(info, theme)}
+            {slot("worship")}
         </section>
 
         <!-- 📖 생명의 말씀 (4페이지 설교 전문 - BulletinAI 생성) -->
-        {self._build_life_word_section(info, theme_name)}
+        {slot("life-word")}
 
         <!-- 🎧 지난 설교 다시듣기 -->
-        {self._build_sermon_replay_section(info, theme_name)}
+        {slot("sermon-replay")}
 
         <!-- 오늘의 양식 (빈 섹션) -->
         <section id="devotional" class="section">
@@ -1083,18 +1339,50 @@ class ChurchBulletinGenerator:
             <div class="section-body"><p style="color:#999; text-align:center;">내용 없음</p></div>
         </section>
 
-        {self._build_contact_section(info)}
-        {self._build_sns_offering_section()}
-        {self._build_share_section(is_harvest, theme_name)}
+        {slot("contact")}
+        {slot("sns-offering")}
+        {slot("share")}
     </main>
 
-    {self._build_footer(info, is_harvest)}
-    {self._build_modals()}
-    {self._get_javascript(info)}
+    {slot("footer")}
+    {slot("modals")}
+    {slot("script")}
 </body>
 </html>'''
 
+    def _css_key(self, theme: Dict, is_harvest: bool, theme_name: str) -> Optional[tuple]:
+        """CSS 캐시 키 - THEMES에 있는 테마일 때만 (그 외 테마 dict는 매번 생성)"""
+        if self.THEMES.get(theme_name) is not theme:
+            return None
+        return (type(self), self.preset_name, theme_name, bool(is_harvest))
+
+    def _get_style(self, theme: Dict, is_harvest: bool, theme_name: str = "default") -> str:
+        """<head>에 넣을 스타일 - 외부 번들 모드면 CSS를 해시 파일로 저장하고 <link>만 반환"""
+        css = self._get_css(theme, is_harvest, theme_name)
+        if not self.external_assets:
+            return css
+
+        # 번들 파일이 지워졌으면(static/bulletin/ 정리) 다시 기록
+        key = self._css_key(theme, is_harvest, theme_name)
+        url = _css_links.get(key) if key else None
+        if url is None or not (ASSET_DIR / url.rsplit("/", 1)[-1]).exists():
+            css = css.strip().removeprefix("<style>").removesuffix("</style>")
+            url = write_asset_bundle(css, ".css")
+            if key:
+                _css_links[key] = url
+        return f'<link rel="stylesheet" href="{url}">'
+
     def _get_css(self, theme: Dict, is_harvest: bool, theme_name: str = "default") -> str:
+        """CSS 스타일 (생성기 종류/프리셋/테마/추수감사 여부별로 처음 한 번만 생성해 재사용)"""
+        key = self._css_key(theme, is_harvest, theme_name)
+        if key is None:
+            return self._build_css(theme, is_harvest, theme_name)
+        css = _css_cache.get(key)
+        if css is None:
+            css = _css_cache.setdefault(key, self._build_css(theme, is_harvest, theme_name))
+        return css
+
+    def _build_css(self, theme: Dict, is_harvest: bool, theme_name: str = "default") -> str:
         """CSS 스타일 생성 (참조 템플릿 기반, 교회별 프리셋 적용)"""
         harvest_vars = ""
         if is_harvest:
@@ -4804,15 +5092,13 @@ class ChurchBulletinGenerator:
         </button>
     </div>'''
 
-    def _generate_verse_section_via_bulletinai(self, info: Dict, theme: Dict) -> str:
+    def _generate_verse_section_via_bulletinai(self, info: Dict, theme: Dict, ai) -> str:
         """
         BulletinAI를 통해 오늘의 말씀 섹션 생성
 
         원칙: 전문가가 직접 코드를 작성하지 않고 BulletinAI가 학습된 규칙에 따라 생성
         """
         try:
-            from learning_data.church_bulletin import get_bulletin_ai
-            ai = get_bulletin_ai()
             verse_data = info.get("verse", {})
             return ai.generate_todays_verse_html(verse_data, theme)
         except Exception as e:
@@ -4826,7 +5112,7 @@ class ChurchBulletinGenerator:
                 return f'<div style="padding:20px;"><p>{text}</p><p style="text-align:right;">{ref}</p></div>'
             return '<p style="color:#999; text-align:center;">내용 없음</p>'
 
-    def _generate_worship_section_via_bulletinai(self, info: Dict, theme: Dict) -> str:
+    def _generate_worship_section_via_bulletinai(self, info: Dict, theme: Dict, ai) -> str:
         """
         BulletinAI를 통해 예배순서 섹션 생성
 
@@ -4837,11 +5123,8 @@ class ChurchBulletinGenerator:
         4. 이전 데이터 재활용 금지
         """
         try:
-            from learning_data.church_bulletin import get_bulletin_ai
-            ai = get_bulletin_ai()
-
-            # BulletinAI에서 추출된 예배 순서 데이터 가져오기
-            worship_data = ai.extracted_data.get("worship_services", {})
+            # BulletinAI에서 추출된 예배 순서 데이터 가져오기 (생성 시 info["worship_order"]에 보관)
+            worship_data = info.get("worship_order") or ai.extracted_data.get("worship_services", {})
 
             # 데이터가 없으면 info에서 가져오기 시도
             if not worship_data or not worship_data.get("section_title"):
@@ -7030,59 +7313,63 @@ class ChurchBulletinGenerator:
         </div>
     </div>'''
 
-    def _get_javascript(self, info: Dict) -> str:
-        """JavaScript 코드 - 전문가 수준 8개국어 지원"""
-        church_name = info.get("church_name", "교회")
-        date = info.get("date", "")
+    def _get_bulletin_data(self, info: Dict) -> Dict:
+        """주보별 데이터 (교회명/날짜, AI 번역, 오늘의 말씀) - 주보마다 달라 HTML에 인라인으로 남는 부분"""
         verse_text = info.get("verse", {}).get("text", "")
         verse_ref = info.get("verse", {}).get("reference", "")
-        sermon = info.get("sermon", {})
-        devotional = info.get("devotional", {})
 
-        # AI 번역 데이터 가져오기
+        # AI 번역 데이터 (각 언어별) - 값이 있는 항목만
         ai_translations = info.get("translations", {})
+        translation_keys = ["verse_text", "sermon_title", "sermon_intro", "devotional_title", "devotional_content"]
+        for i in range(1, 6):
+            translation_keys += [f"sermon_point{i}_title", f"sermon_point{i}_content"]
 
-        # 동적 번역 데이터 생성 (각 언어별) - 전문가 수준 확장
-        def get_dynamic_trans(lang):
+        translations = {}
+        for lang in ("ko", "en", "zh", "ja", "id", "es", "ru", "fr"):
             trans = ai_translations.get(lang, {})
-            entries = []
-            if trans.get("verse_text"):
-                entries.append(f'verse_text: `{trans["verse_text"].replace("`", "\\`")}`')
-            if trans.get("sermon_title"):
-                entries.append(f'sermon_title: `{trans["sermon_title"].replace("`", "\\`")}`')
-            if trans.get("sermon_intro"):
-                entries.append(f'sermon_intro: `{trans["sermon_intro"].replace("`", "\\`")}`')
-            if trans.get("devotional_title"):
-                entries.append(f'devotional_title: `{trans["devotional_title"].replace("`", "\\`")}`')
-            if trans.get("devotional_content"):
-                # 긴 콘텐츠는 줄바꿈 처리
-                content = trans["devotional_content"].replace("`", "\\`").replace("\n", "\\n")
-                entries.append(f'devotional_content: `{content}`')
-            # 설교 포인트
-            for i in range(1, 6):
-                if trans.get(f"sermon_point{i}_title"):
-                    entries.append(f'sermon_point{i}_title: `{trans[f"sermon_point{i}_title"].replace("`", "\\`")}`')
-                if trans.get(f"sermon_point{i}_content"):
-                    entries.append(f'sermon_point{i}_content: `{trans[f"sermon_point{i}_content"].replace("`", "\\`")}`')
-            return ", ".join(entries)
-
-        ko_dynamic = get_dynamic_trans("ko")
-        en_dynamic = get_dynamic_trans("en")
-        zh_dynamic = get_dynamic_trans("zh")
-        ja_dynamic = get_dynamic_trans("ja")
-        id_dynamic = get_dynamic_trans("id")
-        es_dynamic = get_dynamic_trans("es")
-        ru_dynamic = get_dynamic_trans("ru")
-        fr_dynamic = get_dynamic_trans("fr")
-
-        # 한국어 기본값 (AI 번역 없는 경우)
-        ko_verse_text = verse_text.replace('"', '\\"').replace("'", "\\'") if verse_text else ""
+            entries = {key: trans[key] for key in translation_keys if trans.get(key)}
+            if lang == "ko":
+                # 한국어 기본값 (AI 번역 없는 경우)
+                entries = {"verse_text": verse_text, **entries}
+            if entries:
+                translations[lang] = entries
 
-        return f'''
+        return {
+            "churchName": info.get("church_name", "교회"),
+            "date": info.get("date", ""),
+            "translations": translations,
+            "mainVerse": {
+                "ko": {"title": verse_ref, "content": verse_text},
+                "en": {"title": self._get_english_bible_ref(verse_ref), "content": self._translate_verse_to_english(verse_text)},
+                "zh": {"title": self._get_chinese_bible_ref(verse_ref), "content": ""},
+                "ja": {"title": self._get_japanese_bible_ref(verse_ref), "content": ""},
+                "id": {"title": self._get_indonesian_bible_ref(verse_ref), "content": ""},
+                "es": {"title": self._get_spanish_bible_ref(verse_ref), "content": ""},
+                "ru": {"title": self._get_russian_bible_ref(verse_ref), "content": ""},
+                "fr": {"title": self._get_french_bible_ref(verse_ref), "content": ""},
+            },
+        }
+
+    def _get_javascript(self, info: Dict) -> str:
+        """JavaScript 코드 - 주보별 데이터(인라인) + 공통 스크립트(인라인 또는 외부 번들)"""
+        # </script>가 데이터 안에 있어도 스크립트 블록이 끊기지 않도록 이스케이프
+        data = json.dumps(self._get_bulletin_data(info), ensure_ascii=False).replace("</", "<\\/")
+        data_script = f"""
     <script>
+        // ========== 주보별 데이터 (번역/오늘의 말씀) ==========
+        const bulletinData = {data};
+    </script>"""
+
+        if self.external_assets:
+            return data_script + f'\n    <script src="{write_asset_bundle(self._get_static_javascript(), ".js")}"></script>'
+        return data_script + f"\n    <script>{self._get_static_javascript()}    </script>"
+
+    def _get_static_javascript(self) -> str:
+        """공통 JavaScript - 전문가 수준 8개국어 지원 (주보별 값은 bulletinData에서 읽음)"""
+        return '''
         // ========== 다국어 번역 시스템 ==========
-        const translations = {{
-            ko: {{
+        const translations = {
+            ko: {
                 nav_sermon: "말씀",
                 nav_worship: "예배",
                 nav_news: "소식",
@@ -7098,10 +7385,9 @@ class ChurchBulletinGenerator:
                 section_contact: "교회 안내",
                 btn_share: "공유하기",
                 btn_copy: "복사",
-                btn_offering: "헌금",
-                verse_text: `{ko_verse_text}`{', ' + ko_dynamic if ko_dynamic else ''}
-            }},
-            en: {{
+                btn_offering: "헌금"
+            },
+            en: {
                 nav_sermon: "Sermon",
                 nav_worship: "Worship",
                 nav_news: "News",
@@ -7117,9 +7403,9 @@ class ChurchBulletinGenerator:
                 section_contact: "Church Info",
                 btn_share: "Share",
                 btn_copy: "Copy",
-                btn_offering: "Offering"{', ' + en_dynamic if en_dynamic else ''}
-            }},
-            zh: {{
+                btn_offering: "Offering"
+            },
+            zh: {
                 nav_sermon: "讲道",
                 nav_worship: "礼拜",
                 nav_news: "消息",
@@ -7135,9 +7421,9 @@ class ChurchBulletinGenerator:
                 section_contact: "教会信息",
                 btn_share: "分享",
                 btn_copy: "复制",
-                btn_offering: "奉献"{', ' + zh_dynamic if zh_dynamic else ''}
-            }},
-            ja: {{
+                btn_offering: "奉献"
+            },
+            ja: {
                 nav_sermon: "説教",
                 nav_worship: "礼拝",
                 nav_news: "お知らせ",
@@ -7153,9 +7439,9 @@ class ChurchBulletinGenerator:
                 section_contact: "教会案内",
                 btn_share: "共有",
                 btn_copy: "コピー",
-                btn_offering: "献金"{', ' + ja_dynamic if ja_dynamic else ''}
-            }},
-            id: {{
+                btn_offering: "献金"
+            },
+            id: {
                 nav_sermon: "Khotbah",
                 nav_worship: "Ibadah",
                 nav_news: "Berita",
@@ -7171,9 +7457,9 @@ class ChurchBulletinGenerator:
                 section_contact: "Info Gereja",
                 btn_share: "Bagikan",
                 btn_copy: "Salin",
-                btn_offering: "Persembahan"{', ' + id_dynamic if id_dynamic else ''}
-            }},
-            es: {{
+                btn_offering: "Persembahan"
+            },
+            es: {
                 nav_sermon: "Sermón",
                 nav_worship: "Culto",
                 nav_news: "Noticias",
@@ -7189,9 +7475,9 @@ class ChurchBulletinGenerator:
                 section_contact: "Info de la Iglesia",
                 btn_share: "Compartir",
                 btn_copy: "Copiar",
-                btn_offering: "Ofrenda"{', ' + es_dynamic if es_dynamic else ''}
-            }},
-            ru: {{
+                btn_offering: "Ofrenda"
+            },
+            ru: {
                 nav_sermon: "Проповедь",
                 nav_worship: "Богослужение",
                 nav_news: "Новости",
@@ -7207,9 +7493,9 @@ class ChurchBulletinGenerator:
                 section_contact: "Информация о церкви",
                 btn_share: "Поделиться",
                 btn_copy: "Копировать",
-                btn_offering: "Пожертвование"{', ' + ru_dynamic if ru_dynamic else ''}
-            }},
-            fr: {{
+                btn_offering: "Пожертвование"
+            },
+            fr: {
                 nav_sermon: "Sermon",
                 nav_worship: "Culte",
                 nav_news: "Actualités",
@@ -7225,15 +7511,20 @@ class ChurchBulletinGenerator:
                 section_contact: "Infos de l'Église",
                 btn_share: "Partager",
                 btn_copy: "Copier",
-                btn_offering: "Offrande"{', ' + fr_dynamic if fr_dynamic else ''}
-            }}
-        }};
+                btn_offering: "Offrande"
+            }
+        };
+
+        // 주보별 번역(말씀/설교/묵상)을 공통 번역에 덮어씀
+        Object.keys(bulletinData.translations).forEach(function(lang) {
+            translations[lang] = Object.assign(translations[lang] || {}, bulletinData.translations[lang]);
+        });
 
         let currentLanguage = 'ko';
 
-        function changeLanguage(lang) {{
+        function changeLanguage(lang) {
             currentLanguage = lang;
-            document.querySelectorAll('[data-i18n]').forEach(el => {{
+            document.querySelectorAll('[data-i18n]').forEach(el => {
                 const key = el.getAttribute('data-i18n');
                 // 선택한 언어 -> 영어 -> 한국어 순으로 폴백
                 const text = (translations[lang] && translations[lang][key])
@@ -7241,149 +7532,140 @@ class ChurchBulletinGenerator:
                     || (translations['ko'] && translations['ko'][key])
                     || el.textContent;
                 el.textContent = text;
-            }});
+            });
             localStorage.setItem('church_bulletin_lang', lang);
-        }}
+        }
 
         // 페이지 로드 시 저장된 언어 복원
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', function() {
             const savedLang = localStorage.getItem('church_bulletin_lang');
-            if (savedLang && translations[savedLang]) {{
+            if (savedLang && translations[savedLang]) {
                 document.querySelector('.language-selector').value = savedLang;
                 changeLanguage(savedLang);
-            }}
-        }});
+            }
+        });
 
         // ========== 성경 구절 데이터 (다국어 - 전문가 수준) ==========
-        const bibleVerses = {{
-            'main-verse': {{
-                ko: {{ title: '{verse_ref}', content: `{verse_text.replace('"', '\\"').replace("'", "\\'")}` }},
-                en: {{ title: '{self._get_english_bible_ref(verse_ref)}', content: `{self._translate_verse_to_english(verse_text)}` }},
-                zh: {{ title: '{self._get_chinese_bible_ref(verse_ref)}', content: '' }},
-                ja: {{ title: '{self._get_japanese_bible_ref(verse_ref)}', content: '' }},
-                id: {{ title: '{self._get_indonesian_bible_ref(verse_ref)}', content: '' }},
-                es: {{ title: '{self._get_spanish_bible_ref(verse_ref)}', content: '' }},
-                ru: {{ title: '{self._get_russian_bible_ref(verse_ref)}', content: '' }},
-                fr: {{ title: '{self._get_french_bible_ref(verse_ref)}', content: '' }}
-            }},
+        const bibleVerses = {
+            'main-verse': bulletinData.mainVerse,
             // 누가복음 3:4-6 (대림절/강림절 핵심 말씀)
-            'luke-3-4': {{
-                ko: {{ title: '누가복음 3:4~6', content: '선지자 이사야의 책에 쓴 바 광야에서 외치는 자의 소리가 있어 이르되 너희는 주의 길을 준비하라 그의 오실 길을 곧게 하라 모든 골짜기가 메워지고 모든 산과 작은 산이 낮아지고 굽은 것이 곧아지고 험한 길이 평탄하여질 것이요 모든 육체가 하나님의 구원하심을 보리라 하였느니라' }},
-                en: {{ title: 'Luke 3:4-6', content: 'As it is written in the book of the words of Isaiah the prophet: "A voice of one calling in the wilderness, Prepare the way for the Lord, make straight paths for him. Every valley shall be filled in, every mountain and hill made low. The crooked roads shall become straight, the rough ways smooth. And all people will see God\\'s salvation."' }},
-                zh: {{ title: '路加福音 3:4-6', content: '正如先知以赛亚书上所记的话，说：在旷野有人声喊着说：预备主的道，修直他的路！一切山洼都要填满；大小山冈都要削平！弯弯曲曲的地方要改为正直；高高低低的道路要改为平坦！凡有血气的，都要见神的救恩！' }},
-                ja: {{ title: 'ルカ 3:4-6', content: '預言者イザヤの書に書いてあるとおりである。「荒野で叫ぶ者の声がする。『主の道を用意し、その道筋をまっすぐにせよ。すべての谷は埋められ、すべての山と丘は低くされる。曲がった道はまっすぐになり、でこぼこ道は平らになる。こうして、すべての肉なる者が神の救いを見る。』」' }},
-                id: {{ title: 'Lukas 3:4-6', content: 'seperti ada tertulis dalam kitab nubuat-nubuat Yesaya: Ada suara yang berseru-seru di padang gurun: Persiapkanlah jalan untuk Tuhan, luruskanlah jalan bagi-Nya. Setiap lembah akan ditimbun dan setiap gunung dan bukit akan menjadi rata, yang berliku-liku akan diluruskan, yang berlekak-lekuk akan diratakan, dan semua orang akan melihat keselamatan yang dari Allah.' }},
-                es: {{ title: 'Lucas 3:4-6', content: 'como está escrito en el libro de las palabras del profeta Isaías: Voz del que clama en el desierto: Preparad el camino del Señor, enderezad sus sendas. Todo valle será rellenado, y todo monte y collado será bajado; los caminos torcidos serán enderezados, y los caminos ásperos allanados; y verá toda carne la salvación de Dios.' }},
-                ru: {{ title: 'Луки 3:4-6', content: 'как написано в книге слов пророка Исаии: глас вопиющего в пустыне: приготовьте путь Господу, прямыми сделайте стези Ему; всякий дол да наполнится, и всякая гора и холм да понизятся, кривизны выпрямятся и неровные пути сделаются гладкими; и узрит всякая плоть спасение Божие.' }},
-                fr: {{ title: 'Luc 3:4-6', content: 'selon ce qui est écrit dans le livre des paroles du prophète Ésaïe: C\\'est la voix de celui qui crie dans le désert: Préparez le chemin du Seigneur, Aplanissez ses sentiers. Toute vallée sera comblée, Toute montagne et toute colline seront abaissées; Ce qui est tortueux sera redressé, Et les chemins raboteux seront aplanis. Et toute chair verra le salut de Dieu.' }}
-            }},
+            'luke-3-4': {
+                ko: { title: '누가복음 3:4~6', content: '선지자 이사야의 책에 쓴 바 광야에서 외치는 자의 소리가 있어 이르되 너희는 주의 길을 준비하라 그의 오실 길을 곧게 하라 모든 골짜기가 메워지고 모든 산과 작은 산이 낮아지고 굽은 것이 곧아지고 험한 길이 평탄하여질 것이요 모든 육체가 하나님의 구원하심을 보리라 하였느니라' },
+                en: { title: 'Luke 3:4-6', content: 'As it is written in the book of the words of Isaiah the prophet: "A voice of one calling in the wilderness, Prepare the way for the Lord, make straight paths for him. Every valley shall be filled in, every mountain and hill made low. The crooked roads shall become straight, the rough ways smooth. And all people will see God\\'s salvation."' },
+                zh: { title: '路加福音 3:4-6', content: '正如先知以赛亚书上所记的话，说：在旷野有人声喊着说：预备主的道，修直他的路！一切山洼都要填满；大小山冈都要削平！弯弯曲曲的地方要改为正直；高高低低的道路要改为平坦！凡有血气的，都要见神的救恩！' },
+                ja: { title: 'ルカ 3:4-6', content: '預言者イザヤの書に書いてあるとおりである。「荒野で叫ぶ者の声がする。『主の道を用意し、その道筋をまっすぐにせよ。すべての谷は埋められ、すべての山と丘は低くされる。曲がった道はまっすぐになり、でこぼこ道は平らになる。こうして、すべての肉なる者が神の救いを見る。』」' },
+                id: { title: 'Lukas 3:4-6', content: 'seperti ada tertulis dalam kitab nubuat-nubuat Yesaya: Ada suara yang berseru-seru di padang gurun: Persiapkanlah jalan untuk Tuhan, luruskanlah jalan bagi-Nya. Setiap lembah akan ditimbun dan setiap gunung dan bukit akan menjadi rata, yang berliku-liku akan diluruskan, yang berlekak-lekuk akan diratakan, dan semua orang akan melihat keselamatan yang dari Allah.' },
+                es: { title: 'Lucas 3:4-6', content: 'como está escrito en el libro de las palabras del profeta Isaías: Voz del que clama en el desierto: Preparad el camino del Señor, enderezad sus sendas. Todo valle será rellenado, y todo monte y collado será bajado; los caminos torcidos serán enderezados, y los caminos ásperos allanados; y verá toda carne la salvación de Dios.' },
+                ru: { title: 'Луки 3:4-6', content: 'как написано в книге слов пророка Исаии: глас вопиющего в пустыне: приготовьте путь Господу, прямыми сделайте стези Ему; всякий дол да наполнится, и всякая гора и холм да понизятся, кривизны выпрямятся и неровные пути сделаются гладкими; и узрит всякая плоть спасение Божие.' },
+                fr: { title: 'Luc 3:4-6', content: 'selon ce qui est écrit dans le livre des paroles du prophète Ésaïe: C\\'est la voix de celui qui crie dans le désert: Préparez le chemin du Seigneur, Aplanissez ses sentiers. Toute vallée sera comblée, Toute montagne et toute colline seront abaissées; Ce qui est tortueux sera redressé, Et les chemins raboteux seront aplanis. Et toute chair verra le salut de Dieu.' }
+            },
             // 빌립보서 1:3-8 (감사)
-            'phil-1-3': {{
-                ko: {{ title: '빌립보서 1:3~8', content: '내가 너희를 생각할 때마다 나의 하나님께 감사하며 간구할 때마다 너희 모든 사람을 위하여 기쁨으로 항상 간구함은 첫날부터 이제까지 복음을 위한 너희의 교제로 말미암음이라 너희 안에서 착한 일을 시작하신 이가 그리스도 예수의 날까지 이루실 줄을 우리는 확신하노라' }},
-                en: {{ title: 'Philippians 1:3-8', content: 'I thank my God every time I remember you. In all my prayers for all of you, I always pray with joy because of your partnership in the gospel from the first day until now, being confident of this, that he who began a good work in you will carry it on to completion until the day of Christ Jesus.' }},
-                zh: {{ title: '腓立比书 1:3-8', content: '我每逢想念你们，就感谢我的神；每逢为你们众人祈求的时候，常是欢欢喜喜地祈求。因为从头一天直到如今，你们是同心合意地兴旺福音。我深信那在你们心里动了善工的，必成全这工，直到耶稣基督的日子。' }},
-                ja: {{ title: 'ピリピ 1:3-8', content: '私は、あなたがたのことを思うごとに私の神に感謝しています。あなたがたすべてのために祈るごとに、いつも喜びをもって祈り、最初の日から今日まで、福音を広めることにあなたがたが参加してきたことを感謝しています。' }},
-                id: {{ title: 'Filipi 1:3-8', content: 'Aku mengucap syukur kepada Allahku setiap kali aku mengingat kamu. Dan setiap kali aku berdoa untuk kamu semua, aku selalu berdoa dengan sukacita.' }},
-                es: {{ title: 'Filipenses 1:3-8', content: 'Doy gracias a mi Dios siempre que me acuerdo de vosotros, siempre en todas mis oraciones rogando con gozo por todos vosotros.' }},
-                ru: {{ title: 'Филиппийцам 1:3-8', content: 'Благодарю Бога моего при всяком воспоминании о вас, всегда во всякой молитве моей за всех вас принося с радостью молитву мою.' }},
-                fr: {{ title: 'Philippiens 1:3-8', content: 'Je rends grâces à mon Dieu de tout le souvenir que je garde de vous.' }}
-            }},
+            'phil-1-3': {
+                ko: { title: '빌립보서 1:3~8', content: '내가 너희를 생각할 때마다 나의 하나님께 감사하며 간구할 때마다 너희 모든 사람을 위하여 기쁨으로 항상 간구함은 첫날부터 이제까지 복음을 위한 너희의 교제로 말미암음이라 너희 안에서 착한 일을 시작하신 이가 그리스도 예수의 날까지 이루실 줄을 우리는 확신하노라' },
+                en: { title: 'Philippians 1:3-8', content: 'I thank my God every time I remember you. In all my prayers for all of you, I always pray with joy because of your partnership in the gospel from the first day until now, being confident of this, that he who began a good work in you will carry it on to completion until the day of Christ Jesus.' },
+                zh: { title: '腓立比书 1:3-8', content: '我每逢想念你们，就感谢我的神；每逢为你们众人祈求的时候，常是欢欢喜喜地祈求。因为从头一天直到如今，你们是同心合意地兴旺福音。我深信那在你们心里动了善工的，必成全这工，直到耶稣基督的日子。' },
+                ja: { title: 'ピリピ 1:3-8', content: '私は、あなたがたのことを思うごとに私の神に感謝しています。あなたがたすべてのために祈るごとに、いつも喜びをもって祈り、最初の日から今日まで、福音を広めることにあなたがたが参加してきたことを感謝しています。' },
+                id: { title: 'Filipi 1:3-8', content: 'Aku mengucap syukur kepada Allahku setiap kali aku mengingat kamu. Dan setiap kali aku berdoa untuk kamu semua, aku selalu berdoa dengan sukacita.' },
+                es: { title: 'Filipenses 1:3-8', content: 'Doy gracias a mi Dios siempre que me acuerdo de vosotros, siempre en todas mis oraciones rogando con gozo por todos vosotros.' },
+                ru: { title: 'Филиппийцам 1:3-8', content: 'Благодарю Бога моего при всяком воспоминании о вас, всегда во всякой молитве моей за всех вас принося с радостью молитву мою.' },
+                fr: { title: 'Philippiens 1:3-8', content: 'Je rends grâces à mon Dieu de tout le souvenir que je garde de vous.' }
+            },
             // 요한복음 1:14 (성탄절/말씀이 육신이 되어)
-            'john-1-14': {{
-                ko: {{ title: '요한복음 1:14', content: '말씀이 육신이 되어 우리 가운데 거하시매 우리가 그의 영광을 보니 아버지의 독생자의 영광이요 은혜와 진리가 충만하더라' }},
-                en: {{ title: 'John 1:14', content: 'The Word became flesh and made his dwelling among us. We have seen his glory, the glory of the one and only Son, who came from the Father, full of grace and truth.' }},
-                zh: {{ title: '约翰福音 1:14', content: '道成了肉身，住在我们中间，充充满满地有恩典有真理。我们也见过他的荣光，正是父独生子的荣光。' }},
-                ja: {{ title: 'ヨハネ 1:14', content: 'ことばは人となって、私たちの間に住まわれた。私たちはこの方の栄光を見た。父のひとり子としての栄光である。この方は恵みとまことに満ちておられた。' }},
-                id: {{ title: 'Yohanes 1:14', content: 'Firman itu telah menjadi manusia, dan diam di antara kita, dan kita telah melihat kemuliaan-Nya.' }},
-                es: {{ title: 'Juan 1:14', content: 'Y aquel Verbo fue hecho carne, y habitó entre nosotros, y vimos su gloria, gloria como del unigénito del Padre.' }},
-                ru: {{ title: 'Иоанна 1:14', content: 'И Слово стало плотию, и обитало с нами, полное благодати и истины.' }},
-                fr: {{ title: 'Jean 1:14', content: 'Et la parole a été faite chair, et elle a habité parmi nous, pleine de grâce et de vérité.' }}
-            }},
+            'john-1-14': {
+                ko: { title: '요한복음 1:14', content: '말씀이 육신이 되어 우리 가운데 거하시매 우리가 그의 영광을 보니 아버지의 독생자의 영광이요 은혜와 진리가 충만하더라' },
+                en: { title: 'John 1:14', content: 'The Word became flesh and made his dwelling among us. We have seen his glory, the glory of the one and only Son, who came from the Father, full of grace and truth.' },
+                zh: { title: '约翰福音 1:14', content: '道成了肉身，住在我们中间，充充满满地有恩典有真理。我们也见过他的荣光，正是父独生子的荣光。' },
+                ja: { title: 'ヨハネ 1:14', content: 'ことばは人となって、私たちの間に住まわれた。私たちはこの方の栄光を見た。父のひとり子としての栄光である。この方は恵みとまことに満ちておられた。' },
+                id: { title: 'Yohanes 1:14', content: 'Firman itu telah menjadi manusia, dan diam di antara kita, dan kita telah melihat kemuliaan-Nya.' },
+                es: { title: 'Juan 1:14', content: 'Y aquel Verbo fue hecho carne, y habitó entre nosotros, y vimos su gloria, gloria como del unigénito del Padre.' },
+                ru: { title: 'Иоанна 1:14', content: 'И Слово стало плотию, и обитало с нами, полное благодати и истины.' },
+                fr: { title: 'Jean 1:14', content: 'Et la parole a été faite chair, et elle a habité parmi nous, pleine de grâce et de vérité.' }
+            },
             // 에베소서 2:4-8 (은혜)
-            'eph-2-4': {{
-                ko: {{ title: '에베소서 2:4~8', content: '긍휼이 풍성하신 하나님이 우리를 사랑하신 그 큰 사랑을 인하여 허물로 죽은 우리를 그리스도와 함께 살리셨고 너희는 은혜로 구원을 받은 것이라' }},
-                en: {{ title: 'Ephesians 2:4-8', content: 'But because of his great love for us, God, who is rich in mercy, made us alive with Christ even when we were dead in transgressions—it is by grace you have been saved.' }},
-                zh: {{ title: '以弗所书 2:4-8', content: '然而，神既有丰富的怜悯，因他爱我们的大爱，当我们死在过犯中的时候，便叫我们与基督一同活过来。你们得救是本乎恩。' }},
-                ja: {{ title: 'エペソ 2:4-8', content: 'しかし、あわれみ豊かな神は、私たちを愛してくださったその大きな愛のゆえに、背きの中に死んでいた私たちを、キリストとともに生かしてくださいました。' }},
-                id: {{ title: 'Efesus 2:4-8', content: 'Tetapi Allah yang kaya dengan rahmat, oleh karena kasih-Nya yang besar, telah menghidupkan kita bersama-sama dengan Kristus.' }},
-                es: {{ title: 'Efesios 2:4-8', content: 'Pero Dios, que es rico en misericordia, por su gran amor con que nos amó, nos dio vida juntamente con Cristo.' }},
-                ru: {{ title: 'Ефесянам 2:4-8', content: 'Бог, богатый милостью, по Своей великой любви, которою возлюбил нас, оживотворил со Христом.' }},
-                fr: {{ title: 'Éphésiens 2:4-8', content: 'Mais Dieu, qui est riche en miséricorde, nous a rendus à la vie avec Christ.' }}
-            }},
+            'eph-2-4': {
+                ko: { title: '에베소서 2:4~8', content: '긍휼이 풍성하신 하나님이 우리를 사랑하신 그 큰 사랑을 인하여 허물로 죽은 우리를 그리스도와 함께 살리셨고 너희는 은혜로 구원을 받은 것이라' },
+                en: { title: 'Ephesians 2:4-8', content: 'But because of his great love for us, God, who is rich in mercy, made us alive with Christ even when we were dead in transgressions—it is by grace you have been saved.' },
+                zh: { title: '以弗所书 2:4-8', content: '然而，神既有丰富的怜悯，因他爱我们的大爱，当我们死在过犯中的时候，便叫我们与基督一同活过来。你们得救是本乎恩。' },
+                ja: { title: 'エペソ 2:4-8', content: 'しかし、あわれみ豊かな神は、私たちを愛してくださったその大きな愛のゆえに、背きの中に死んでいた私たちを、キリストとともに生かしてくださいました。' },
+                id: { title: 'Efesus 2:4-8', content: 'Tetapi Allah yang kaya dengan rahmat, oleh karena kasih-Nya yang besar, telah menghidupkan kita bersama-sama dengan Kristus.' },
+                es: { title: 'Efesios 2:4-8', content: 'Pero Dios, que es rico en misericordia, por su gran amor con que nos amó, nos dio vida juntamente con Cristo.' },
+                ru: { title: 'Ефесянам 2:4-8', content: 'Бог, богатый милостью, по Своей великой любви, которою возлюбил нас, оживотворил со Христом.' },
+                fr: { title: 'Éphésiens 2:4-8', content: 'Mais Dieu, qui est riche en miséricorde, nous a rendus à la vie avec Christ.' }
+            },
             // 로마서 15:13 (소망)
-            'rom-15-13': {{
-                ko: {{ title: '로마서 15:13', content: '소망의 하나님이 모든 기쁨과 평강을 믿음 안에서 너희에게 충만하게 하사 성령의 능력으로 소망이 넘치게 하시기를 원하노라' }},
-                en: {{ title: 'Romans 15:13', content: 'May the God of hope fill you with all joy and peace as you trust in him, so that you may overflow with hope by the power of the Holy Spirit.' }},
-                zh: {{ title: '罗马书 15:13', content: '但愿使人有盼望的神，因信将诸般的喜乐、平安充满你们的心，使你们借着圣灵的能力大有盼望。' }},
-                ja: {{ title: 'ローマ 15:13', content: '希望の神が、信仰によるすべての喜びと平安であなたがたを満たし、聖霊の力によって希望にあふれさせてくださいますように。' }},
-                id: {{ title: 'Roma 15:13', content: 'Semoga Allah, sumber pengharapan, memenuhi kamu dengan segala sukacita dan damai sejahtera.' }},
-                es: {{ title: 'Romanos 15:13', content: 'Y el Dios de esperanza os llene de todo gozo y paz en el creer.' }},
-                ru: {{ title: 'Римлянам 15:13', content: 'Бог же надежды да исполнит вас всякой радости и мира в вере.' }},
-                fr: {{ title: 'Romains 15:13', content: 'Que le Dieu de l\\'espérance vous remplisse de toute joie et de toute paix dans la foi.' }}
-            }}
-        }};
+            'rom-15-13': {
+                ko: { title: '로마서 15:13', content: '소망의 하나님이 모든 기쁨과 평강을 믿음 안에서 너희에게 충만하게 하사 성령의 능력으로 소망이 넘치게 하시기를 원하노라' },
+                en: { title: 'Romans 15:13', content: 'May the God of hope fill you with all joy and peace as you trust in him, so that you may overflow with hope by the power of the Holy Spirit.' },
+                zh: { title: '罗马书 15:13', content: '但愿使人有盼望的神，因信将诸般的喜乐、平安充满你们的心，使你们借着圣灵的能力大有盼望。' },
+                ja: { title: 'ローマ 15:13', content: '希望の神が、信仰によるすべての喜びと平安であなたがたを満たし、聖霊の力によって希望にあふれさせてくださいますように。' },
+                id: { title: 'Roma 15:13', content: 'Semoga Allah, sumber pengharapan, memenuhi kamu dengan segala sukacita dan damai sejahtera.' },
+                es: { title: 'Romanos 15:13', content: 'Y el Dios de esperanza os llene de todo gozo y paz en el creer.' },
+                ru: { title: 'Римлянам 15:13', content: 'Бог же надежды да исполнит вас всякой радости и мира в вере.' },
+                fr: { title: 'Romains 15:13', content: 'Que le Dieu de l\\'espérance vous remplisse de toute joie et de toute paix dans la foi.' }
+            }
+        };
 
         // ========== 찬송가 데이터 (다국어 - 전문가 수준) ==========
-        const hymnData = {{
-            '8': {{
-                ko: {{ title: '기뻐하며 경배하세', subtitle: 'Joyful, Joyful, We Adore Thee', composer: '베토벤 작곡', hymnLabel: '찬송가', verseLabel: '장', lyrics: [{{verse: 1, text: '기뻐하며 경배하세 영광의 주 하나님\\n주의 얼굴 빛 같으니 모든 근심 물러가네\\n죄와 슬픔 다 사라지고 의심 구름 걷히나니\\n영원하신 기쁨 되어 주의 빛 안에 살리라'}}, {{verse: 2, text: '주는 만물 다스리며 만유의 주 되시니\\n들의 꽃과 산과 강도 다 주를 찬양하도다\\n주의 손이 펼쳐 있어 온 세상에 복 주시고\\n사랑으로 덮으셨네 우리 찬양 받으소서'}}] }},
-                en: {{ title: 'Joyful, Joyful, We Adore Thee', subtitle: 'Hymn to Joy', composer: 'Beethoven', hymnLabel: 'Hymn', verseLabel: '', lyrics: [{{verse: 1, text: 'Joyful, joyful, we adore Thee\\nGod of glory, Lord of love\\nHearts unfold like flowers before Thee\\nOpening to the sun above'}}, {{verse: 2, text: 'All Thy works with joy surround Thee\\nEarth and heaven reflect Thy rays\\nStars and angels sing around Thee\\nCenter of unbroken praise'}}] }},
-                zh: {{ title: '欢乐颂', subtitle: '欢欣崇拜', composer: '贝多芬 作曲', hymnLabel: '赞美诗', verseLabel: '章', lyrics: [{{verse: 1, text: '欢欣敬拜荣耀主\\n天父上帝慈爱深\\n心如花朵向主开放\\n迎向阳光灿烂新'}}] }},
-                ja: {{ title: '喜びの歌', subtitle: '喜び喜び主を崇めん', composer: 'ベートーヴェン作曲', hymnLabel: '讃美歌', verseLabel: '番', lyrics: [{{verse: 1, text: '喜び喜び主を崇めん\\n栄光の神 愛の主\\n心は花のように開く\\n太陽に向かって'}}] }},
-                id: {{ title: 'Sukacita, Sukacita', subtitle: 'Bersuka Menyembah', composer: 'Beethoven', hymnLabel: 'Kidung', verseLabel: '', lyrics: [{{verse: 1, text: 'Sukacita sukacita\\nKita sembah Tuhan mulia'}}] }},
-                es: {{ title: 'Jubilosos, Te Adoramos', subtitle: 'Himno a la Alegría', composer: 'Beethoven', hymnLabel: 'Himno', verseLabel: '', lyrics: [{{verse: 1, text: 'Jubilosos te adoramos\\nDios de gloria, Dios de amor'}}] }},
-                ru: {{ title: 'Радостно, Радостно', subtitle: 'Ода к Радости', composer: 'Бетховен', hymnLabel: 'Гимн', verseLabel: '', lyrics: [{{verse: 1, text: 'Радостно, радостно поклоняемся\\nБогу славы, Богу любви'}}] }},
-                fr: {{ title: 'Joyeux, Joyeux, Nous T\\'adorons', subtitle: 'Hymne à la Joie', composer: 'Beethoven', hymnLabel: 'Cantique', verseLabel: '', lyrics: [{{verse: 1, text: 'Joyeux, joyeux, nous t\\'adorons\\nDieu de gloire, Seigneur d\\'amour'}}] }},
-                musical: {{ key: 'G', tempo: 'Allegro maestoso', timeSignature: '4/4' }}
-            }},
-            '94': {{
-                ko: {{ title: '저 높고 푸른 하늘과', subtitle: 'This Is My Father\\'s World', composer: 'Franklin L. Sheppard', hymnLabel: '찬송가', verseLabel: '장', lyrics: [{{verse: 1, text: '저 높고 푸른 하늘과 그 아래 푸른 들\\n산과 나무와 꽃과 새 모두가 주 지으신 것\\n주님의 솜씨 온 세상에 깃들어 있나니\\n바람 소리 들리는 곳 주 음성이 들리네'}}] }},
-                en: {{ title: 'This Is My Father\\'s World', subtitle: '', composer: 'Franklin L. Sheppard', hymnLabel: 'Hymn', verseLabel: '', lyrics: [{{verse: 1, text: 'This is my Father\\'s world\\nAnd to my listening ears\\nAll nature sings and round me rings\\nThe music of the spheres'}}] }},
-                zh: {{ title: '这是天父世界', subtitle: '', composer: 'Franklin L. Sheppard', hymnLabel: '赞美诗', verseLabel: '章', lyrics: [{{verse: 1, text: '这是天父世界\\n我要侧耳细听'}}] }},
-                ja: {{ title: 'この世は父の世界', subtitle: '', composer: 'Franklin L. Sheppard', hymnLabel: '讃美歌', verseLabel: '番', lyrics: [{{verse: 1, text: 'この世は父の世界\\n耳を澄ませば'}}] }},
-                id: {{ title: 'Dunia Milik Bapa', hymnLabel: 'Kidung', verseLabel: '', lyrics: [{{verse: 1, text: 'Dunia ini milik Bapa'}}] }},
-                es: {{ title: 'El Mundo Es De Mi Padre', hymnLabel: 'Himno', verseLabel: '', lyrics: [{{verse: 1, text: 'El mundo es de mi Padre'}}] }},
-                ru: {{ title: 'Это Мир Моего Отца', hymnLabel: 'Гимн', verseLabel: '', lyrics: [{{verse: 1, text: 'Это мир моего Отца'}}] }},
-                fr: {{ title: 'C\\'est Le Monde De Mon Père', hymnLabel: 'Cantique', verseLabel: '', lyrics: [{{verse: 1, text: 'C\\'est le monde de mon Père'}}] }},
-                musical: {{ key: 'D', tempo: 'Andante', timeSignature: '6/8' }}
-            }},
-            '105': {{
-                ko: {{ title: '온 천하 만물 우러러', subtitle: 'All Creatures of Our God and King', composer: 'Geistliche Kirchengesäng', hymnLabel: '찬송가', verseLabel: '장', lyrics: [{{verse: 1, text: '온 천하 만물 우러러 다 주를 찬양하여라\\n할렐루야 할렐루야\\n해와 달 아름답게 비치고 밝은 별들도 찬양해\\n찬양해 찬양해 할렐루야 할렐루야 할렐루야'}}] }},
-                en: {{ title: 'All Creatures of Our God and King', subtitle: '', composer: 'Geistliche Kirchengesäng', hymnLabel: 'Hymn', verseLabel: '', lyrics: [{{verse: 1, text: 'All creatures of our God and King\\nLift up your voice and with us sing\\nAlleluia Alleluia'}}] }},
-                zh: {{ title: '万物称颂主', hymnLabel: '赞美诗', verseLabel: '章', lyrics: [{{verse: 1, text: '万物同颂赞主\\n高举声音齐唱'}}] }},
-                ja: {{ title: '神の造りしすべてのもの', hymnLabel: '讃美歌', verseLabel: '番', lyrics: [{{verse: 1, text: '神の造りしすべてのものよ'}}] }},
-                id: {{ title: 'Segala Makhluk Tuhan', hymnLabel: 'Kidung', verseLabel: '', lyrics: [{{verse: 1, text: 'Segala makhluk Allah'}}] }},
-                es: {{ title: 'Criaturas Del Señor', hymnLabel: 'Himno', verseLabel: '', lyrics: [{{verse: 1, text: 'Criaturas del Señor'}}] }},
-                ru: {{ title: 'Все Создания Бога', hymnLabel: 'Гимн', verseLabel: '', lyrics: [{{verse: 1, text: 'Все создания Бога нашего'}}] }},
-                fr: {{ title: 'Créatures Du Seigneur', hymnLabel: 'Cantique', verseLabel: '', lyrics: [{{verse: 1, text: 'Créatures de notre Dieu'}}] }},
-                musical: {{ key: 'F', tempo: 'Maestoso', timeSignature: '3/4' }}
-            }},
-            '301': {{
-                ko: {{ title: '지금까지 지내온 것', subtitle: 'Wonderful Grace of Jesus', composer: 'Haldor Lillenas', hymnLabel: '찬송가', verseLabel: '장', lyrics: [{{verse: 1, text: '지금까지 지내온 것 주의 크신 은혜라\\n한이 없는 주의 사랑 어찌 다 측량하랴\\n주님 크신 은혜가 나를 구원하셨네\\n나 같은 죄인도 구원하신 주 은혜 놀라와'}}] }},
-                en: {{ title: 'Wonderful Grace of Jesus', subtitle: '', composer: 'Haldor Lillenas', hymnLabel: 'Hymn', verseLabel: '', lyrics: [{{verse: 1, text: 'Wonderful grace of Jesus\\nGreater than all my sin'}}] }},
-                zh: {{ title: '主恩典何等奇妙', hymnLabel: '赞美诗', verseLabel: '章', lyrics: [{{verse: 1, text: '主恩典何等奇妙'}}] }},
-                ja: {{ title: '主の恵み素晴らしき', hymnLabel: '讃美歌', verseLabel: '番', lyrics: [{{verse: 1, text: '主の恵み素晴らしき'}}] }},
-                id: {{ title: 'Anugerah Yesus Ajaib', hymnLabel: 'Kidung', verseLabel: '', lyrics: [{{verse: 1, text: 'Anugerah Yesus ajaib'}}] }},
-                es: {{ title: 'Maravillosa Gracia', hymnLabel: 'Himno', verseLabel: '', lyrics: [{{verse: 1, text: 'Maravillosa gracia de Jesús'}}] }},
-                ru: {{ title: 'Чудесная Благодать', hymnLabel: 'Гимн', verseLabel: '', lyrics: [{{verse: 1, text: 'Чудесная благодать Иисуса'}}] }},
-                fr: {{ title: 'Merveilleuse Grâce', hymnLabel: 'Cantique', verseLabel: '', lyrics: [{{verse: 1, text: 'Merveilleuse grâce de Jésus'}}] }},
-                musical: {{ key: 'Ab', tempo: 'Moderato', timeSignature: '4/4' }}
-            }},
-            '187': {{
-                ko: {{ title: '주 예수 이름 높이어', subtitle: 'All Hail the Power of Jesus\\' Name', composer: 'Oliver Holden', hymnLabel: '찬송가', verseLabel: '장', lyrics: [{{verse: 1, text: '주 예수 이름 높이어 다 찬양하여라\\n천사들아 엎드려서 면류관 드리어라'}}] }},
-                en: {{ title: 'All Hail the Power of Jesus\\' Name', hymnLabel: 'Hymn', verseLabel: '', lyrics: [{{verse: 1, text: 'All hail the power of Jesus\\' name\\nLet angels prostrate fall'}}] }},
-                zh: {{ title: '万口欢唱', hymnLabel: '赞美诗', verseLabel: '章', lyrics: [{{verse: 1, text: '万口欢唱救主耶稣'}}] }},
-                ja: {{ title: '主イエスの御名をたたえよ', hymnLabel: '讃美歌', verseLabel: '番', lyrics: [{{verse: 1, text: '主イエスの御名をたたえよ'}}] }},
-                musical: {{ key: 'G', tempo: 'Maestoso', timeSignature: '4/4' }}
-            }},
-            '435': {{
-                ko: {{ title: '나의 갈 길 다 가도록', subtitle: 'All the Way My Savior Leads Me', composer: 'Robert Lowry', hymnLabel: '찬송가', verseLabel: '장', lyrics: [{{verse: 1, text: '나의 갈 길 다 가도록 예수 인도하시니\\n내가 어찌 주를 앙모하지 않을 수 있으랴'}}] }},
-                en: {{ title: 'All the Way My Savior Leads Me', hymnLabel: 'Hymn', verseLabel: '', lyrics: [{{verse: 1, text: 'All the way my Savior leads me\\nWhat have I to ask beside'}}] }},
-                zh: {{ title: '一路引导', hymnLabel: '赞美诗', verseLabel: '章', lyrics: [{{verse: 1, text: '一路有救主同行'}}] }},
-                ja: {{ title: '主イエスがすべての道を', hymnLabel: '讃美歌', verseLabel: '番', lyrics: [{{verse: 1, text: '主イエスがすべての道を'}}] }},
-                musical: {{ key: 'G', tempo: 'Andante', timeSignature: '4/4' }}
-            }}
-        }};
+        const hymnData = {
+            '8': {
+                ko: { title: '기뻐하며 경배하세', subtitle: 'Joyful, Joyful, We Adore Thee', composer: '베토벤 작곡', hymnLabel: '찬송가', verseLabel: '장', lyrics: [{verse: 1, text: '기뻐하며 경배하세 영광의 주 하나님\\n주의 얼굴 빛 같으니 모든 근심 물러가네\\n죄와 슬픔 다 사라지고 의심 구름 걷히나니\\n영원하신 기쁨 되어 주의 빛 안에 살리라'}, {verse: 2, text: '주는 만물 다스리며 만유의 주 되시니\\n들의 꽃과 산과 강도 다 주를 찬양하도다\\n주의 손이 펼쳐 있어 온 세상에 복 주시고\\n사랑으로 덮으셨네 우리 찬양 받으소서'}] },
+                en: { title: 'Joyful, Joyful, We Adore Thee', subtitle: 'Hymn to Joy', composer: 'Beethoven', hymnLabel: 'Hymn', verseLabel: '', lyrics: [{verse: 1, text: 'Joyful, joyful, we adore Thee\\nGod of glory, Lord of love\\nHearts unfold like flowers before Thee\\nOpening to the sun above'}, {verse: 2, text: 'All Thy works with joy surround Thee\\nEarth and heaven reflect Thy rays\\nStars and angels sing around Thee\\nCenter of unbroken praise'}] },
+                zh: { title: '欢乐颂', subtitle: '欢欣崇拜', composer: '贝多芬 作曲', hymnLabel: '赞美诗', verseLabel: '章', lyrics: [{verse: 1, text: '欢欣敬拜荣耀主\\n天父上帝慈爱深\\n心如花朵向主开放\\n迎向阳光灿烂新'}] },
+                ja: { title: '喜びの歌', subtitle: '喜び喜び主を崇めん', composer: 'ベートーヴェン作曲', hymnLabel: '讃美歌', verseLabel: '番', lyrics: [{verse: 1, text: '喜び喜び主を崇めん\\n栄光の神 愛の主\\n心は花のように開く\\n太陽に向かって'}] },
+                id: { title: 'Sukacita, Sukacita', subtitle: 'Bersuka Menyembah', composer: 'Beethoven', hymnLabel: 'Kidung', verseLabel: '', lyrics: [{verse: 1, text: 'Sukacita sukacita\\nKita sembah Tuhan mulia'}] },
+                es: { title: 'Jubilosos, Te Adoramos', subtitle: 'Himno a la Alegría', composer: 'Beethoven', hymnLabel: 'Himno', verseLabel: '', lyrics: [{verse: 1, text: 'Jubilosos te adoramos\\nDios de gloria, Dios de amor'}] },
+                ru: { title: 'Радостно, Радостно', subtitle: 'Ода к Радости', composer: 'Бетховен', hymnLabel: 'Гимн', verseLabel: '', lyrics: [{verse: 1, text: 'Радостно, радостно поклоняемся\\nБогу славы, Богу любви'}] },
+                fr: { title: 'Joyeux, Joyeux, Nous T\\'adorons', subtitle: 'Hymne à la Joie', composer: 'Beethoven', hymnLabel: 'Cantique', verseLabel: '', lyrics: [{verse: 1, text: 'Joyeux, joyeux, nous t\\'adorons\\nDieu de gloire, Seigneur d\\'amour'}] },
+                musical: { key: 'G', tempo: 'Allegro maestoso', timeSignature: '4/4' }
+            },
+            '94': {
+                ko: { title: '저 높고 푸른 하늘과', subtitle: 'This Is My Father\\'s World', composer: 'Franklin L. Sheppard', hymnLabel: '찬송가', verseLabel: '장', lyrics: [{verse: 1, text: '저 높고 푸른 하늘과 그 아래 푸른 들\\n산과 나무와 꽃과 새 모두가 주 지으신 것\\n주님의 솜씨 온 세상에 깃들어 있나니\\n바람 소리 들리는 곳 주 음성이 들리네'}] },
+                en: { title: 'This Is My Father\\'s World', subtitle: '', composer: 'Franklin L. Sheppard', hymnLabel: 'Hymn', verseLabel: '', lyrics: [{verse: 1, text: 'This is my Father\\'s world\\nAnd to my listening ears\\nAll nature sings and round me rings\\nThe music of the spheres'}] },
+                zh: { title: '这是天父世界', subtitle: '', composer: 'Franklin L. Sheppard', hymnLabel: '赞美诗', verseLabel: '章', lyrics: [{verse: 1, text: '这是天父世界\\n我要侧耳细听'}] },
+                ja: { title: 'この世は父の世界', subtitle: '', composer: 'Franklin L. Sheppard', hymnLabel: '讃美歌', verseLabel: '番', lyrics: [{verse: 1, text: 'この世は父の世界\\n耳を澄ませば'}] },
+                id: { title: 'Dunia Milik Bapa', hymnLabel: 'Kidung', verseLabel: '', lyrics: [{verse: 1, text: 'Dunia ini milik Bapa'}] },
+                es: { title: 'El Mundo Es De Mi Padre', hymnLabel: 'Himno', verseLabel: '', lyrics: [{verse: 1, text: 'El mundo es de mi Padre'}] },
+                ru: { title: 'Это Мир Моего Отца', hymnLabel: 'Гимн', verseLabel: '', lyrics: [{verse: 1, text: 'Это мир моего Отца'}] },
+                fr: { title: 'C\\'est Le Monde De Mon Père', hymnLabel: 'Cantique', verseLabel: '', lyrics: [{verse: 1, text: 'C\\'est le monde de mon Père'}] },
+                musical: { key: 'D', tempo: 'Andante', timeSignature: '6/8' }
+            },
+            '105': {
+                ko: { title: '온 천하 만물 우러러', subtitle: 'All Creatures of Our God and King', composer: 'Geistliche Kirchengesäng', hymnLabel: '찬송가', verseLabel: '장', lyrics: [{verse: 1, text: '온 천하 만물 우러러 다 주를 찬양하여라\\n할렐루야 할렐루야\\n해와 달 아름답게 비치고 밝은 별들도 찬양해\\n찬양해 찬양해 할렐루야 할렐루야 할렐루야'}] },
+                en: { title: 'All Creatures of Our God and King', subtitle: '', composer: 'Geistliche Kirchengesäng', hymnLabel: 'Hymn', verseLabel: '', lyrics: [{verse: 1, text: 'All creatures of our God and King\\nLift up your voice and with us sing\\nAlleluia Alleluia'}] },
+                zh: { title: '万物称颂主', hymnLabel: '赞美诗', verseLabel: '章', lyrics: [{verse: 1, text: '万物同颂赞主\\n高举声音齐唱'}] },
+                ja: { title: '神の造りしすべてのもの', hymnLabel: '讃美歌', verseLabel: '番', lyrics: [{verse: 1, text: '神の造りしすべてのものよ'}] },
+                id: { title: 'Segala Makhluk Tuhan', hymnLabel: 'Kidung', verseLabel: '', lyrics: [{verse: 1, text: 'Segala makhluk Allah'}] },
+                es: { title: 'Criaturas Del Señor', hymnLabel: 'Himno', verseLabel: '', lyrics: [{verse: 1, text: 'Criaturas del Señor'}] },
+                ru: { title: 'Все Создания Бога', hymnLabel: 'Гимн', verseLabel: '', lyrics: [{verse: 1, text: 'Все создания Бога нашего'}] },
+                fr: { title: 'Créatures Du Seigneur', hymnLabel: 'Cantique', verseLabel: '', lyrics: [{verse: 1, text: 'Créatures de notre Dieu'}] },
+                musical: { key: 'F', tempo: 'Maestoso', timeSignature: '3/4' }
+            },
+            '301': {
+                ko: { title: '지금까지 지내온 것', subtitle: 'Wonderful Grace of Jesus', composer: 'Haldor Lillenas', hymnLabel: '찬송가', verseLabel: '장', lyrics: [{verse: 1, text: '지금까지 지내온 것 주의 크신 은혜라\\n한이 없는 주의 사랑 어찌 다 측량하랴\\n주님 크신 은혜가 나를 구원하셨네\\n나 같은 죄인도 구원하신 주 은혜 놀라와'}] },
+                en: { title: 'Wonderful Grace of Jesus', subtitle: '', composer: 'Haldor Lillenas', hymnLabel: 'Hymn', verseLabel: '', lyrics: [{verse: 1, text: 'Wonderful grace of Jesus\\nGreater than all my sin'}] },
+                zh: { title: '主恩典何等奇妙', hymnLabel: '赞美诗', verseLabel: '章', lyrics: [{verse: 1, text: '主恩典何等奇妙'}] },
+                ja: { title: '主の恵み素晴らしき', hymnLabel: '讃美歌', verseLabel: '番', lyrics: [{verse: 1, text: '主の恵み素晴らしき'}] },
+                id: { title: 'Anugerah Yesus Ajaib', hymnLabel: 'Kidung', verseLabel: '', lyrics: [{verse: 1, text: 'Anugerah Yesus ajaib'}] },
+                es: { title: 'Maravillosa Gracia', hymnLabel: 'Himno', verseLabel: '', lyrics: [{verse: 1, text: 'Maravillosa gracia de Jesús'}] },
+                ru: { title: 'Чудесная Благодать', hymnLabel: 'Гимн', verseLabel: '', lyrics: [{verse: 1, text: 'Чудесная благодать Иисуса'}] },
+                fr: { title: 'Merveilleuse Grâce', hymnLabel: 'Cantique', verseLabel: '', lyrics: [{verse: 1, text: 'Merveilleuse grâce de Jésus'}] },
+                musical: { key: 'Ab', tempo: 'Moderato', timeSignature: '4/4' }
+            },
+            '187': {
+                ko: { title: '주 예수 이름 높이어', subtitle: 'All Hail the Power of Jesus\\' Name', composer: 'Oliver Holden', hymnLabel: '찬송가', verseLabel: '장', lyrics: [{verse: 1, text: '주 예수 이름 높이어 다 찬양하여라\\n천사들아 엎드려서 면류관 드리어라'}] },
+                en: { title: 'All Hail the Power of Jesus\\' Name', hymnLabel: 'Hymn', verseLabel: '', lyrics: [{verse: 1, text: 'All hail the power of Jesus\\' name\\nLet angels prostrate fall'}] },
+                zh: { title: '万口欢唱', hymnLabel: '赞美诗', verseLabel: '章', lyrics: [{verse: 1, text: '万口欢唱救主耶稣'}] },
+                ja: { title: '主イエスの御名をたたえよ', hymnLabel: '讃美歌', verseLabel: '番', lyrics: [{verse: 1, text: '主イエスの御名をたたえよ'}] },
+                musical: { key: 'G', tempo: 'Maestoso', timeSignature: '4/4' }
+            },
+            '435': {
+                ko: { title: '나의 갈 길 다 가도록', subtitle: 'All the Way My Savior Leads Me', composer: 'Robert Lowry', hymnLabel: '찬송가', verseLabel: '장', lyrics: [{verse: 1, text: '나의 갈 길 다 가도록 예수 인도하시니\\n내가 어찌 주를 앙모하지 않을 수 있으랴'}] },
+                en: { title: 'All the Way My Savior Leads Me', hymnLabel: 'Hymn', verseLabel: '', lyrics: [{verse: 1, text: 'All the way my Savior leads me\\nWhat have I to ask beside'}] },
+                zh: { title: '一路引导', hymnLabel: '赞美诗', verseLabel: '章', lyrics: [{verse: 1, text: '一路有救主同行'}] },
+                ja: { title: '主イエスがすべての道を', hymnLabel: '讃美歌', verseLabel: '番', lyrics: [{verse: 1, text: '主イエスがすべての道を'}] },
+                musical: { key: 'G', tempo: 'Andante', timeSignature: '4/4' }
+            }
+        };
         const hymns = hymnData; // 하위 호환성
 
         // 성경 API 설정 (선택적 외부 API 연동)
@@ -7391,71 +7673,71 @@ class ChurchBulletinGenerator:
         const BIBLE_API_URL = '/api/bible/';  // 백엔드 API 엔드포인트
 
         // 성경 구절 파싱 (예: "요한복음 3:16", "창세기 1:1-3")
-        function parseBibleReference(ref) {{
+        function parseBibleReference(ref) {
             if (!ref) return null;
             const match = ref.match(/([가-힣]+)\s*(\d+)[장]?\s*[:절]\s*(\d+)(?:\s*[-~]\s*(\d+))?/);
-            if (match) {{
-                return {{
+            if (match) {
+                return {
                     book: match[1],
                     chapter: parseInt(match[2]),
                     verseStart: parseInt(match[3]),
                     verseEnd: match[4] ? parseInt(match[4]) : parseInt(match[3])
-                }};
-            }}
+                };
+            }
             return null;
-        }}
+        }
 
         // 성경 모달 열기 (다국어 지원)
-        function openBibleModal(verseKey) {{
+        function openBibleModal(verseKey) {
             const verseData = bibleVerses[verseKey];
             const modal = document.getElementById('bibleModal');
             const titleEl = document.getElementById('bibleModalTitle');
             const contentEl = document.getElementById('bibleModalContent');
 
-            if (verseData) {{
+            if (verseData) {
                 // 현재 언어 -> 영어 -> 한국어 폴백
                 const verse = verseData[currentLanguage] || verseData['en'] || verseData['ko'];
                 titleEl.textContent = '📖 ' + verse.title;
 
-                if (BIBLE_API_ENABLED && verse.title) {{
+                if (BIBLE_API_ENABLED && verse.title) {
                     // API에서 성경 구절 불러오기
                     contentEl.innerHTML = '<p style="text-align: center; color: var(--text-secondary);">📖 성경 구절을 불러오는 중...</p>';
                     modal.classList.add('active');
                     document.body.style.overflow = 'hidden';
 
-                    fetchBibleVerse(verse.title).then(text => {{
-                        contentEl.innerHTML = `<div class="bible-verse-text" style="line-height: 2;">${{text}}</div>`;
-                    }}).catch(err => {{
+                    fetchBibleVerse(verse.title).then(text => {
+                        contentEl.innerHTML = `<div class="bible-verse-text" style="line-height: 2;">${text}</div>`;
+                    }).catch(err => {
                         contentEl.innerHTML = verse.content || '<p>성경 구절을 불러올 수 없습니다.</p>';
-                    }});
-                }} else {{
+                    });
+                } else {
                     // 로컬 데이터 사용
                     contentEl.innerHTML = '<div class="bible-verse-text" style="line-height: 2;">' + verse.content + '</div>';
                     modal.classList.add('active');
                     document.body.style.overflow = 'hidden';
-                }}
-            }}
-        }}
+                }
+            }
+        }
 
         // 성경 구절 API 호출
-        async function fetchBibleVerse(reference) {{
-            try {{
+        async function fetchBibleVerse(reference) {
+            try {
                 const parsed = parseBibleReference(reference);
-                if (!parsed) {{
+                if (!parsed) {
                     throw new Error('Invalid reference');
-                }}
-                const response = await fetch(`${{BIBLE_API_URL}}${{encodeURIComponent(reference)}}`);
+                }
+                const response = await fetch(`${BIBLE_API_URL}${encodeURIComponent(reference)}`);
                 if (!response.ok) throw new Error('API error');
                 const data = await response.json();
                 return data.text || data.content || reference;
-            }} catch (error) {{
+            } catch (error) {
                 console.log('Bible API not available, using local data');
                 return '성경 본문이 표시됩니다.<br><small style="color: var(--text-secondary);">(외부 API 연동 시 실제 구절이 표시됩니다)</small>';
-            }}
-        }}
+            }
+        }
 
         // 성경 구절 직접 열기 (참조 문자열로)
-        function openBibleVerseByRef(reference) {{
+        function openBibleVerseByRef(reference) {
             const modal = document.getElementById('bibleModal');
             const titleEl = document.getElementById('bibleModalTitle');
             const contentEl = document.getElementById('bibleModalContent');
@@ -7465,25 +7747,25 @@ class ChurchBulletinGenerator:
             modal.classList.add('active');
             document.body.style.overflow = 'hidden';
 
-            if (BIBLE_API_ENABLED) {{
-                fetchBibleVerse(reference).then(text => {{
-                    contentEl.innerHTML = `<div class="bible-verse-text" style="line-height: 2;">${{text}}</div>`;
-                }});
-            }} else {{
+            if (BIBLE_API_ENABLED) {
+                fetchBibleVerse(reference).then(text => {
+                    contentEl.innerHTML = `<div class="bible-verse-text" style="line-height: 2;">${text}</div>`;
+                });
+            } else {
                 contentEl.innerHTML = '<div class="bible-verse-text" style="line-height: 2;">성경 본문이 표시됩니다.<br><small style="color: var(--text-secondary);">(외부 API 연동 시 실제 구절이 표시됩니다)</small></div>';
-            }}
-        }}
+            }
+        }
 
-        function openHymnModal(hymnNum) {{
+        function openHymnModal(hymnNum) {
             const hymnDataItem = hymnData[hymnNum];
             const modal = document.getElementById('hymnModal');
             const titleEl = document.getElementById('hymnModalTitle');
             const contentEl = document.getElementById('hymnModalContent');
 
-            if (hymnDataItem) {{
+            if (hymnDataItem) {
                 // 현재 언어 -> 영어 -> 한국어 폴백
                 const hymn = hymnDataItem[currentLanguage] || hymnDataItem['en'] || hymnDataItem['ko'];
-                const musical = hymnDataItem.musical || {{}};
+                const musical = hymnDataItem.musical || {};
                 const hymnLabel = hymn.hymnLabel || '찬송가';
                 const verseLabel = hymn.verseLabel || '';
 
@@ -7495,19 +7777,19 @@ class ChurchBulletinGenerator:
                 contentEl.innerHTML = `
                     <div class="hymn-sheet">
                         <div class="hymn-info">
-                            <div class="hymn-number">${{hymnNum}}${{verseLabel}}</div>
-                            <div class="hymn-title">${{hymn.title}}</div>
-                            <div style="font-size: 0.85em; color: var(--text-gray); margin-top: 8px;">${{musical.key || ''}} | ${{musical.tempo || ''}}</div>
+                            <div class="hymn-number">${hymnNum}${verseLabel}</div>
+                            <div class="hymn-title">${hymn.title}</div>
+                            <div style="font-size: 0.85em; color: var(--text-gray); margin-top: 8px;">${musical.key || ''} | ${musical.tempo || ''}</div>
                         </div>
-                        <div class="hymn-lyrics">${{lyricsHtml}}</div>
+                        <div class="hymn-lyrics">${lyricsHtml}</div>
                     </div>
                 `;
                 modal.classList.add('active');
                 document.body.style.overflow = 'hidden';
-            }} else {{
+            } else {
                 // 찬송가 데이터가 없는 경우
-                const hymnLabels = {{ ko: '찬송가', en: 'Hymn', zh: '赞美诗', ja: '讃美歌', id: 'Kidung', es: 'Himno', ru: 'Гимн', fr: 'Cantique' }};
-                const notReadyMsg = {{
+                const hymnLabels = { ko: '찬송가', en: 'Hymn', zh: '赞美诗', ja: '讃美歌', id: 'Kidung', es: 'Himno', ru: 'Гимн', fr: 'Cantique' };
+                const notReadyMsg = {
                     ko: '이 찬송가의 가사는 준비 중입니다.',
                     en: 'Lyrics for this hymn are being prepared.',
                     zh: '此赞美诗的歌词正在准备中。',
@@ -7516,7 +7798,7 @@ class ChurchBulletinGenerator:
                     es: 'La letra de este himno está en preparación.',
                     ru: 'Текст этого гимна готовится.',
                     fr: 'Les paroles de ce cantique sont en préparation.'
-                }};
+                };
                 const label = hymnLabels[currentLanguage] || hymnLabels['ko'];
                 const msg = notReadyMsg[currentLanguage] || notReadyMsg['ko'];
 
@@ -7524,62 +7806,62 @@ class ChurchBulletinGenerator:
                 contentEl.innerHTML = '<div style="text-align: center; padding: 40px; color: var(--text-gray);"><p>' + msg + '</p></div>';
                 modal.classList.add('active');
                 document.body.style.overflow = 'hidden';
-            }}
-        }}
+            }
+        }
 
-        function closeModal(modalId) {{
+        function closeModal(modalId) {
             document.getElementById(modalId).classList.remove('active');
             document.body.style.overflow = '';
-        }}
+        }
 
         // 모달 외부 클릭 시 닫기
-        document.querySelectorAll('.modal-overlay').forEach(modal => {{
-            modal.addEventListener('click', function(e) {{
-                if (e.target === this) {{
+        document.querySelectorAll('.modal-overlay').forEach(modal => {
+            modal.addEventListener('click', function(e) {
+                if (e.target === this) {
                     this.classList.remove('active');
                     document.body.style.overflow = '';
-                }}
-            }});
-        }});
+                }
+            });
+        });
 
         // ============================================
         // 아코디언 토글 함수 (명성교회 고도화)
         // ============================================
-        function toggleAccordion(accordionId) {{
+        function toggleAccordion(accordionId) {
             const accordion = document.getElementById(accordionId);
-            if (accordion) {{
+            if (accordion) {
                 accordion.classList.toggle('open');
                 const arrow = accordion.querySelector('.accordion-arrow');
-                if (arrow) {{
+                if (arrow) {
                     arrow.textContent = accordion.classList.contains('open') ? '▲' : '▼';
-                }}
-            }}
-        }}
+                }
+            }
+        }
 
         // 오늘의 말씀 아코디언 토글
-        function toggleSermonWord(element) {{
+        function toggleSermonWord(element) {
             element.classList.toggle('expanded');
-        }}
+        }
 
         // 생명의 말씀 (4페이지) 아코디언 토글
-        function toggleLifeWord(element) {{
+        function toggleLifeWord(element) {
             element.classList.toggle('expanded');
-        }}
+        }
 
         // 생명의 말씀 소제목별 아코디언 토글
-        function toggleLifeWordPoint(header) {{
+        function toggleLifeWordPoint(header) {
             const point = header.parentElement;
             point.classList.toggle('expanded');
-        }}
+        }
 
         // 지난주 말씀 모달 열기
         let lastWeekSermonData = null;
-        function setLastWeekSermonData(title, scripture, preacher, content) {{
-            lastWeekSermonData = {{ title, scripture, preacher, content }};
-        }}
+        function setLastWeekSermonData(title, scripture, preacher, content) {
+            lastWeekSermonData = { title, scripture, preacher, content };
+        }
 
-        function openLastWeekModal() {{
-            if (lastWeekSermonData) {{
+        function openLastWeekModal() {
+            if (lastWeekSermonData) {
                 const modal = document.getElementById('lastWeekModal');
                 const content = document.getElementById('lastWeekModalContent');
                 content.querySelector('.sermon-title').textContent = lastWeekSermonData.title || '지난주 말씀';
@@ -7589,11 +7871,11 @@ class ChurchBulletinGenerator:
                 content.querySelector('.sermon-text').textContent = lastWeekSermonData.content || '';
                 modal.classList.add('active');
                 document.body.style.overflow = 'hidden';
-            }}
-        }}
+            }
+        }
 
         // 교독문 모달 열기
-        function openResponsiveReading(readingNum) {{
+        function openResponsiveReading(readingNum) {
             const title = document.getElementById('responsiveReadingTitle');
             const content = document.getElementById('responsiveReadingContent');
             title.textContent = '📜 교독문 ' + readingNum + '번';
@@ -7601,61 +7883,61 @@ class ChurchBulletinGenerator:
             document.getElementById('responsiveReadingModal').classList.add('active');
             document.body.style.overflow = 'hidden';
             // TODO: 실제 교독문 데이터 연동
-        }}
+        }
 
         // 사도신경 모달 열기
-        function openCreed() {{
+        function openCreed() {
             document.getElementById('creedModal').classList.add('active');
             document.body.style.overflow = 'hidden';
-        }}
+        }
 
         // 주기도문 모달 열기
-        function openLordsPrayer() {{
+        function openLordsPrayer() {
             document.getElementById('lordsPrayerModal').classList.add('active');
             document.body.style.overflow = 'hidden';
-        }}
+        }
 
         // 오늘의 말씀 아코디언 토글
-        function toggleVerseAccordion(element) {{
+        function toggleVerseAccordion(element) {
             element.classList.toggle('expanded');
-        }}
+        }
 
         // 예배 회차별 탭 전환 (명성교회)
-        function switchServiceTab(serviceNum) {{
+        function switchServiceTab(serviceNum) {
             // 모든 탭 비활성화
-            document.querySelectorAll('.service-tab').forEach(tab => {{
+            document.querySelectorAll('.service-tab').forEach(tab => {
                 tab.classList.remove('active');
-            }});
+            });
             // 클릭한 탭 활성화
             event.target.classList.add('active');
 
             // 회차별 내용 전환
-            document.querySelectorAll('.service-detail').forEach(detail => {{
+            document.querySelectorAll('.service-detail').forEach(detail => {
                 detail.style.display = 'none';
-            }});
+            });
             const activeDetail = document.getElementById('service-' + serviceNum);
-            if (activeDetail) {{
+            if (activeDetail) {
                 activeDetail.style.display = 'block';
-            }}
-        }}
+            }
+        }
 
         // 교우소식 카테고리 아코디언 (명성교회)
-        function toggleMemberNewsCategory(categoryId) {{
+        function toggleMemberNewsCategory(categoryId) {
             const category = document.getElementById(categoryId);
-            if (category) {{
+            if (category) {
                 category.classList.toggle('open');
                 const arrow = category.querySelector('.category-arrow');
-                if (arrow) {{
+                if (arrow) {
                     arrow.textContent = category.classList.contains('open') ? '−' : '+';
-                }}
-            }}
-        }}
+                }
+            }
+        }
 
         // 오디오 재생 속도 변경
         let currentSpeed = 1.0;
         const speeds = [1.0, 1.25, 1.5, 1.75, 2.0, 0.75];
 
-        function changePlaybackRate() {{
+        function changePlaybackRate() {
             const audio = document.querySelector('.audio-player');
             const speedLabel = document.getElementById('speedLabel');
             const currentIndex = speeds.indexOf(currentSpeed);
@@ -7663,44 +7945,44 @@ class ChurchBulletinGenerator:
             currentSpeed = speeds[nextIndex];
             audio.playbackRate = currentSpeed;
             speedLabel.textContent = currentSpeed + 'x';
-        }}
+        }
 
         // 설교 음성 다운로드
-        function downloadSermon() {{
+        function downloadSermon() {
             alert('설교 음성 파일이 다운로드됩니다.\\n\\n실제 운영 시 교회 서버에서 음성 파일을 제공합니다.');
-        }}
+        }
 
         // 홈 화면에 추가
-        function saveToHomeScreen() {{
+        function saveToHomeScreen() {
             const isIOS = /iPad|iPhone|iPod/.test(navigator.userAgent);
             const isAndroid = /Android/.test(navigator.userAgent);
 
-            if (isIOS) {{
+            if (isIOS) {
                 alert('📱 iPhone/iPad에서 저장하기\\n\\n1. 하단의 공유 버튼(□↑)을 탭하세요\\n2. "홈 화면에 추가"를 선택하세요\\n3. "추가"를 탭하면 완료!');
-            }} else if (isAndroid) {{
+            } else if (isAndroid) {
                 alert('📱 Android에서 저장하기\\n\\n1. 브라우저 메뉴(⋮)를 탭하세요\\n2. "홈 화면에 추가" 또는 "앱 설치"를 선택하세요\\n3. 확인을 탭하면 완료!');
-            }} else {{
+            } else {
                 alert('📱 스마트폰에서 저장하기\\n\\n브라우저 메뉴에서 "홈 화면에 추가"를 선택하시면\\n언제든지 이 주보를 다시 보실 수 있습니다.');
-            }}
-        }}
+            }
+        }
 
         // 다크모드 토글
-        function toggleDarkMode() {{
+        function toggleDarkMode() {
             document.body.classList.toggle('dark-mode');
             const btn = document.querySelector('.dark-mode-toggle');
             btn.textContent = document.body.classList.contains('dark-mode') ? '☀️' : '🌙';
             localStorage.setItem('darkMode', document.body.classList.contains('dark-mode'));
-        }}
+        }
 
         // ========== 예배별 탭 전환 ==========
         // 동적 데이터 사용 (window.dynamicServiceData가 있으면 그것을 사용)
-        function getServiceData() {{
-            if (window.dynamicServiceData) {{
+        function getServiceData() {
+            if (window.dynamicServiceData) {
                 return window.dynamicServiceData;
-            }}
+            }
             // 폴백: 기본값
-            return {{
-                '1bu': {{
+            return {
+                '1bu': {
                     hymn: '301장',
                     prayer: '대표기도자',
                     scripture: '빌 1:3~8',
@@ -7708,8 +7990,8 @@ class ChurchBulletinGenerator:
                     sermon: '담임목사',
                     offering: '헌금기도자',
                     time: '오전 7:00'
-                }},
-                '234bu': {{
+                },
+                '234bu': {
                     hymn: '105장',
                     prayer: '대표기도자',
                     scripture: '눅 3:4~6',
@@ -7717,8 +7999,8 @@ class ChurchBulletinGenerator:
                     sermon: '담임목사',
                     offering: '헌금기도자',
                     time: '오전 9:00 / 11:00 / 오후 1:00'
-                }},
-                'youth': {{
+                },
+                'youth': {
                     hymn: '105장',
                     prayer: '대표기도자',
                     scripture: '요 1:14',
@@ -7726,8 +8008,8 @@ class ChurchBulletinGenerator:
                     sermon: '청년 담당 목사',
                     offering: '헌금기도자',
                     time: '오후 2:00'
-                }},
-                'evening': {{
+                },
+                'evening': {
                     hymn: '94장',
                     prayer: '대표기도자',
                     scripture: '엡 2:4~8',
@@ -7735,48 +8017,48 @@ class ChurchBulletinGenerator:
                     sermon: '담임목사',
                     offering: '헌금기도자',
                     time: '오후 5:00'
-                }}
-            }};
-        }}
+                }
+            };
+        }
 
         // 성경 구절 키 생성 함수
-        function scriptureToKey(scripture) {{
+        function scriptureToKey(scripture) {
             if (!scripture) return 'phil-1-3';
-            const bookMap = {{
+            const bookMap = {
                 '빌': 'phil', '눅': 'luke', '요': 'john', '엡': 'eph',
                 '창': 'gen', '출': 'exod', '롬': 'rom', '고전': '1cor', '고후': '2cor',
                 '갈': 'gal', '마': 'matt', '막': 'mark', '행': 'acts', '벧전': '1pet'
-            }};
-            for (const [kor, eng] of Object.entries(bookMap)) {{
-                if (scripture.includes(kor)) {{
+            };
+            for (const [kor, eng] of Object.entries(bookMap)) {
+                if (scripture.includes(kor)) {
                     const match = scripture.match(/(\d+):(\d+)/);
-                    if (match) {{
-                        return `${{eng}}-${{match[1]}}-${{match[2]}}`;
-                    }}
-                }}
-            }}
+                    if (match) {
+                        return `${eng}-${match[1]}-${match[2]}`;
+                    }
+                }
+            }
             return 'phil-1-3';
-        }}
+        }
 
         // 찬송가 번호 추출 함수
-        function extractHymnNum(hymnStr) {{
+        function extractHymnNum(hymnStr) {
             const match = hymnStr.match(/(\d+)/);
             return match ? match[1] : '301';
-        }}
+        }
 
-        function switchService(serviceKey) {{
+        function switchService(serviceKey) {
             // 탭 버튼 활성화 상태 변경
-            document.querySelectorAll('.service-tab').forEach(tab => {{
+            document.querySelectorAll('.service-tab').forEach(tab => {
                 tab.classList.remove('active');
-                if (tab.dataset.service === serviceKey) {{
+                if (tab.dataset.service === serviceKey) {
                     tab.classList.add('active');
-                }}
-            }});
+                }
+            });
 
             // 콘텐츠 업데이트
             const serviceData = getServiceData();
             const data = serviceData[serviceKey];
-            if (data) {{
+            if (data) {
                 const hymnEl = document.getElementById('hymn-value');
                 const prayerEl = document.getElementById('prayer-value');
                 const scriptureEl = document.getElementById('scripture-value');
@@ -7786,11 +8068,11 @@ class ChurchBulletinGenerator:
 
                 // 찬송가 링크 생성
                 const hymnNum = extractHymnNum(data.hymn);
-                const hymnHtml = `<a href="javascript:void(0)" onclick="openHymnModal('${{hymnNum}}')" class="hymn-link">${{data.hymn}}</a> (다같이)`;
+                const hymnHtml = `<a href="javascript:void(0)" onclick="openHymnModal('${hymnNum}')" class="hymn-link">${data.hymn}</a> (다같이)`;
 
                 // 성경 구절 링크 생성
                 const scriptureKey = scriptureToKey(data.scripture);
-                const scriptureHtml = `<a href="javascript:void(0)" onclick="openBibleModal('${{scriptureKey}}')" class="bible-link">${{data.scripture}}</a> (사회자)`;
+                const scriptureHtml = `<a href="javascript:void(0)" onclick="openBibleModal('${scriptureKey}')" class="bible-link">${data.scripture}</a> (사회자)`;
 
                 if (hymnEl) hymnEl.innerHTML = hymnHtml;
                 if (prayerEl) prayerEl.textContent = data.prayer;
@@ -7798,64 +8080,64 @@ class ChurchBulletinGenerator:
                 if (choirEl) choirEl.textContent = data.choir;
                 if (sermonEl) sermonEl.textContent = data.sermon;
                 if (offeringEl) offeringEl.textContent = data.offering;
-            }}
-        }}
+            }
+        }
 
         // 다크모드 설정 불러오기
-        if (localStorage.getItem('darkMode') === 'true') {{
+        if (localStorage.getItem('darkMode') === 'true') {
             document.body.classList.add('dark-mode');
             document.querySelector('.dark-mode-toggle').textContent = '☀️';
-        }}
+        }
 
         // 네비게이션 활성화
         const navTabs = document.querySelectorAll('.nav-tab');
 
-        function setActiveNav(hash) {{
-            navTabs.forEach(tab => {{
+        function setActiveNav(hash) {
+            navTabs.forEach(tab => {
                 tab.classList.toggle('active', tab.getAttribute('href') === hash);
-            }});
-        }}
+            });
+        }
 
         // 스크롤 시 네비게이션 활성화
         const sections = document.querySelectorAll('section[id]');
-        window.addEventListener('scroll', () => {{
+        window.addEventListener('scroll', () => {
             let current = '';
-            sections.forEach(section => {{
+            sections.forEach(section => {
                 const sectionTop = section.offsetTop - 150;
-                if (window.scrollY >= sectionTop) {{
+                if (window.scrollY >= sectionTop) {
                     current = section.getAttribute('id');
-                }}
-            }});
-            if (current) {{
+                }
+            });
+            if (current) {
                 setActiveNav('#' + current);
-            }}
-        }});
+            }
+        });
 
         // 카카오톡 공유
-        function shareKakao() {{
-            if (navigator.share) {{
-                navigator.share({{
-                    title: '{church_name} 주보 - {date}',
-                    text: '{church_name} 주보',
+        function shareKakao() {
+            if (navigator.share) {
+                navigator.share({
+                    title: bulletinData.churchName + ' 주보 - ' + bulletinData.date,
+                    text: bulletinData.churchName + ' 주보',
                     url: window.location.href
-                }});
-            }} else {{
+                });
+            } else {
                 alert('카카오톡 공유는 모바일에서 이용 가능합니다.');
-            }}
-        }}
+            }
+        }
 
         // 링크 복사
-        function shareLink() {{
-            navigator.clipboard.writeText(window.location.href).then(() => {{
+        function shareLink() {
+            navigator.clipboard.writeText(window.location.href).then(() => {
                 alert('링크가 복사되었습니다.');
-            }});
-        }}
+            });
+        }
 
         // 계좌번호 복사
-        function copyAccount(accountNum) {{
-            navigator.clipboard.writeText(accountNum).then(() => {{
+        function copyAccount(accountNum) {
+            navigator.clipboard.writeText(accountNum).then(() => {
                 alert('계좌번호가 복사되었습니다: ' + accountNum);
-            }}).catch(() => {{
+            }).catch(() => {
                 // 폴백: 구형 브라우저용
                 const textarea = document.createElement('textarea');
                 textarea.value = accountNum;
@@ -7864,25 +8146,25 @@ class ChurchBulletinGenerator:
                 document.execCommand('copy');
                 document.body.removeChild(textarea);
                 alert('계좌번호가 복사되었습니다: ' + accountNum);
-            }});
-        }}
+            });
+        }
 
         // 부드러운 스크롤
-        document.querySelectorAll('a[href^="#"]').forEach(anchor => {{
-            anchor.addEventListener('click', function(e) {{
+        document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+            anchor.addEventListener('click', function(e) {
                 e.preventDefault();
                 const target = document.querySelector(this.getAttribute('href'));
-                if (target) {{
+                if (target) {
                     const headerHeight = 60;
                     const targetPosition = target.offsetTop - headerHeight;
-                    window.scrollTo({{
+                    window.scrollTo({
                         top: targetPosition,
                         behavior: 'smooth'
-                    }});
+                    });
                     setActiveNav(this.getAttribute('href'));
-                }}
-            }});
-        }});
+                }
+            });
+        });
 
         // 스크롤 시 헤더 숨김/표시
         let lastScrollY = 0;
@@ -7890,27 +8172,27 @@ class ChurchBulletinGenerator:
         const header = document.querySelector('.header');
         const scrollThreshold = 150;
 
-        function updateHeader() {{
+        function updateHeader() {
             const currentScrollY = window.scrollY;
-            if (currentScrollY > scrollThreshold) {{
+            if (currentScrollY > scrollThreshold) {
                 header.classList.add('hidden');
-            }} else {{
+            } else {
                 header.classList.remove('hidden');
-            }}
+            }
             lastScrollY = currentScrollY;
             ticking = false;
-        }}
+        }
 
-        window.addEventListener('scroll', function() {{
-            if (!ticking) {{
+        window.addEventListener('scroll', function() {
+            if (!ticking) {
                 window.requestAnimationFrame(updateHeader);
                 ticking = true;
-            }}
-        }});
+            }
+        });
 
         // ========== 헌금 모달 시스템 (전문가 수준) ==========
-        const offeringData = {{
-            bank: {{
+        const offeringData = {
+            bank: {
                 title: '계좌이체 헌금',
                 content: `<div style="padding: 20px;">
                     <div style="background: var(--primary-light); padding: 20px; border-radius: 12px; margin-bottom: 20px;">
@@ -7931,14 +8213,14 @@ class ChurchBulletinGenerator:
                             <div style="font-weight: 600; color: var(--primary);">농협</div>
                             <div style="font-size: 1.1em; font-weight: 700; margin: 6px 0;">367-01-035287 📋</div>
                         </div>
-                        <div style="color: var(--text-gray); font-size: 0.85em; margin-top: 12px; text-align: center;">예금주: {church_name}</div>
+                        <div style="color: var(--text-gray); font-size: 0.85em; margin-top: 12px; text-align: center;">예금주: ${bulletinData.churchName}</div>
                     </div>
                     <div style="font-size: 0.9em; color: var(--text-gray); line-height: 1.6;">
                         <p>※ 입금자명에 교적번호 또는 이름을 기재해 주세요.</p>
                     </div>
                 </div>`
-            }},
-            kakaopay: {{
+            },
+            kakaopay: {
                 title: '카카오페이 헌금',
                 content: `<div style="padding: 20px; text-align: center;">
                     <div style="background: #FEE500; color: #3C1E1E; padding: 40px; border-radius: 16px; margin-bottom: 20px;">
@@ -7955,13 +8237,13 @@ class ChurchBulletinGenerator:
                         </ol>
                     </div>
                 </div>`
-            }},
-            app: {{
+            },
+            app: {
                 title: '교회 앱 헌금',
                 content: `<div style="padding: 20px; text-align: center;">
                     <div style="background: linear-gradient(135deg, var(--primary) 0%, var(--primary-dark) 100%); color: white; padding: 40px; border-radius: 16px; margin-bottom: 20px;">
                         <div style="font-size: 3em; margin-bottom: 16px;">⛪</div>
-                        <div style="font-size: 1.2em; font-weight: 700;">{church_name} 앱</div>
+                        <div style="font-size: 1.2em; font-weight: 700;">${bulletinData.churchName} 앱</div>
                     </div>
                     <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 12px; margin-bottom: 20px;">
                         <a href="#" style="display: block; background: #000; color: white; padding: 16px; border-radius: 10px; text-decoration: none;">
@@ -7974,34 +8256,34 @@ class ChurchBulletinGenerator:
                         </a>
                     </div>
                 </div>`
-            }}
-        }};
+            }
+        };
 
-        function openOfferingModal(type) {{
+        function openOfferingModal(type) {
             const data = offeringData[type];
             const modal = document.getElementById('offeringModal');
             document.getElementById('offeringModalTitle').textContent = data.title;
             document.getElementById('offeringModalBody').innerHTML = data.content;
             modal.classList.add('active');
             document.body.style.overflow = 'hidden';
-        }}
+        }
 
-        function closeOfferingModal(event) {{
+        function closeOfferingModal(event) {
             if (event && event.target !== event.currentTarget && !event.target.classList.contains('modal-close')) return;
             document.getElementById('offeringModal').classList.remove('active');
             document.body.style.overflow = '';
-        }}
+        }
 
         // ESC 키로 모든 모달 닫기
-        document.addEventListener('keydown', function(e) {{
-            if (e.key === 'Escape') {{
+        document.addEventListener('keydown', function(e) {
+            if (e.key === 'Escape') {
                 closeModal('bibleModal');
                 closeModal('hymnModal');
                 closeModal('lastWeekModal');
                 closeOfferingModal();
-            }}
-        }});
-    </script>'''
+            }
+        });
+'''
 
 
 # ============================================================
@@ -8078,9 +8360,9 @@ class TraditionalChurchGenerator(ChurchBulletinGenerator):
         }
     }
 
-    def _get_css(self, theme: Dict, is_harvest: bool, theme_name: str = "default") -> str:
+    def _build_css(self, theme: Dict, is_harvest: bool, theme_name: str = "default") -> str:
         """전통적인 스타일 CSS 생성"""
-        base_css = super()._get_css(theme, is_harvest, theme_name)
+        base_css = super()._build_css(theme, is_harvest, theme_name)
 
         # 전통적인 스타일 추가 CSS
         traditional_css = """
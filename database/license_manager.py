@@ -1,55 +1,187 @@
 """
 StudySnap Backend - 라이선스 관리 시스템
 15일 체험판 라이선스 관리 및 사용량 제한
+
+저장소: SQLite (database/licenses.db)
+- 사용량은 (라이선스 키, 날짜) 행 단위 원자적 증가 → 동시 요청에도 누락 없음
+- 라이선스 키/교회 ID/날짜 인덱스 조회
+- 보관 기간(LICENSE_USAGE_RETENTION_DAYS)이 지난 사용량 행은 하루 한 번 자동 삭제
+- 기존 license_data.json은 첫 실행 시 한 번만 가져옴
 """
 
 import os
 import json
+import sqlite3
 import logging
 import hashlib
 import secrets
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
-# 라이선스 데이터 파일 경로
+# 라이선스 데이터 파일 경로 (이전 JSON 저장소, 마이그레이션 원본)
 LICENSE_FILE = Path(__file__).parent / "license_data.json"
+LICENSE_DB_PATH = Path(os.environ.get("LICENSE_DB_PATH") or Path(__file__).parent / "licenses.db")
+
+# 스키마 버전 (PRAGMA user_version)
+SCHEMA_VERSION = 1
+
+LICENSE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS licenses (
+    license_key TEXT PRIMARY KEY,
+    church_id TEXT NOT NULL,
+    church_name TEXT NOT NULL DEFAULT '',
+    plan_type TEXT NOT NULL DEFAULT 'trial',
+    days INTEGER NOT NULL,
+    start_date TEXT NOT NULL,
+    expire_date TEXT NOT NULL,
+    daily_limit INTEGER NOT NULL,
+    max_bulletins INTEGER NOT NULL,
+    is_active INTEGER NOT NULL DEFAULT 1,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_licenses_church ON licenses(church_id, is_active);
+
+CREATE TABLE IF NOT EXISTS license_usage (
+    license_key TEXT NOT NULL,
+    usage_date TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (license_key, usage_date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_license_usage_date ON license_usage(usage_date);
+"""
+
+LICENSE_COLUMNS = (
+    "license_key", "church_id", "church_name", "plan_type", "days", "start_date",
+    "expire_date", "daily_limit", "max_bulletins", "is_active", "created_at"
+)
 
 
 class LicenseManager:
     """라이선스 관리 클래스"""
 
-    def __init__(self):
-        self.license_data = self._load_license_data()
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path or LICENSE_DB_PATH)
         self.trial_days = int(os.environ.get('TRIAL_DAYS', 15))
         self.daily_limit = int(os.environ.get('DAILY_CONVERT_LIMIT', 10))
         self.max_bulletins = int(os.environ.get('MAX_BULLETINS', 30))
-
-    def _load_license_data(self) -> Dict:
-        """라이선스 데이터 로드"""
-        if LICENSE_FILE.exists():
-            try:
-                with open(LICENSE_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"라이선스 데이터 로드 실패: {e}")
-
-        # 기본 라이선스 데이터
-        return {
-            "licenses": {},
-            "usage": {},
-            "created_at": datetime.now().isoformat()
-        }
-
-    def _save_license_data(self):
-        """라이선스 데이터 저장"""
+        self.usage_retention_days = int(os.environ.get('LICENSE_USAGE_RETENTION_DAYS', 30))
+
+        # 스레드별 연결 (sqlite3 연결은 스레드 간 공유하지 않음)
+        self._local = threading.local()
+        self._last_cleanup_date: Optional[str] = None
+        self._cleanup_lock = threading.Lock()
+
+        self._init_db()
+
+    # ========== 저장소 ==========
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 (autocommit, 여러 문장은 _transaction으로 묶음)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=10, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=10000")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 트랜잭션 (BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡아 갱신 손실 방지)"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _init_db(self):
+        """테이블/인덱스 생성 및 기존 JSON 데이터 1회 이전"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        conn.executescript(LICENSE_SCHEMA)
+
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            self._migrate_json()
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _migrate_json(self):
+        """license_data.json(이전 저장소)의 라이선스/사용량을 SQLite로 가져오기"""
+        if not LICENSE_FILE.exists():
+            return
         try:
-            with open(LICENSE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.license_data, f, ensure_ascii=False, indent=2)
+            with open(LICENSE_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         except Exception as e:
-            logger.error(f"라이선스 데이터 저장 실패: {e}")
+            logger.error(f"라이선스 데이터 로드 실패: {e}")
+            return
+
+        licenses = data.get("licenses", {})
+        usage_rows = []
+        for usage_key, count in data.get("usage", {}).items():
+            # 사용량 키 형식: {라이선스 키}_{YYYY-MM-DD}
+            license_key, _, usage_date = usage_key.rpartition("_")
+            if license_key:
+                usage_rows.append((license_key, usage_date, int(count)))
+
+        with self._transaction() as conn:
+            conn.executemany(
+                f"INSERT OR IGNORE INTO licenses ({', '.join(LICENSE_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in LICENSE_COLUMNS)})",
+                [self._license_params({"license_key": key, **info}) for key, info in licenses.items()]
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO license_usage (license_key, usage_date, count) VALUES (?, ?, ?)",
+                usage_rows
+            )
+        logger.info(f"라이선스 데이터 이전 완료: 라이선스 {len(licenses)}개, 사용량 {len(usage_rows)}행")
+
+    def _license_params(self, info: Dict[str, Any]) -> tuple:
+        return (
+            info["license_key"],
+            info.get("church_id", ""),
+            info.get("church_name", ""),
+            info.get("plan_type", "trial"),
+            int(info.get("days", self.trial_days)),
+            info["start_date"],
+            info["expire_date"],
+            int(info.get("daily_limit", self.daily_limit)),
+            int(info.get("max_bulletins", self.max_bulletins)),
+            1 if info.get("is_active", True) else 0,
+            info.get("created_at") or info["start_date"],
+        )
+
+    @staticmethod
+    def _row_to_license(row: sqlite3.Row) -> Dict[str, Any]:
+        info = dict(row)
+        info["is_active"] = bool(info["is_active"])
+        return info
+
+    def _get_license(self, license_key: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute(
+            "SELECT * FROM licenses WHERE license_key = ?", (license_key,)
+        ).fetchone()
+        return self._row_to_license(row) if row else None
+
+    def _get_today_usage(self, license_key: str, today: Optional[str] = None) -> int:
+        today = today or datetime.now().strftime("%Y-%m-%d")
+        row = self._connect().execute(
+            "SELECT count FROM license_usage WHERE license_key = ? AND usage_date = ?",
+            (license_key, today)
+        ).fetchone()
+        return row[0] if row else 0
+
+    # ========== 라이선스 ==========
 
     def create_trial_license(self, church_id: str, church_name: str = "",
                              days: int = None) -> Dict[str, Any]:
@@ -89,8 +221,12 @@ class LicenseManager:
         }
 
         # 저장
-        self.license_data["licenses"][license_key] = license_info
-        self._save_license_data()
+        with self._transaction() as conn:
+            conn.execute(
+                f"INSERT INTO licenses ({', '.join(LICENSE_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in LICENSE_COLUMNS)})",
+                self._license_params(license_info)
+            )
 
         logger.info(f"체험판 라이선스 생성: {church_name} ({church_id}), {days}일")
         return license_info
@@ -114,7 +250,7 @@ class LicenseManager:
                 "license_info": dict
             }
         """
-        license_info = self.license_data["licenses"].get(license_key)
+        license_info = self._get_license(license_key)
 
         if not license_info:
             return {
@@ -151,7 +287,7 @@ class LicenseManager:
         remaining_days = (expire_date - now).days
 
         # 일일 사용량 확인
-        daily_remaining = self._get_daily_remaining(license_key)
+        daily_remaining = max(0, license_info["daily_limit"] - self._get_today_usage(license_key))
 
         return {
             "valid": True,
@@ -163,16 +299,9 @@ class LicenseManager:
 
     def _get_daily_remaining(self, license_key: str) -> int:
         """일일 남은 사용 횟수 조회"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        usage_key = f"{license_key}_{today}"
-
-        usage = self.license_data.get("usage", {})
-        today_usage = usage.get(usage_key, 0)
-
-        license_info = self.license_data["licenses"].get(license_key, {})
+        license_info = self._get_license(license_key) or {}
         daily_limit = license_info.get("daily_limit", self.daily_limit)
-
-        return max(0, daily_limit - today_usage)
+        return max(0, daily_limit - self._get_today_usage(license_key))
 
     def record_usage(self, license_key: str, action: str = "convert") -> Dict[str, Any]:
         """
@@ -198,19 +327,23 @@ class LicenseManager:
         #         "daily_remaining": 0
         #     }
 
-        # 사용량 기록
+        # 사용량 기록 (행 단위 원자적 증가)
         today = datetime.now().strftime("%Y-%m-%d")
-        usage_key = f"{license_key}_{today}"
-
-        if "usage" not in self.license_data:
-            self.license_data["usage"] = {}
-
-        self.license_data["usage"][usage_key] = \
-            self.license_data["usage"].get(usage_key, 0) + 1
-
-        self._save_license_data()
-
-        daily_remaining = validation["daily_remaining"] - 1
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO license_usage (license_key, usage_date, count) VALUES (?, ?, 1) "
+                "ON CONFLICT(license_key, usage_date) DO UPDATE SET count = count + 1",
+                (license_key, today)
+            )
+            today_usage = conn.execute(
+                "SELECT count FROM license_usage WHERE license_key = ? AND usage_date = ?",
+                (license_key, today)
+            ).fetchone()[0]
+
+        self._auto_cleanup(today)
+
+        daily_limit = validation["license_info"]["daily_limit"]
+        daily_remaining = max(0, daily_limit - today_usage)
         logger.info(f"사용량 기록: {license_key}, {action}, 남은 횟수: {daily_remaining}")
 
         return {
@@ -250,64 +383,87 @@ class LicenseManager:
 
     def deactivate_license(self, license_key: str) -> bool:
         """라이선스 비활성화"""
-        if license_key in self.license_data["licenses"]:
-            self.license_data["licenses"][license_key]["is_active"] = False
-            self._save_license_data()
+        with self._transaction() as conn:
+            updated = conn.execute(
+                "UPDATE licenses SET is_active = 0 WHERE license_key = ?", (license_key,)
+            ).rowcount
+        if updated:
             logger.info(f"라이선스 비활성화: {license_key}")
-            return True
-        return False
+        return bool(updated)
 
     def extend_license(self, license_key: str, days: int) -> bool:
         """라이선스 연장"""
-        if license_key not in self.license_data["licenses"]:
-            return False
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT expire_date FROM licenses WHERE license_key = ?", (license_key,)
+            ).fetchone()
+            if row is None:
+                return False
 
-        license_info = self.license_data["licenses"][license_key]
-        current_expire = datetime.fromisoformat(license_info["expire_date"])
+            current_expire = datetime.fromisoformat(row["expire_date"])
 
-        # 이미 만료된 경우 현재 날짜부터 연장
-        if current_expire < datetime.now():
-            current_expire = datetime.now()
+            # 이미 만료된 경우 현재 날짜부터 연장
+            if current_expire < datetime.now():
+                current_expire = datetime.now()
 
-        new_expire = current_expire + timedelta(days=days)
-        license_info["expire_date"] = new_expire.isoformat()
-        license_info["is_active"] = True
-        license_info["days"] += days
+            new_expire = current_expire + timedelta(days=days)
+            conn.execute(
+                "UPDATE licenses SET expire_date = ?, is_active = 1, days = days + ? WHERE license_key = ?",
+                (new_expire.isoformat(), days, license_key)
+            )
 
-        self._save_license_data()
         logger.info(f"라이선스 연장: {license_key}, +{days}일")
         return True
 
     def get_all_licenses(self) -> list:
         """모든 라이선스 목록"""
+        rows = self._connect().execute("SELECT * FROM licenses ORDER BY created_at").fetchall()
         licenses = []
-        for key, info in self.license_data.get("licenses", {}).items():
-            validation = self.validate_license(key)
+        for row in rows:
+            info = self._row_to_license(row)
+            validation = self.validate_license(info["license_key"])
             licenses.append({
-                "license_key": key,
                 **info,
                 "remaining_days": validation["remaining_days"],
                 "is_valid": validation["valid"]
             })
         return licenses
 
-    def cleanup_old_usage(self, days_to_keep: int = 30):
-        """오래된 사용량 데이터 정리"""
-        cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-        cutoff_str = cutoff_date.strftime("%Y-%m-%d")
-
-        usage = self.license_data.get("usage", {})
-        keys_to_delete = [
-            key for key in usage.keys()
-            if key.split("_")[-1] < cutoff_str
-        ]
-
-        for key in keys_to_delete:
-            del self.license_data["usage"][key]
-
-        if keys_to_delete:
-            self._save_license_data()
-            logger.info(f"오래된 사용량 데이터 {len(keys_to_delete)}개 삭제")
+    def get_church_licenses(self, church_id: str, active_only: bool = True) -> List[Dict[str, Any]]:
+        """교회 ID로 라이선스 조회 (최근 생성 순)"""
+        query = "SELECT * FROM licenses WHERE church_id = ?"
+        if active_only:
+            query += " AND is_active = 1"
+        rows = self._connect().execute(query + " ORDER BY created_at DESC", (church_id,)).fetchall()
+        return [self._row_to_license(row) for row in rows]
+
+    def cleanup_old_usage(self, days_to_keep: Optional[int] = None) -> int:
+        """오래된 사용량 데이터 정리, 삭제한 행 수 반환"""
+        if days_to_keep is None:
+            days_to_keep = self.usage_retention_days
+        cutoff_str = (datetime.now() - timedelta(days=days_to_keep)).strftime("%Y-%m-%d")
+
+        with self._transaction() as conn:
+            deleted = conn.execute(
+                "DELETE FROM license_usage WHERE usage_date < ?", (cutoff_str,)
+            ).rowcount
+
+        if deleted:
+            logger.info(f"오래된 사용량 데이터 {deleted}개 삭제")
+        return deleted
+
+    def _auto_cleanup(self, today: str):
+        """보관 기간이 지난 사용량 행 정리 (날짜가 바뀐 뒤 첫 기록 시 한 번)"""
+        if self._last_cleanup_date == today:
+            return
+        with self._cleanup_lock:
+            if self._last_cleanup_date == today:
+                return
+            self._last_cleanup_date = today
+        try:
+            self.cleanup_old_usage()
+        except sqlite3.Error as e:
+            logger.warning(f"사용량 데이터 자동 정리 실패: {e}")
 
 
 # 싱글톤 인스턴스
@@ -331,17 +487,16 @@ def create_fgfc_trial_license() -> Dict[str, Any]:
     manager = get_license_manager()
 
     # 기존 라이선스 확인
-    for key, info in manager.license_data.get("licenses", {}).items():
-        if info.get("church_id") == "fgfc" and info.get("is_active"):
-            validation = manager.validate_license(key)
-            if validation["valid"]:
-                logger.info(f"기존 유효한 라이선스 사용: {key}")
-                return {
-                    "license_key": key,
-                    **info,
-                    "remaining_days": validation["remaining_days"],
-                    "is_new": False
-                }
+    for info in manager.get_church_licenses("fgfc"):
+        key = info["license_key"]
+        validation = manager.validate_license(key)
+        if validation["valid"]:
+            logger.info(f"기존 유효한 라이선스 사용: {key}")
+            return {
+                **info,
+                "remaining_days": validation["remaining_days"],
+                "is_new": False
+            }
 
     # 새 라이선스 생성
     license_info = manager.create_trial_license(
@@ -1,15 +1,23 @@
 """
 엔진 보안 시스템
 PDF AI 엔진의 외부 유출 방지 및 접근 제어
+
+- API 키 검증: 키 해시 → key_id 인덱스로 O(1) 조회
+- 사용 횟수/마지막 사용 시각은 메모리에서 갱신 후 주기적으로(ENGINE_USAGE_FLUSH_SECONDS) 또는 종료 시 저장
+- 감사 로그: 배치 단위로 암호화해 세그먼트 파일에 추가만 하는 로그 (AuditLogStore)
 """
 
+import os
+import atexit
 import logging
 import hashlib
 import hmac
 import secrets
 import json
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import threading
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Any, Optional, Tuple, Union
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from cryptography.fernet import Fernet
@@ -47,6 +55,231 @@ class AuditLog:
     details: Dict[str, Any]
 
 
+class AuditLogStore:
+    """
+    추가 전용(append-only) 감사 로그 저장소
+
+    - 레코드를 batch_size개(또는 flush_interval초)마다 묶어 Fernet으로 암호화한 뒤 세그먼트 파일에 한 줄로 추가
+      줄 형식: {첫 timestamp}\t{마지막 timestamp}\t{레코드 수}\t{Fernet 토큰}
+      (시각/개수만 평문 → 기간 조회 시 범위 밖 배치는 복호화하지 않고 건너뜀)
+    - 세그먼트가 segment_max_mb를 넘으면 새 세그먼트로 교체, max_segments개를 넘으면 가장 오래된 세그먼트 삭제
+    - 이전 형식(audit_logs.enc) 레코드는 0번 세그먼트로 한 번에 가져옴 (import_legacy)
+    - 메모리에는 최근 tail_size개만 유지
+    """
+
+    SEGMENT_PREFIX = "audit-"
+    SEGMENT_SUFFIX = ".log"
+
+    def __init__(self, directory: Path, cipher: Fernet, batch_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None, segment_max_mb: Optional[float] = None,
+                 max_segments: Optional[int] = None, tail_size: Optional[int] = None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.cipher = cipher
+
+        self.batch_size = max(1, batch_size or int(os.getenv("AUDIT_BATCH_SIZE", "50")))
+        self.flush_interval = flush_interval if flush_interval is not None else float(os.getenv("AUDIT_FLUSH_SECONDS", "5"))
+        self.segment_max_bytes = int((segment_max_mb or float(os.getenv("AUDIT_SEGMENT_MAX_MB", "4"))) * 1024 * 1024)
+        self.max_segments = max(1, max_segments or int(os.getenv("AUDIT_MAX_SEGMENTS", "50")))
+
+        self.tail: Deque[AuditLog] = deque(maxlen=tail_size or int(os.getenv("AUDIT_TAIL_SIZE", "1000")))
+        self._pending: List[Dict[str, Any]] = []
+        # 세그먼트 경로 -> 저장된 레코드 수
+        self._segment_counts: Dict[Path, int] = {}
+        self._lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+
+        self._load()
+
+    # ---------- 세그먼트 ----------
+
+    def _segment_path(self, index: int) -> Path:
+        return self.directory / f"{self.SEGMENT_PREFIX}{index:06d}{self.SEGMENT_SUFFIX}"
+
+    @classmethod
+    def _segment_index(cls, path: Path) -> int:
+        return int(path.name[len(cls.SEGMENT_PREFIX):-len(cls.SEGMENT_SUFFIX)])
+
+    def _segments(self) -> List[Path]:
+        return sorted(self.directory.glob(f"{self.SEGMENT_PREFIX}*{self.SEGMENT_SUFFIX}"), key=self._segment_index)
+
+    @staticmethod
+    def _iter_headers(path: Path) -> Iterator[Tuple[str, str, int, str]]:
+        """세그먼트의 배치 줄 (첫 시각, 마지막 시각, 레코드 수, 토큰)"""
+        try:
+            with open(path, "r", encoding="ascii") as f:
+                for line in f:
+                    parts = line.rstrip("\n").split("\t", 3)
+                    if len(parts) == 4:
+                        yield parts[0], parts[1], int(parts[2]), parts[3]
+        except (OSError, ValueError) as e:
+            logger.error(f"감사 로그 세그먼트 읽기 실패: {path.name} - {e}")
+
+    def _decrypt_batch(self, token: str) -> List[Dict[str, Any]]:
+        try:
+            return json.loads(self.cipher.decrypt(token.encode("ascii")).decode("utf-8"))
+        except Exception as e:
+            logger.error(f"감사 로그 배치 복호화 실패: {e}")
+            return []
+
+    def _load(self):
+        """세그먼트별 레코드 수 집계(평문 헤더만) + 최근 배치만 복호화해 tail 구성"""
+        batches: List[str] = []
+        for path in self._segments():
+            count = 0
+            for _, _, n, token in self._iter_headers(path):
+                count += n
+                batches.append(token)
+            self._segment_counts[path] = count
+
+        records: List[Dict[str, Any]] = []
+        for token in reversed(batches):
+            if len(records) >= self.tail.maxlen:
+                break
+            records[:0] = self._decrypt_batch(token)
+        self.tail.extend(AuditLog(**r) for r in records[-self.tail.maxlen:])
+
+        if self._segment_counts:
+            logger.info(f"감사 로그 {self.count}개 ({len(self._segment_counts)}개 세그먼트)")
+
+    # ---------- 기록 ----------
+
+    @property
+    def count(self) -> int:
+        """보관 중인 전체 레코드 수 (저장 대기 포함)"""
+        return sum(self._segment_counts.values()) + len(self._pending)
+
+    def append(self, log: AuditLog):
+        """레코드 추가 (배치가 차면 바로 저장, 아니면 flush_interval 후 저장)"""
+        with self._lock:
+            self._pending.append(asdict(log))
+            self.tail.append(log)
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+            elif self._flush_timer is None and self.flush_interval > 0:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """저장 대기 중인 레코드를 배치 하나로 기록"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        timer, self._flush_timer = self._flush_timer, None
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+        if not self._pending:
+            return
+
+        records, self._pending = self._pending, []
+        line = self._batch_line(records)
+
+        segments = self._segments()
+        path = segments[-1] if segments else self._segment_path(1)
+        if path.exists() and path.stat().st_size + len(line) > self.segment_max_bytes:
+            path = self._segment_path(self._segment_index(path) + 1)
+
+        try:
+            with open(path, "a", encoding="ascii") as f:
+                f.write(line)
+        except OSError as e:
+            logger.error(f"감사 로그 저장 실패: {e}")
+            self._pending[:0] = records
+            return
+        self._segment_counts[path] = self._segment_counts.get(path, 0) + len(records)
+
+        self._enforce_retention_locked()
+
+    def _batch_line(self, records: List[Dict[str, Any]]) -> str:
+        token = self.cipher.encrypt(json.dumps(records, ensure_ascii=False).encode("utf-8")).decode("ascii")
+        return f"{records[0]['timestamp']}\t{records[-1]['timestamp']}\t{len(records)}\t{token}\n"
+
+    def import_legacy(self, logs: List[AuditLog]) -> bool:
+        """
+        이전 형식 레코드를 0번 세그먼트(가장 오래된 위치)로 기록
+
+        모든 배치를 임시 파일에 쓴 뒤 원자적으로 교체 → 중간에 실패하면 아무것도 남지 않고,
+        0번 세그먼트가 이미 있으면 이전이 끝난 것으로 보고 다시 가져오지 않음 (False 반환)
+        """
+        path = self._segment_path(0)
+        with self._lock:
+            if path.exists():
+                return False
+            if logs:
+                tmp_path = path.with_name(f"{path.name}.tmp")
+                try:
+                    with open(tmp_path, "w", encoding="ascii") as f:
+                        for start in range(0, len(logs), self.batch_size):
+                            f.write(self._batch_line([asdict(log) for log in logs[start:start + self.batch_size]]))
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    try:
+                        tmp_path.unlink()
+                    except OSError:
+                        pass
+                    raise
+                self._segment_counts[path] = len(logs)
+
+                # 이전 레코드는 현재 tail보다 오래됨
+                recent = list(self.tail)
+                self.tail.clear()
+                self.tail.extend((list(logs) + recent)[-self.tail.maxlen:])
+
+                self._enforce_retention_locked()
+        return True
+
+    def _enforce_retention_locked(self):
+        segments = self._segments()
+        for path in segments[:max(0, len(segments) - self.max_segments)]:
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.warning(f"감사 로그 세그먼트 삭제 실패: {path.name} - {e}")
+                continue
+            removed = self._segment_counts.pop(path, 0)
+            logger.info(f"오래된 감사 로그 세그먼트 삭제: {path.name} ({removed}개)")
+
+    # ---------- 조회 ----------
+
+    def recent(self, limit: int = 100) -> List[AuditLog]:
+        """최근 레코드 (메모리 tail)"""
+        with self._lock:
+            return list(self.tail)[-limit:] if limit else list(self.tail)
+
+    def read_range(self, start: Union[str, datetime, None] = None, end: Union[str, datetime, None] = None,
+                   limit: Optional[int] = None, action: Optional[str] = None) -> List[AuditLog]:
+        """
+        기간 조회 (시간순)
+
+        Args:
+            start, end: 조회 기간 (ISO 문자열 또는 datetime, 양끝 포함)
+            limit: 조건에 맞는 레코드 중 가장 최근 limit개만 반환
+            action: 작업 유형 필터
+        """
+        start = start.isoformat() if isinstance(start, datetime) else start
+        end = end.isoformat() if isinstance(end, datetime) else end
+        self.flush()
+
+        matched: Deque[AuditLog] = deque(maxlen=limit or None)
+        for path in self._segments():
+            for first, last, _, token in self._iter_headers(path):
+                if (start and last < start) or (end and first > end):
+                    continue
+                for record in self._decrypt_batch(token):
+                    ts = record["timestamp"]
+                    if (start and ts < start) or (end and ts > end):
+                        continue
+                    if action and record["action"] != action:
+                        continue
+                    matched.append(AuditLog(**record))
+        return list(matched)
+
+    def close(self):
+        """남은 레코드 저장"""
+        self.flush()
+
 class EngineSecurityManager:
     """엔진 보안 관리자"""
 
@@ -56,12 +289,21 @@ class EngineSecurityManager:
 
         # 보안 파일
         self.keys_file = self.config_path / "api_keys.enc"
-        self.audit_file = self.config_path / "audit_logs.enc"
+        self.audit_file = self.config_path / "audit_logs.enc"  # 이전 형식 (전체 덮어쓰기), 첫 실행 시 이전
+        self.audit_dir = self.config_path / "audit"
         self.master_key_file = self.config_path / ".master_key"
 
         # 메모리 캐시
         self.api_keys: Dict[str, APIKey] = {}
-        self.audit_logs: List[AuditLog] = []
+        self.audit_store: Optional[AuditLogStore] = None
+        # 키 해시 -> key_id (검증 시 전체 키 순회 없이 조회)
+        self._hash_index: Dict[str, str] = {}
+        self._keys_lock = threading.RLock()
+
+        # 사용 통계 지연 저장
+        self.usage_flush_interval = float(os.getenv("ENGINE_USAGE_FLUSH_SECONDS", "30"))
+        self._usage_dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
 
         # 암호화 키
         self.cipher: Optional[Fernet] = None
@@ -69,6 +311,9 @@ class EngineSecurityManager:
         # 초기화
         self._initialize_security()
 
+        # 종료 시 남은 사용 통계/감사 로그 저장
+        atexit.register(self.close)
+
         logger.info("보안 시스템 초기화 완료")
 
     def _initialize_security(self):
@@ -106,84 +351,67 @@ class EngineSecurityManager:
                 for key_data in keys_data:
                     api_key = APIKey(**key_data)
                     self.api_keys[api_key.key_id] = api_key
+                    self._hash_index[api_key.key_hash] = api_key.key_id
 
                 logger.info(f"{len(self.api_keys)}개 API 키 로드됨")
         except Exception as e:
             logger.error(f"API 키 로드 실패: {e}")
 
     def _save_api_keys(self):
-        """API 키 저장"""
+        """API 키 저장 (임시 파일에 쓴 뒤 교체)"""
         try:
-            keys_data = [
-                {
-                    "key_id": k.key_id,
-                    "key_hash": k.key_hash,
-                    "name": k.name,
-                    "permissions": k.permissions,
-                    "created_at": k.created_at,
-                    "expires_at": k.expires_at,
-                    "is_active": k.is_active,
-                    "usage_count": k.usage_count,
-                    "last_used": k.last_used
-                }
-                for k in self.api_keys.values()
-            ]
-
-            json_data = json.dumps(keys_data, ensure_ascii=False, indent=2)
-            encrypted_data = self.cipher.encrypt(json_data.encode('utf-8'))
-
-            with open(self.keys_file, 'wb') as f:
-                f.write(encrypted_data)
+            with self._keys_lock:
+                self._usage_dirty = False
+                keys_data = [
+                    {
+                        "key_id": k.key_id,
+                        "key_hash": k.key_hash,
+                        "name": k.name,
+                        "permissions": k.permissions,
+                        "created_at": k.created_at,
+                        "expires_at": k.expires_at,
+                        "is_active": k.is_active,
+                        "usage_count": k.usage_count,
+                        "last_used": k.last_used
+                    }
+                    for k in self.api_keys.values()
+                ]
+
+                json_data = json.dumps(keys_data, ensure_ascii=False)
+                encrypted_data = self.cipher.encrypt(json_data.encode('utf-8'))
+
+                tmp_file = self.keys_file.with_suffix(".enc.tmp")
+                with open(tmp_file, 'wb') as f:
+                    f.write(encrypted_data)
+                os.replace(tmp_file, self.keys_file)
 
             logger.info("API 키 저장 완료")
         except Exception as e:
             logger.error(f"API 키 저장 실패: {e}")
 
     def _load_audit_logs(self):
-        """감사 로그 로드"""
-        try:
-            if self.audit_file.exists():
-                with open(self.audit_file, 'rb') as f:
-                    encrypted_data = f.read()
-
-                decrypted_data = self.cipher.decrypt(encrypted_data)
-                logs_data = json.loads(decrypted_data.decode('utf-8'))
-
-                self.audit_logs = [AuditLog(**log_data) for log_data in logs_data]
-
-                logger.info(f"{len(self.audit_logs)}개 감사 로그 로드됨")
-        except Exception as e:
-            logger.error(f"감사 로그 로드 실패: {e}")
+        """감사 로그 저장소 열기 (이전 형식 audit_logs.enc가 있으면 한 번만 이전)"""
+        self.audit_store = AuditLogStore(self.audit_dir, self.cipher)
 
-    def _save_audit_logs(self):
-        """감사 로그 저장"""
+        if not self.audit_file.exists():
+            return
         try:
-            # 최근 10000개만 유지
-            recent_logs = self.audit_logs[-10000:]
-
-            logs_data = [
-                {
-                    "log_id": log.log_id,
-                    "timestamp": log.timestamp,
-                    "api_key_id": log.api_key_id,
-                    "action": log.action,
-                    "resource": log.resource,
-                    "ip_address": log.ip_address,
-                    "success": log.success,
-                    "details": log.details
-                }
-                for log in recent_logs
-            ]
+            with open(self.audit_file, 'rb') as f:
+                encrypted_data = f.read()
 
-            json_data = json.dumps(logs_data, ensure_ascii=False, indent=2)
-            encrypted_data = self.cipher.encrypt(json_data.encode('utf-8'))
+            decrypted_data = self.cipher.decrypt(encrypted_data)
+            logs_data = json.loads(decrypted_data.decode('utf-8'))
 
-            with open(self.audit_file, 'wb') as f:
-                f.write(encrypted_data)
+            # 모든 레코드를 먼저 검증 (하나라도 잘못되면 아무것도 기록하지 않고 다음 실행 때 다시 시도)
+            logs = [AuditLog(**log_data) for log_data in logs_data]
+            if self.audit_store.import_legacy(logs):
+                logger.info(f"이전 감사 로그 {len(logs)}개 이전됨")
+            else:
+                logger.info("이전 감사 로그는 이미 이전됨 - 원본 파일만 정리")
 
-            logger.info("감사 로그 저장 완료")
+            self.audit_file.rename(self.audit_file.with_suffix(".enc.migrated"))
         except Exception as e:
-            logger.error(f"감사 로그 저장 실패: {e}")
+            logger.error(f"감사 로그 로드 실패: {e}")
 
     def create_api_key(
         self,
@@ -231,7 +459,9 @@ class EngineSecurityManager:
             last_used=None
         )
 
-        self.api_keys[key_id] = api_key_obj
+        with self._keys_lock:
+            self.api_keys[key_id] = api_key_obj
+            self._hash_index[key_hash] = key_id
         self._save_api_keys()
 
         # 감사 로그
@@ -257,33 +487,59 @@ class EngineSecurityManager:
         Returns:
             검증된 APIKey 객체 또는 None
         """
-        # 키 해시 계산
-        key_hash = hashlib.sha256(api_key.encode()).hexdigest()
-
-        # 모든 키와 비교
-        for api_key_obj in self.api_keys.values():
-            if api_key_obj.key_hash == key_hash:
-                # 활성 상태 확인
-                if not api_key_obj.is_active:
-                    logger.warning(f"비활성화된 API 키 사용 시도: {api_key_obj.key_id}")
-                    return None
-
-                # 만료 확인
-                if api_key_obj.expires_at:
-                    expires_at = datetime.fromisoformat(api_key_obj.expires_at)
-                    if datetime.now() > expires_at:
-                        logger.warning(f"만료된 API 키 사용 시도: {api_key_obj.key_id}")
-                        return None
+        if not api_key:
+            return None
 
-                # 사용 통계 업데이트
-                api_key_obj.usage_count += 1
-                api_key_obj.last_used = datetime.now().isoformat()
-                self._save_api_keys()
-
-                return api_key_obj
-
-        logger.warning("유효하지 않은 API 키 사용 시도")
-        return None
+        # 키 해시 계산 후 인덱스 조회
+        key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+        key_id = self._hash_index.get(key_hash)
+        api_key_obj = self.api_keys.get(key_id) if key_id else None
+
+        if api_key_obj is None or not hmac.compare_digest(api_key_obj.key_hash, key_hash):
+            logger.warning("유효하지 않은 API 키 사용 시도")
+            return None
+
+        # 활성 상태 확인
+        if not api_key_obj.is_active:
+            logger.warning(f"비활성화된 API 키 사용 시도: {api_key_obj.key_id}")
+            return None
+
+        # 만료 확인
+        if api_key_obj.expires_at:
+            expires_at = datetime.fromisoformat(api_key_obj.expires_at)
+            if datetime.now() > expires_at:
+                logger.warning(f"만료된 API 키 사용 시도: {api_key_obj.key_id}")
+                return None
+
+        # 사용 통계 업데이트 (저장은 flush_usage에서 일괄 처리)
+        with self._keys_lock:
+            api_key_obj.usage_count += 1
+            api_key_obj.last_used = datetime.now().isoformat()
+            self._usage_dirty = True
+            self._schedule_usage_flush()
+
+        return api_key_obj
+
+    def _schedule_usage_flush(self):
+        """사용 통계 저장 예약 (예약된 저장이 없을 때만)"""
+        if self._flush_timer is not None:
+            return
+        if self.usage_flush_interval <= 0:
+            self._save_api_keys()
+            return
+        self._flush_timer = threading.Timer(self.usage_flush_interval, self.flush_usage)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def flush_usage(self):
+        """버퍼링된 사용 통계를 파일에 저장 (변경이 없으면 생략)"""
+        with self._keys_lock:
+            timer, self._flush_timer = self._flush_timer, None
+            if timer is not None and timer is not threading.current_thread():
+                timer.cancel()
+            if not self._usage_dirty:
+                return
+        self._save_api_keys()
 
     def check_permission(self, api_key_obj: APIKey, required_permission: str) -> bool:
         """
@@ -328,11 +584,7 @@ class EngineSecurityManager:
             details=details
         )
 
-        self.audit_logs.append(log)
-
-        # 주기적으로 저장 (100개마다)
-        if len(self.audit_logs) % 100 == 0:
-            self._save_audit_logs()
+        self.audit_store.append(log)
 
     def audit(
         self,
@@ -366,7 +618,8 @@ class EngineSecurityManager:
     def revoke_api_key(self, key_id: str):
         """API 키 비활성화"""
         if key_id in self.api_keys:
-            self.api_keys[key_id].is_active = False
+            with self._keys_lock:
+                self.api_keys[key_id].is_active = False
             self._save_api_keys()
 
             self._add_audit_log(
@@ -379,15 +632,29 @@ class EngineSecurityManager:
 
             logger.info(f"API 키 비활성화: {key_id}")
 
-    def get_security_report(self) -> Dict[str, Any]:
-        """보안 리포트 생성"""
+    def get_security_report(
+        self,
+        since: Union[str, datetime, None] = None,
+        until: Union[str, datetime, None] = None,
+        limit: int = 100
+    ) -> Dict[str, Any]:
+        """
+        보안 리포트 생성
+
+        Args:
+            since, until: 활동 조회 기간 (미지정 시 메모리의 최근 기록)
+            limit: 최근 활동 최대 개수
+        """
         active_keys = [k for k in self.api_keys.values() if k.is_active]
-        recent_logs = self.audit_logs[-100:]
+        if since or until:
+            recent_logs = self.audit_store.read_range(since, until, limit=limit)
+        else:
+            recent_logs = self.audit_store.recent(limit)
 
         return {
             "total_api_keys": len(self.api_keys),
             "active_api_keys": len(active_keys),
-            "total_audit_logs": len(self.audit_logs),
+            "total_audit_logs": self.audit_store.count,
             "recent_activities": [
                 {
                     "timestamp": log.timestamp,
@@ -406,6 +673,12 @@ class EngineSecurityManager:
             ]
         }
 
+    def close(self):
+        """버퍼링된 사용 통계와 감사 로그 저장"""
+        self.flush_usage()
+        if self.audit_store is not None:
+            self.audit_store.close()
+
     def encrypt_data(self, data: bytes) -> bytes:
         """데이터 암호화"""
         return self.cipher.encrypt(data)
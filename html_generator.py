@@ -6,11 +6,13 @@ HTML 생성 모듈 v6
 - Bottom Navigation
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
 import re
 import json
 
+from html_stream import iter_slots, slot
+
 # 교회 주보 전용 생성기 (선거 홍보물과 완전 분리)
 from church_html_generator import get_church_bulletin_generator
 
@@ -54,19 +56,29 @@ class HTMLGenerator:
         job_id: str = ""
     ) -> str:
         """콘텐츠 유형에 따라 적절한 HTML 생성"""
+        return "".join(self.generate_html_chunks(extracted_data, title, content_type, job_id))
+
+    def generate_html_chunks(
+        self,
+        extracted_data: Dict[str, Any],
+        title: str,
+        content_type: str = "general",
+        job_id: str = ""
+    ) -> Iterator[str]:
+        """generate_html의 청크 버전 - 페이지 본문을 한 페이지씩 만들면서 내보냄 (write_output에 그대로 전달)"""
         if content_type == "election":
-            return self._generate_election_html(extracted_data, title, job_id)
+            return self._iter_election_html(extracted_data, title, job_id)
         elif content_type == "church":
-            return self._generate_church_html(extracted_data, title, job_id)
+            return self._iter_church_html(extracted_data, title, job_id)
         else:
-            return self._generate_general_html(extracted_data, title, job_id)
+            return self._iter_general_html(extracted_data, title, job_id)
 
-    def _generate_election_html(
+    def _iter_election_html(
         self,
         extracted_data: Dict[str, Any],
         title: str,
         job_id: str
-    ) -> str:
+    ) -> Iterator[str]:
         """선거 홍보물 HTML 생성 - 홍태용 스타일"""
         pages = extracted_data.get("pages", [])
         structured_data = extracted_data.get("structured_data", {})
@@ -87,7 +99,7 @@ class HTMLGenerator:
         # 실적 추출
         careers = info.get("careers", [])
 
-        return f'''<!DOCTYPE html>
+        skeleton = f'''<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
@@ -530,7 +542,7 @@ class HTMLGenerator:
     <!-- Full Text Section -->
     <section class="section" id="fulltext">
         <h2 class="section-title"><span class="icon">📄</span> 전문보기</h2>
-        {self._generate_page_contents_html(pages)}
+        {slot("page-contents")}
     </section>
 
     <!-- Career Section (마지막에 위치) -->
@@ -614,6 +626,7 @@ class HTMLGenerator:
 
 </body>
 </html>'''
+        return iter_slots(skeleton, {"page-contents": self._iter_page_contents_html(pages)})
 
     def _extract_election_info(self, text: str, title: str, structured_data: Dict = None) -> Dict:
         """텍스트에서 선거 정보 추출 - 확장된 구조"""
@@ -1039,12 +1052,8 @@ class HTMLGenerator:
         </div>
     </section>'''
 
-    def _generate_page_contents_html(self, pages: List[Dict]) -> str:
-        """페이지별 내용 HTML 생성"""
-        if not pages:
-            return ""
-
-        html = ""
+    def _iter_page_contents_html(self, pages: List[Dict]) -> Iterator[str]:
+        """페이지별 내용 HTML 생성 (페이지 하나씩)"""
         for page in pages:
             page_num = page.get("page_number", 1)
             text = page.get("text", "").strip()
@@ -1053,14 +1062,12 @@ class HTMLGenerator:
                 # 텍스트 포맷팅
                 formatted_text = self._format_page_text(text)
 
-                html += f'''
+                yield f'''
         <div class="page-content">
             <h4>📄 페이지 {page_num}</h4>
             {formatted_text}
         </div>'''
 
-        return html
-
     def _format_page_text(self, text: str) -> str:
         """페이지 텍스트 포맷팅"""
         if not text:
@@ -1081,16 +1088,16 @@ class HTMLGenerator:
 
         return '\n            '.join(formatted)
 
-    def _generate_general_html(
+    def _iter_general_html(
         self,
         extracted_data: Dict[str, Any],
         title: str,
         job_id: str
-    ) -> str:
+    ) -> Iterator[str]:
         """일반 문서 HTML 생성"""
         pages = extracted_data.get("pages", [])
 
-        return f'''<!DOCTYPE html>
+        skeleton = f'''<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
@@ -1126,24 +1133,23 @@ class HTMLGenerator:
 </head>
 <body>
     <h1>{title}</h1>
-    {self._generate_general_pages_html(pages)}
+    {slot("pages")}
 </body>
 </html>'''
+        return iter_slots(skeleton, {"pages": self._iter_general_pages_html(pages)})
 
-    def _generate_general_pages_html(self, pages: List[Dict]) -> str:
-        """일반 문서 페이지 HTML"""
-        html = ""
+    def _iter_general_pages_html(self, pages: List[Dict]) -> Iterator[str]:
+        """일반 문서 페이지 HTML (페이지 하나씩)"""
         for page in pages:
             page_num = page.get("page_number", 1)
             text = page.get("text", "").strip()
             if text:
                 formatted = self._format_page_text(text)
-                html += f'''
+                yield f'''
     <div class="page">
         <h3 class="page-header">페이지 {page_num}</h3>
         {formatted}
     </div>'''
-        return html
 
     def _generate_manifesto_section_html(self, manifesto: Dict) -> str:
         """출사표 섹션 HTML 생성"""
@@ -1430,19 +1436,19 @@ class HTMLGenerator:
         </div>
     </section>'''
 
-    def _generate_church_html(
+    def _iter_church_html(
         self,
         extracted_data: Dict[str, Any],
         title: str,
         job_id: str
-    ) -> str:
+    ) -> Iterator[str]:
         """
         교회 주보 HTML 생성 - 전용 생성기 모듈로 위임
         선거 홍보물과 완전히 분리된 독립 템플릿 사용
         """
         # 교회 주보 전용 생성기 사용
         generator = get_church_bulletin_generator()
-        return generator.generate(extracted_data, title)
+        return generator.generate_chunks(extracted_data, title)
 
     def _generate_church_html_legacy(
         self,
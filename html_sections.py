@@ -0,0 +1,153 @@
+"""
+HTML 섹션 편집 모듈 - 생성기가 출력한 <section id="..."> 단위로 HTML을 조회/부분 수정
+
+- 섹션 위치 탐색: <section> 태그 중첩을 추적해 id별 (시작, 끝) 범위 계산
+  (<script>/<style>/주석 안의 문자열은 무시)
+- 패치 적용: AI가 돌려준 작업 목록(JSON)을 원본 위치 기준으로 한 번에 적용
+  → 전체 HTML을 다시 받지 않고 바뀐 부분만 주고받음
+
+패치 작업:
+    {"op": "replace_text", "id": "worship", "find": "11:00", "replace": "11:30"}
+    {"op": "replace", "id": "news", "html": "<section id=\"news\">...</section>"}
+    {"op": "insert_after", "id": "news", "html": "<section id=\"notice\">...</section>"}
+    {"op": "insert_before", "id": "news", "html": "..."}
+    {"op": "remove", "id": "choir"}
+"""
+
+import re
+import html as html_lib
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SECTION_TAG = re.compile(r"<(/?)section\b[^>]*>", re.IGNORECASE)
+_ID_ATTR = re.compile(r"""\bid\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE)
+_OPAQUE_BLOCK = re.compile(r"<script\b.*?</script\s*>|<style\b.*?</style\s*>|<!--.*?-->", re.IGNORECASE | re.DOTALL)
+_TAG = re.compile(r"<[^>]+>")
+_SPACES = re.compile(r"\s+")
+
+PATCH_OPS = ("replace_text", "replace", "insert_after", "insert_before", "remove")
+
+
+class SectionPatchError(ValueError):
+    """패치 작업을 적용할 수 없음 (섹션/텍스트 없음, 범위 겹침 등)"""
+
+
+@dataclass
+class HtmlSection:
+    """id가 있는 <section> 요소 하나의 위치"""
+    id: str
+    start: int  # <section 시작
+    end: int    # </section> 끝 (다음 문자 위치)
+
+    def outer_html(self, html: str) -> str:
+        return html[self.start:self.end]
+
+
+def find_sections(html: str) -> Dict[str, HtmlSection]:
+    """id가 있는 섹션 위치 (문서 순서, 같은 id가 반복되면 'id#2'처럼 번호를 붙임)"""
+    opaque = [(m.start(), m.end()) for m in _OPAQUE_BLOCK.finditer(html)]
+
+    def in_opaque(pos: int) -> bool:
+        return any(start <= pos < end for start, end in opaque)
+
+    sections: Dict[str, HtmlSection] = {}
+    stack: List[Tuple[Optional[str], int]] = []
+    for match in _SECTION_TAG.finditer(html):
+        if in_opaque(match.start()):
+            continue
+        if not match.group(1):
+            id_match = _ID_ATTR.search(match.group(0))
+            section_id = next((g for g in id_match.groups() if g is not None), None) if id_match else None
+            stack.append((section_id, match.start()))
+            continue
+        if not stack:
+            continue
+        section_id, start = stack.pop()
+        if not section_id:
+            continue
+        key, n = section_id, 1
+        while key in sections:
+            n += 1
+            key = f"{section_id}#{n}"
+        sections[key] = HtmlSection(key, start, match.end())
+
+    return dict(sorted(sections.items(), key=lambda item: item[1].start))
+
+
+def section_text(fragment: str) -> str:
+    """태그/스크립트를 뺀 본문 텍스트 (공백 정리)"""
+    text = _TAG.sub(" ", _OPAQUE_BLOCK.sub(" ", fragment))
+    return _SPACES.sub(" ", html_lib.unescape(text)).strip()
+
+
+def section_outline(html: str, preview_chars: int = 120) -> List[Dict[str, Any]]:
+    """섹션 목록 - id, HTML 길이, 본문 미리보기"""
+    outline = []
+    for section in find_sections(html).values():
+        outer = section.outer_html(html)
+        outline.append({
+            "id": section.id,
+            "length": len(outer),
+            "preview": section_text(outer)[:preview_chars],
+        })
+    return outline
+
+
+def apply_section_patch(html: str, ops: List[Dict[str, Any]]) -> Tuple[str, List[Dict[str, Any]]]:
+    """패치 작업 목록을 원본 위치 기준으로 적용
+
+    모든 작업은 적용 전 원본 HTML의 섹션 위치로 해석되며, 범위가 겹치면 SectionPatchError.
+
+    Returns:
+        (수정된 HTML, 적용된 작업 목록)
+    """
+    sections = find_sections(html)
+    edits: List[Tuple[int, int, str, Dict[str, Any]]] = []
+
+    for op in ops:
+        if not isinstance(op, dict):
+            raise SectionPatchError(f"잘못된 패치 작업: {op!r}")
+        kind, section_id = op.get("op"), op.get("id")
+        if kind not in PATCH_OPS:
+            raise SectionPatchError(f"지원하지 않는 패치 작업: {kind}")
+        section = sections.get(section_id)
+        if section is None:
+            raise SectionPatchError(f"섹션을 찾을 수 없습니다: {section_id}")
+
+        if kind == "replace_text":
+            find = op.get("find") or ""
+            outer = section.outer_html(html)
+            index = outer.find(find) if find else -1
+            if index < 0:
+                raise SectionPatchError(f"'{section_id}' 섹션에서 바꿀 내용을 찾을 수 없습니다: {find[:50]}")
+            start = section.start + index
+            edits.append((start, start + len(find), op.get("replace", ""), op))
+        elif kind == "replace":
+            edits.append((section.start, section.end, op.get("html", ""), op))
+        elif kind == "remove":
+            edits.append((section.start, section.end, "", op))
+        elif kind == "insert_after":
+            edits.append((section.end, section.end, op.get("html", ""), op))
+        else:  # insert_before
+            edits.append((section.start, section.start, op.get("html", ""), op))
+
+    edits.sort(key=lambda edit: (edit[0], edit[1]))
+    for previous, current in zip(edits, edits[1:]):
+        if current[0] < previous[1]:
+            raise SectionPatchError(
+                f"패치 범위가 겹칩니다: {previous[3].get('op')}({previous[3].get('id')}), "
+                f"{current[3].get('op')}({current[3].get('id')})"
+            )
+
+    # 뒤에서부터 적용해 앞쪽 위치가 밀리지 않게 함
+    parts = []
+    cursor = len(html)
+    for start, end, replacement, _ in reversed(edits):
+        parts.append(html[end:cursor])
+        parts.append(replacement)
+        cursor = start
+    parts.append(html[:cursor])
+    return "".join(reversed(parts)), [edit[3] for edit in edits]
@@ -0,0 +1,111 @@
+"""
+HTML 스트리밍 출력 모듈 - 큰 결과물을 하나의 문자열로 합치지 않고 청크 단위로 파일/응답에 기록
+
+- 생성기는 페이지 골격(head/CSS/JS 등 고정 부분)만 f-string으로 만들고,
+  문서 크기에 비례하는 부분(페이지 본문, 이미지, 전문보기 등)은 slot("이름") 자리표시로 남김
+- iter_slots(골격, {이름: 문자열 또는 청크 제너레이터})가 골격 조각과 섹션 청크를 순서대로 내보냄
+  → 페이지/이미지를 하나씩 만들면서 바로 기록 (수 MB 문서를 += / f-string / write로 여러 번 복사하지 않음)
+- write_chunks: 임시 파일에 청크를 쓰고 원자적으로 교체 (생성 도중 실패해도 반쪽 파일이 남지 않음)
+- iter_encoded: StreamingResponse용 UTF-8 바이트 청크 (작은 조각은 CHUNK_SIZE까지 모아서 전송)
+
+사용법:
+    from html_stream import slot, iter_slots, write_chunks
+
+    skeleton = f'''<main>{slot("pages")}</main>'''
+    chunks = iter_slots(skeleton, {"pages": (render(page) for page in pages)})
+    write_chunks(output_path, chunks)
+
+    return StreamingResponse(iter_encoded(generator.generate_chunks(data)),
+                             media_type="text/html; charset=utf-8")
+"""
+
+import os
+import re
+import secrets
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Union
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+# 자리표시 - 사용자 텍스트와 겹치지 않도록 프로세스마다 임의 토큰 사용
+_SLOT_TOKEN = secrets.token_hex(8)
+_SLOT_PATTERN = re.compile(f"\x00slot:([A-Za-z0-9_-]+):{_SLOT_TOKEN}\x00")
+
+Fragment = Union[str, Iterable[str]]
+
+
+def slot(name: str) -> str:
+    """골격 f-string에 넣는 섹션 자리표시"""
+    return f"\x00slot:{name}:{_SLOT_TOKEN}\x00"
+
+
+def iter_slots(skeleton: str, fragments: Dict[str, Fragment]) -> Iterator[str]:
+    """골격 조각과 자리표시 위치의 섹션 청크를 순서대로 반환
+
+    Raises:
+        KeyError: 골격의 자리표시에 해당하는 섹션이 fragments에 없음
+    """
+    # split 결과: [골격, 이름, 골격, 이름, ..., 골격]
+    pieces = _SLOT_PATTERN.split(skeleton)
+    missing = [name for name in pieces[1::2] if name not in fragments]
+    if missing:
+        raise KeyError(f"섹션 없음: {', '.join(missing)}")
+    return _iter_pieces(pieces, fragments)
+
+
+def _iter_pieces(pieces: List[str], fragments: Dict[str, Fragment]) -> Iterator[str]:
+    for index, piece in enumerate(pieces):
+        if index % 2 == 0:
+            if piece:
+                yield piece
+            continue
+        fragment = fragments[piece]
+        if isinstance(fragment, str):
+            if fragment:
+                yield fragment
+            continue
+        for chunk in fragment:
+            if chunk:
+                yield chunk
+
+
+def write_chunks(path: Union[str, Path], chunks: Iterable[str]) -> int:
+    """청크를 UTF-8 파일로 원자적으로 기록하고 쓴 문자 수 반환"""
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    written = 0
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                written += len(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+    return written
+
+
+def iter_encoded(chunks: Iterable[str], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """문자열 청크를 UTF-8 바이트 청크로 (chunk_size 미만 조각은 모아서 반환)"""
+    buffered: List[bytes] = []
+    size = 0
+    for chunk in chunks:
+        data = chunk.encode("utf-8")
+        if not data:
+            continue
+        buffered.append(data)
+        size += len(data)
+        if size >= chunk_size:
+            yield b"".join(buffered)
+            buffered.clear()
+            size = 0
+    if buffered:
+        yield b"".join(buffered)
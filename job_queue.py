@@ -0,0 +1,420 @@
+"""
+변환 작업 큐 - 변환 파이프라인을 이벤트 루프 밖의 워커 풀에서 실행
+
+- 제출 즉시 job_id 반환, 파이프라인은 스레드 풀(I/O: Claude API 호출 등)에서 실행
+- PDF 페이지 렌더링은 프로세스 풀에서 병렬 처리
+- 작업 상태(queued/running/done/failed)와 단계별 진행률 조회
+- 단계/페이지 진행 이벤트 기록 (SSE 진행 스트림용)
+- 단계/작업 소요 시간을 성능 계측(metrics)에 기록
+"""
+
+import os
+import time
+import uuid
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from metrics import get_metrics, bind_content_type, reset_content_type
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+# 작업당 보관하는 진행 이벤트 최대 수 (넘으면 오래된 이벤트부터 버림)
+MAX_JOB_EVENTS = 2000
+
+
+class JobQueueFullError(RuntimeError):
+    """대기 중인 작업이 너무 많아 새 작업을 받을 수 없음"""
+
+
+def render_pdf_page(pdf_path: str, page_index: int, dpi: int = 150, fmt: str = "jpeg",
+                    max_width: Optional[int] = None, quality: int = 85) -> bytes:
+    """PDF 한 페이지를 이미지 바이트로 렌더링 (프로세스 풀 워커에서 실행)
+
+    Args:
+        pdf_path: PDF 파일 경로 (워커가 직접 문서를 연다)
+        page_index: 0-based 페이지 번호
+        dpi: 렌더링 해상도
+        fmt: 이미지 포맷 (jpeg, png)
+        max_width: 지정하면 이 너비로 축소한 모바일 JPEG (LANCZOS 리사이즈 + 인코딩까지 워커에서 처리)
+        quality: 모바일 JPEG 품질
+    """
+    import fitz
+
+    doc = fitz.open(pdf_path)
+    try:
+        zoom = dpi / 72
+        pix = doc[page_index].get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+        if max_width:
+            from PIL import Image
+            from page_cache import encode_mobile_jpeg
+
+            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+            return encode_mobile_jpeg(img, max_width, quality)
+        return pix.tobytes(fmt)
+    finally:
+        doc.close()
+
+
+@dataclass
+class JobStage:
+    """작업의 한 단계 (render, ocr, merge, html ...)"""
+    name: str
+    status: str = JOB_RUNNING
+    current: int = 0
+    total: int = 0
+    started_at: float = 0.0
+    finished_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        end = self.finished_at or time.time()
+        return {
+            "name": self.name,
+            "status": self.status,
+            "current": self.current,
+            "total": self.total,
+            "elapsed_ms": int((end - self.started_at) * 1000),
+        }
+
+
+class Job:
+    """변환 작업 하나의 상태와 단계별 진행률"""
+
+    def __init__(self, kind: str, job_id: Optional[str] = None, upload_size: Optional[int] = None,
+                 content_type: Optional[str] = None):
+        self.job_id = job_id or str(uuid.uuid4())[:8]
+        self.kind = kind
+        # 계측 라벨 (기본값: "church-ai" -> "church")
+        self.content_type = content_type or kind.removesuffix("-ai")
+        self.status = JOB_QUEUED
+        self.stages: List[JobStage] = []
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.future: Optional[Future] = None
+        self._lock = threading.Lock()
+        # 진행 이벤트 (seq는 1부터 증가, 잘려도 번호 유지)
+        self.events: List[Dict[str, Any]] = []
+        self._event_seq = 0
+
+        if upload_size is not None:
+            self.emit("uploaded", size=upload_size)
+        self.emit(JOB_QUEUED)
+
+    # ---------- 진행 이벤트 ----------
+
+    def _emit_locked(self, event: str, data: Dict[str, Any]) -> None:
+        self._event_seq += 1
+        self.events.append({
+            "seq": self._event_seq,
+            "event": event,
+            "t_ms": int((time.time() - self.created_at) * 1000),
+            **data,
+        })
+        if len(self.events) > MAX_JOB_EVENTS:
+            del self.events[:len(self.events) - MAX_JOB_EVENTS]
+
+    def emit(self, event: str, **data) -> None:
+        """진행 이벤트 기록 (t_ms: 작업 생성 후 경과 시간)"""
+        with self._lock:
+            self._emit_locked(event, data)
+
+    def events_since(self, seq: int = 0) -> List[Dict[str, Any]]:
+        """seq 이후의 이벤트 목록"""
+        with self._lock:
+            return [e for e in self.events if e["seq"] > seq]
+
+    def _find_stage(self, name: str) -> Optional[JobStage]:
+        for stage in reversed(self.stages):
+            if stage.name == name:
+                return stage
+        return None
+
+    def start_stage(self, name: str, total: int = 0) -> JobStage:
+        """새 단계 시작"""
+        with self._lock:
+            stage = JobStage(name=name, total=total, started_at=time.time())
+            self.stages.append(stage)
+            self._emit_locked("stage_start", {"stage": name, "total": total})
+        return stage
+
+    def advance(self, name: str, step: int = 1, total: Optional[int] = None, **detail) -> None:
+        """단계 진행률 증가
+
+        Args:
+            detail: 이벤트에 함께 기록할 정보 (예: page=3, section="choir")
+        """
+        with self._lock:
+            stage = self._find_stage(name)
+            if stage is None:
+                return
+            stage.current += step
+            if total is not None:
+                stage.total = total
+            self._emit_locked("progress", {
+                "stage": name,
+                "current": stage.current,
+                "total": stage.total,
+                "elapsed_ms": int((time.time() - stage.started_at) * 1000),
+                **detail,
+            })
+
+    def finish_stage(self, name: str, status: str = JOB_DONE) -> None:
+        """단계 종료"""
+        with self._lock:
+            stage = self._find_stage(name)
+            if stage is None or stage.finished_at is not None:
+                return
+            stage.status = status
+            stage.finished_at = time.time()
+            if status == JOB_DONE and stage.total:
+                stage.current = stage.total
+            self._emit_locked(f"stage_{status}", {
+                "stage": name,
+                "elapsed_ms": int((stage.finished_at - stage.started_at) * 1000),
+            })
+        get_metrics().observe_stage(name, stage.finished_at - stage.started_at, self.content_type,
+                                    failed=status == JOB_FAILED)
+
+    @contextmanager
+    def stage(self, name: str, total: int = 0):
+        """with 블록 단위로 단계 시작/종료 기록"""
+        self.start_stage(name, total)
+        try:
+            yield self
+        except Exception:
+            self.finish_stage(name, JOB_FAILED)
+            raise
+        self.finish_stage(name)
+
+    def elapsed_ms(self) -> int:
+        """작업 시작(대기 중이면 등록) 후 경과 시간"""
+        end = self.finished_at or time.time()
+        return int((end - (self.started_at or self.created_at)) * 1000)
+
+    def stage_timings(self) -> Dict[str, int]:
+        """단계별 소요 시간 (ms) - 같은 이름의 단계는 합산"""
+        timings: Dict[str, int] = {}
+        with self._lock:
+            for s in self.stages:
+                timings[s.name] = timings.get(s.name, 0) + s.to_dict()["elapsed_ms"]
+        return timings
+
+    def to_dict(self) -> Dict[str, Any]:
+        """상태 조회용 직렬화"""
+        with self._lock:
+            stages = [s.to_dict() for s in self.stages]
+        data = {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "status": self.status,
+            "stages": stages,
+            "created_at": self.created_at,
+            "elapsed_ms": self.elapsed_ms(),
+        }
+        if self.status == JOB_DONE:
+            data["result"] = self.result
+        if self.status == JOB_FAILED:
+            data["error"] = self.error
+        return data
+
+
+class JobManager:
+    """변환 작업 워커 풀 관리자"""
+
+    def __init__(self, io_workers: Optional[int] = None, render_workers: Optional[int] = None,
+                 max_pending: Optional[int] = None, retention_seconds: int = 3600):
+        cpu_count = os.cpu_count() or 1
+        self.io_workers = io_workers or int(os.getenv("STUDYSNAP_IO_WORKERS", "8"))
+        self.render_workers = render_workers or int(os.getenv("STUDYSNAP_RENDER_WORKERS", str(min(4, cpu_count))))
+        self.max_pending = max_pending or int(os.getenv("STUDYSNAP_MAX_PENDING_JOBS", "64"))
+        self.retention_seconds = retention_seconds
+
+        self._io_pool = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="studysnap-job")
+        self._render_pool: Optional[ProcessPoolExecutor] = None
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        logger.info(f"작업 큐 초기화: I/O 워커 {self.io_workers}개, 렌더링 워커 {self.render_workers}개")
+
+    # ---------- 작업 제출/조회 ----------
+
+    def submit(self, kind: str, fn: Callable[..., Any], *args, job_id: Optional[str] = None,
+               upload_size: Optional[int] = None, content_type: Optional[str] = None, **kwargs) -> Job:
+        """작업을 스레드 풀에 제출하고 Job 반환 (fn의 첫 인자로 Job 전달)
+
+        Args:
+            upload_size: 업로드 파일 크기 (있으면 첫 이벤트로 "uploaded" 기록)
+            content_type: 계측 라벨 (기본값: kind에서 유추)
+        """
+        with self._lock:
+            self._prune_locked()
+            pending = sum(1 for j in self._jobs.values() if j.status in (JOB_QUEUED, JOB_RUNNING))
+            if pending >= self.max_pending:
+                raise JobQueueFullError(f"대기 중인 작업이 너무 많습니다 ({pending}개)")
+            job = Job(kind, job_id, upload_size=upload_size, content_type=content_type)
+            self._jobs[job.job_id] = job
+
+        job.future = self._io_pool.submit(self._run, job, fn, args, kwargs)
+        logger.info(f"[{job.job_id}] 작업 제출: {kind}")
+        return job
+
+    def _run(self, job: Job, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        job.status = JOB_RUNNING
+        job.started_at = time.time()
+        job.emit(JOB_RUNNING)
+        # 작업 안에서 기록되는 세부 계측(Vision 호출, 렌더링 등)에 content_type 라벨 전달
+        token = bind_content_type(job.content_type)
+        try:
+            result = fn(job, *args, **kwargs)
+        except Exception as e:
+            job.status = JOB_FAILED
+            job.error = str(getattr(e, "detail", "") or e)
+            job.finished_at = time.time()
+            job.emit(JOB_FAILED, error=job.error, elapsed_ms=job.elapsed_ms())
+            get_metrics().record_job(job.kind, job.content_type, JOB_FAILED, job.finished_at - job.started_at)
+            logger.error(f"[{job.job_id}] 작업 실패: {job.error}")
+            raise
+        finally:
+            reset_content_type(token)
+        job.result = result
+        job.status = JOB_DONE
+        job.finished_at = time.time()
+        job.emit(JOB_DONE, result=result, elapsed_ms=job.elapsed_ms())
+        get_metrics().record_job(job.kind, job.content_type, JOB_DONE, job.finished_at - job.started_at)
+        logger.info(f"[{job.job_id}] 작업 완료 ({job.elapsed_ms()}ms)")
+        return result
+
+    async def wait(self, job: Job) -> Any:
+        """이벤트 루프를 막지 않고 작업 완료 대기"""
+        return await asyncio.wrap_future(job.future)
+
+    async def iter_events(self, job: Job, after_seq: int = 0,
+                          poll_interval: float = 0.25) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """작업 진행 이벤트를 발생 순서대로 전달, done/failed 이벤트 후 종료
+
+        새 이벤트가 없는 동안에는 poll_interval마다 None을 전달 (연결 유지/끊김 확인용)
+        """
+        while True:
+            events = job.events_since(after_seq)
+            for event in events:
+                after_seq = event["seq"]
+                yield event
+                if event["event"] in (JOB_DONE, JOB_FAILED):
+                    return
+            if not events:
+                yield None
+            await asyncio.sleep(poll_interval)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _prune_locked(self) -> None:
+        """보관 기간이 지난 완료 작업 제거"""
+        cutoff = time.time() - self.retention_seconds
+        for job_id in list(self._jobs.keys()):
+            job = self._jobs[job_id]
+            if job.finished_at is not None and job.finished_at < cutoff:
+                del self._jobs[job_id]
+
+    # ---------- 렌더링 (프로세스 풀) ----------
+
+    @property
+    def render_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._render_pool is None:
+                self._render_pool = ProcessPoolExecutor(max_workers=self.render_workers)
+            return self._render_pool
+
+    def render_pages(self, pdf_path: str, page_indexes: List[int], dpi: int = 150, fmt: str = "jpeg",
+                     on_page: Optional[Callable[[int], None]] = None,
+                     max_width: Optional[int] = None, quality: int = 85,
+                     doc_hash: Optional[str] = None) -> List[bytes]:
+        """여러 페이지를 프로세스 풀에서 렌더링 (페이지 순서 유지)
+
+        이미 렌더링된 페이지는 공유 페이지 캐시(page_cache)에서 가져오고,
+        새로 렌더링한 페이지는 캐시에 저장해 다른 변환기가 재사용한다.
+
+        Args:
+            on_page: 페이지 렌더링 완료 시 호출 (0-based 페이지 번호)
+            max_width: 지정하면 모바일 JPEG로 축소 (RasterDocument.mobile_jpeg와 같은 캐시 키)
+            doc_hash: 이미 계산한 문서 해시 (없으면 파일을 읽어 계산)
+        """
+        from page_cache import get_page_cache, hash_document, mobile_jpeg_variant
+
+        page_cache = get_page_cache()
+        doc_hash = doc_hash or hash_document(pdf_path)
+        variant = mobile_jpeg_variant(max_width, quality) if max_width else fmt
+        results: Dict[int, bytes] = {}
+        for idx in page_indexes:
+            cached = page_cache.get((doc_hash, idx, dpi, variant))
+            if cached is not None:
+                results[idx] = cached
+                if on_page:
+                    on_page(idx)
+
+        pool = None
+        try:
+            pool = self.render_pool
+            futures = {
+                pool.submit(render_pdf_page, pdf_path, idx, dpi, fmt, max_width, quality): idx
+                for idx in page_indexes if idx not in results
+            }
+            for future in as_completed(futures):
+                idx = futures[future]
+                results[idx] = future.result()
+                page_cache.put((doc_hash, idx, dpi, variant), results[idx])
+                if on_page:
+                    on_page(idx)
+        except (BrokenProcessPool, OSError) as e:
+            # 프로세스 풀 사용 불가 시 현재 스레드에서 렌더링
+            logger.warning(f"프로세스 풀 렌더링 실패, 스레드 렌더링으로 대체: {e}")
+            # 깨진 풀은 종료해서 남은 작업/워커를 정리 (다른 스레드가 이미 새 풀로 바꿨으면 그대로 둠)
+            with self._lock:
+                if self._render_pool is pool:
+                    self._render_pool = None
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+            for idx in page_indexes:
+                if idx in results:
+                    continue
+                results[idx] = render_pdf_page(pdf_path, idx, dpi, fmt, max_width, quality)
+                page_cache.put((doc_hash, idx, dpi, variant), results[idx])
+                if on_page:
+                    on_page(idx)
+
+        return [results[idx] for idx in page_indexes]
+
+    def shutdown(self, wait: bool = False) -> None:
+        """워커 풀 종료"""
+        self._io_pool.shutdown(wait=wait)
+        with self._lock:
+            if self._render_pool is not None:
+                self._render_pool.shutdown(wait=wait)
+                self._render_pool = None
+
+
+# 싱글톤 인스턴스
+_job_manager = None
+
+def get_job_manager() -> JobManager:
+    """작업 큐 싱글톤 인스턴스 가져오기"""
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = JobManager()
+    return _job_manager
@@ -5,9 +5,9 @@ BulletinAI (주보지기) v4.0 - Vision API 통합
 PDF를 직접 분석하여 섹션별 데이터를 추출합니다.
 
 사용법:
-    from learning_data.church_bulletin import get_bulletin_ai
+    from learning_data.church_bulletin import create_bulletin_session
 
-    ai = get_bulletin_ai()
+    ai = create_bulletin_session()  # 변환 1건 전용 세션
     ai.load_pdf(pdf_bytes)
 
     # 섹션별 직접 추출 (v4.0 방식)
@@ -18,10 +18,11 @@ PDF를 직접 분석하여 섹션별 데이터를 추출합니다.
     all_data = ai.extract_all()
 """
 
-from .bulletin_ai import BulletinAI, get_bulletin_ai, reset_bulletin_ai
+from .bulletin_ai import BulletinAI, create_bulletin_session, get_bulletin_ai, reset_bulletin_ai
 
 __all__ = [
     "BulletinAI",
+    "create_bulletin_session",
     "get_bulletin_ai",
     "reset_bulletin_ai",
 ]
@@ -21,15 +21,38 @@ BulletinAI (주보지기) v4.0 - Vision API 통합
 
 import os
 import io
-import base64
 import logging
-import fitz  # PyMuPDF
-from typing import Dict, List, Optional, Any
+import contextvars
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Any
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
+class _LazyPageImages(Mapping):
+    """페이지 번호(1부터) → base64 PNG - 접근한 페이지만 공유 페이지 캐시를 통해 렌더링"""
+
+    def __init__(self, raster, dpi: int = 150):
+        self._raster = raster
+        self._dpi = dpi
+
+    def __getitem__(self, page_num: int) -> str:
+        if page_num not in self:
+            raise KeyError(page_num)
+        return self._raster.image_base64(page_num - 1, dpi=self._dpi, fmt="png")
+
+    def __contains__(self, page_num) -> bool:
+        return isinstance(page_num, int) and 1 <= page_num <= len(self._raster)
+
+    def __iter__(self):
+        return iter(range(1, len(self._raster) + 1))
+
+    def __len__(self) -> int:
+        return len(self._raster)
+
+
 class BulletinAI:
     """
     BulletinAI (주보지기) v4.0 - Vision API 통합
@@ -226,24 +249,43 @@ class BulletinAI:
         "율법을 다 지켜 행하라": "율법을…",
     }
 
-    def __init__(self, api_key: Optional[str] = None):
+    # extract_all 결과 키 → 섹션 추출 메서드 (각각 독립된 Vision API 호출)
+    SECTION_EXTRACTORS = {
+        "today_verse": "extract_today_verse",
+        "worship_services": "extract_worship_services",
+        "sermon_word": "extract_sermon_word",
+        "devotional": "extract_devotional",
+        "church_news": "extract_church_news",
+        "choir": "extract_choir",
+    }
+
+    def __init__(self, api_key: Optional[str] = None, max_concurrency: Optional[int] = None, client=None,
+                 force_refresh: bool = False):
         """
         BulletinAI 초기화
 
         Args:
             api_key: Anthropic API 키 (없으면 환경변수에서 가져옴)
+            max_concurrency: extract_all의 섹션 동시 추출 수 (없으면 BULLETIN_AI_CONCURRENCY, 기본 4)
+            client: 공유 Anthropic 클라이언트 (없으면 클라이언트 풀에서 가져옴)
+            force_refresh: True면 Vision 캐시를 무시하고 API를 다시 호출
         """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
+        self.force_refresh = force_refresh
+        self.max_concurrency = max(1, max_concurrency or int(os.environ.get("BULLETIN_AI_CONCURRENCY", "4")))
         self.client = None
         self.pdf_doc = None
-        self.page_images = {}  # 페이지별 base64 이미지 캐시
+        self._raster = None
+        self.page_images = {}  # 페이지별 base64 이미지 (load_pdf 후 접근 시 렌더링)
         self.extracted_data = {}  # 추출된 데이터 캐시
 
-        # Anthropic 클라이언트 초기화
-        if self.api_key:
+        # Anthropic 클라이언트 초기화 (프로세스 공유 풀 사용)
+        if client is not None:
+            self.client = client
+        elif self.api_key:
             try:
-                import anthropic
-                self.client = anthropic.Anthropic(api_key=self.api_key)
+                from anthropic_pool import get_client_pool
+                self.client = get_client_pool().get(self.api_key)
                 logger.info(f"🤖 {self.NAME} ({self.NAME_KR}) v{self.VERSION} 초기화 완료 [Vision API 통합]")
             except ImportError:
                 logger.warning("anthropic 패키지가 설치되지 않았습니다. pip install anthropic")
@@ -252,33 +294,28 @@ class BulletinAI:
         else:
             logger.warning("API 키가 없습니다. 환경변수 ANTHROPIC_API_KEY를 설정하세요.")
 
-    def load_pdf(self, pdf_bytes: bytes) -> bool:
+    def load_pdf(self, pdf_source, doc_hash: Optional[str] = None) -> bool:
         """
-        PDF 로드 및 페이지별 이미지 추출
+        PDF 로드 - 페이지 이미지는 섹션 추출에서 실제로 쓰는 페이지만 렌더링
 
         Args:
-            pdf_bytes: PDF 파일 바이트
+            pdf_source: PDF 파일 경로 또는 바이트 (경로면 메모리에 통째로 올리지 않음)
+            doc_hash: 업로드 시 계산한 SHA-256 (있으면 페이지 캐시 키로 재사용)
 
         Returns:
             성공 여부
         """
         try:
-            self.pdf_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            self.page_images = {}
+            from page_cache import get_page_cache
+
+            self.close()
+            self._raster = get_page_cache().open(pdf_source, doc_hash=doc_hash)
+            self.pdf_doc = self._raster.doc
+            # 고해상도 PNG (DPI 150), 같은 PDF는 (문서 해시, 페이지, DPI) 단위로 캐시 재사용
+            self.page_images = _LazyPageImages(self._raster, dpi=150)
             self.extracted_data = {}
 
             logger.info(f"[BulletinAI] PDF 로드 완료: {len(self.pdf_doc)} 페이지")
-
-            # 각 페이지를 이미지로 변환
-            for page_num in range(len(self.pdf_doc)):
-                page = self.pdf_doc[page_num]
-                # 고해상도 이미지로 변환 (DPI 150)
-                mat = fitz.Matrix(150/72, 150/72)
-                pix = page.get_pixmap(matrix=mat)
-                img_bytes = pix.tobytes("png")
-                self.page_images[page_num + 1] = base64.standard_b64encode(img_bytes).decode("utf-8")
-
-            logger.info(f"[BulletinAI] 페이지 이미지 추출 완료: {len(self.page_images)}개")
             return True
 
         except Exception as e:
@@ -306,33 +343,15 @@ class BulletinAI:
             return None
 
         try:
+            from vision_cache import get_vision_cache
+
             image_data = self.page_images[page_num]
 
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": "image/png",
-                                    "data": image_data
-                                }
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ]
-                    }
-                ]
+            # 같은 페이지 이미지 + 프롬프트 + 모델이면 캐시된 응답 사용
+            result = get_vision_cache().create_message(
+                self.client, "claude-sonnet-4-20250514", 4096, image_data, "image/png", prompt,
+                force_refresh=self.force_refresh
             )
-
-            result = response.content[0].text
             logger.info(f"[BulletinAI] Vision API 호출 성공 (페이지 {page_num})")
             return result
 
@@ -347,27 +366,29 @@ class BulletinAI:
         """JSON 응답 파싱"""
         import json
         import re
+        from metrics import timed
 
         if not response:
             return None
 
-        try:
-            # JSON 블록 추출
-            json_match = re.search(r'```json\s*(.*?)\s*```', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group(1))
-
-            # 직접 JSON 파싱 시도
-            # { 로 시작하는 부분 찾기
-            start = response.find('{')
-            end = response.rfind('}') + 1
-            if start >= 0 and end > start:
-                return json.loads(response[start:end])
-
-            return None
-        except json.JSONDecodeError as e:
-            logger.error(f"[BulletinAI] JSON 파싱 실패: {e}")
-            return None
+        with timed("vision_parse"):
+            try:
+                # JSON 블록 추출
+                json_match = re.search(r'```json\s*(.*?)\s*```', response, re.DOTALL)
+                if json_match:
+                    return json.loads(json_match.group(1))
+
+                # 직접 JSON 파싱 시도
+                # { 로 시작하는 부분 찾기
+                start = response.find('{')
+                end = response.rfind('}') + 1
+                if start >= 0 and end > start:
+                    return json.loads(response[start:end])
+
+                return None
+            except json.JSONDecodeError as e:
+                logger.error(f"[BulletinAI] JSON 파싱 실패: {e}")
+                return None
 
     def _correct_ocr_errors(self, text: str) -> str:
         """OCR 오류 및 AI 환각 텍스트 교정"""
@@ -611,23 +632,40 @@ class BulletinAI:
         logger.info(f"[BulletinAI] 금주의 찬양 추출 완료: {len(result['rows'])}개")
         return result
 
-    def extract_all(self) -> Dict:
+    def extract_all(self, max_workers: Optional[int] = None,
+                    on_section: Optional[Callable[[str], None]] = None) -> Dict:
         """
-        모든 섹션 추출
+        모든 섹션 추출 - 섹션별 Vision API 호출을 스레드 풀에서 동시 실행
+
+        섹션마다 다른 페이지/프롬프트를 사용하는 독립 호출이므로 병렬로 실행하고,
+        오늘의 말씀 재검증 재시도도 해당 섹션 작업 안에서 처리됩니다.
+
+        Args:
+            max_workers: 동시 호출 수 (기본값: self.max_concurrency)
+            on_section: 섹션 하나가 끝날 때마다 섹션 키로 호출 (진행률 보고용)
 
         Returns:
             전체 추출 데이터
         """
-        logger.info("[BulletinAI] 전체 섹션 추출 시작...")
+        workers = max(1, min(max_workers or self.max_concurrency, len(self.SECTION_EXTRACTORS)))
+        logger.info(f"[BulletinAI] 전체 섹션 추출 시작... (동시 처리: {workers})")
 
-        return {
-            "today_verse": self.extract_today_verse(),
-            "worship_services": self.extract_worship_services(),
-            "sermon_word": self.extract_sermon_word(),
-            "devotional": self.extract_devotional(),
-            "church_news": self.extract_church_news(),
-            "choir": self.extract_choir(),
-        }
+        def run(key: str, method: str):
+            result = getattr(self, method)()
+            if on_section:
+                on_section(key)
+            return result
+
+        if workers == 1:
+            return {key: run(key, method) for key, method in self.SECTION_EXTRACTORS.items()}
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulletin-ai") as executor:
+            # 호출 스레드의 계측 컨텍스트(content_type)를 섹션 작업에도 전달
+            futures = {
+                key: executor.submit(contextvars.copy_context().run, run, key, method)
+                for key, method in self.SECTION_EXTRACTORS.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
 
     # ========== 하위 호환성 메서드 (v3.0 인터페이스) ==========
 
@@ -1218,6 +1256,17 @@ class BulletinAI:
 
     # ========== 유틸리티 ==========
 
+    def close(self):
+        """세션 종료 - PDF 문서와 페이지 이미지 해제 (추출 데이터는 유지)"""
+        if self._raster is not None:
+            try:
+                self._raster.close()
+            except Exception:
+                pass
+            self._raster = None
+        self.pdf_doc = None
+        self.page_images = {}
+
     def get_status(self) -> Dict:
         """BulletinAI 상태 반환"""
         return {
@@ -1231,6 +1280,16 @@ class BulletinAI:
         }
 
 
+def create_bulletin_session(api_key: Optional[str] = None, force_refresh: bool = False) -> BulletinAI:
+    """
+    변환 1건 전용 BulletinAI 세션 생성
+
+    page_images / extracted_data가 세션마다 분리되므로 여러 주보를 동시에 변환해도
+    서로 덮어쓰지 않습니다. Anthropic 클라이언트는 프로세스 공유 풀에서 가져옵니다.
+    """
+    return BulletinAI(api_key=api_key, force_refresh=force_refresh)
+
+
 # 싱글톤 인스턴스
 _bulletin_ai_instance = None
 
@@ -1,36 +1,259 @@
 """
 학습 시스템 - 변환 결과를 분석하고 개선하는 자동 학습 모듈
+
+통계 저장소: SQLite (learning_data/learning.db)
+- 변환/피드백 기록 시 누적 집계(콘텐츠 타입별 합계, 정당/문제 카운터)를 같은 트랜잭션에서 갱신
+  → 전체 통계 조회는 집계 테이블만 읽음 (기록 건수와 무관)
+- 콘텐츠 타입/기간별 조회는 (content_type, timestamp) 인덱스 범위 조회
+- conversions.jsonl / feedback.jsonl은 원본 로그(학습 데이터 내보내기용)로 계속 추가 기록
+- 기존 JSONL 기록은 첫 실행 시 한 번만 가져옴
 """
 
 import os
 import json
+import sqlite3
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from collections import defaultdict, Counter
+from typing import Dict, List, Any, Optional, Union
+from collections import Counter
 
 logger = logging.getLogger(__name__)
 
+# 스키마 버전 (PRAGMA user_version)
+SCHEMA_VERSION = 1
+
+LEARNING_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversions (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    page_count INTEGER NOT NULL DEFAULT 0,
+    ocr_used INTEGER NOT NULL DEFAULT 0,
+    processing_time REAL NOT NULL DEFAULT 0,
+    party TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_conversions_type_time ON conversions(content_type, timestamp);
+CREATE INDEX IF NOT EXISTS idx_conversions_time ON conversions(timestamp);
+CREATE INDEX IF NOT EXISTS idx_conversions_job ON conversions(job_id);
+
+CREATE TABLE IF NOT EXISTS feedback (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    rating INTEGER NOT NULL DEFAULT 0,
+    accuracy INTEGER NOT NULL DEFAULT 0,
+    completeness INTEGER NOT NULL DEFAULT 0,
+    issues TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS idx_feedback_time ON feedback(timestamp);
+CREATE INDEX IF NOT EXISTS idx_feedback_job ON feedback(job_id);
+
+-- 누적 집계 (전체 기간 통계)
+CREATE TABLE IF NOT EXISTS conversion_totals (
+    content_type TEXT PRIMARY KEY,
+    conversions INTEGER NOT NULL DEFAULT 0,
+    page_count_sum INTEGER NOT NULL DEFAULT 0,
+    ocr_used INTEGER NOT NULL DEFAULT 0,
+    timed_count INTEGER NOT NULL DEFAULT 0,
+    processing_time_sum REAL NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS feedback_totals (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    feedback_count INTEGER NOT NULL DEFAULT 0,
+    rating_count INTEGER NOT NULL DEFAULT 0,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    success_count INTEGER NOT NULL DEFAULT 0
+);
+
+-- kind: party(정당) | issue(피드백 문제)
+CREATE TABLE IF NOT EXISTS stat_counters (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (kind, key)
+) WITHOUT ROWID;
+"""
+
+TimeBound = Optional[Union[str, datetime]]
+
+
+def _iso(value: TimeBound) -> Optional[str]:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value or None
+
 
 class LearningSystem:
     """자동 학습 및 개선 시스템"""
 
-    def __init__(self, data_dir: str = "learning_data"):
+    def __init__(self, data_dir: str = "learning_data", db_path: Optional[str] = None):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
 
         # 학습 데이터 파일들
         self.conversions_file = self.data_dir / "conversions.jsonl"
         self.feedback_file = self.data_dir / "feedback.jsonl"
-        self.stats_file = self.data_dir / "stats.json"
         self.patterns_file = self.data_dir / "learned_patterns.json"
+        self.db_path = Path(db_path or os.environ.get("LEARNING_DB_PATH") or self.data_dir / "learning.db")
+
+        # 스레드별 연결 (sqlite3 연결은 스레드 간 공유하지 않음)
+        self._local = threading.local()
+        self._init_db()
 
         # 학습된 패턴 로드
         self.learned_patterns = self._load_patterns()
 
         logger.info(f"학습 시스템 초기화 완료: {self.data_dir}")
 
+    # ========== 저장소 ==========
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 (autocommit, 여러 문장은 _transaction으로 묶음)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=10, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=10000")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 트랜잭션 (기록 행과 누적 집계를 함께 커밋)"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _init_db(self):
+        """테이블/인덱스 생성 및 기존 JSONL 기록 1회 이전"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        conn.executescript(LEARNING_SCHEMA)
+
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+
+        # 버전 확인·이전·버전 기록을 한 트랜잭션으로 (중단되거나 여러 워커가 동시에 시작해도 한 번만 가져옴)
+        with self._transaction() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                self._migrate_jsonl(conn)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @staticmethod
+    def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
+        entries = []
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        try:
+                            entries.append(json.loads(line))
+                        except json.JSONDecodeError:
+                            logger.warning(f"손상된 학습 기록 건너뜀: {path.name}")
+        return entries
+
+    def _migrate_jsonl(self, conn: sqlite3.Connection):
+        """conversions.jsonl / feedback.jsonl(이전 통계 원본)을 인덱스 저장소로 가져오기 (호출자의 트랜잭션 안에서)"""
+        # ActiveLearningEngine.record_conversion도 같은 파일에 추가 기록함 (content_type 없음)
+        # - 같은 변환이 log_conversion으로 이미 기록되므로 가져오지 않음 ("unknown" 중복 집계 방지)
+        conversions = [entry for entry in self._read_jsonl(self.conversions_file)
+                       if not isinstance(entry, dict) or "content_type" in entry]
+        feedbacks = self._read_jsonl(self.feedback_file)
+        if not conversions and not feedbacks:
+            return
+
+        migrated = {"변환": 0, "피드백": 0}
+        for label, entries, store in (("변환", conversions, self._store_conversion),
+                                      ("피드백", feedbacks, self._store_feedback)):
+            for entry in entries:
+                # 기록 하나씩 SAVEPOINT - 잘못된 필드가 있는 기록은 건너뜀 (서버 시작을 막지 않음)
+                conn.execute("SAVEPOINT migrate_entry")
+                try:
+                    store(conn, entry)
+                except (ValueError, TypeError, AttributeError, sqlite3.Error) as e:
+                    conn.execute("ROLLBACK TO migrate_entry")
+                    logger.warning(f"잘못된 학습 기록 건너뜀 ({label}): {e}")
+                else:
+                    migrated[label] += 1
+                conn.execute("RELEASE migrate_entry")
+        logger.info(f"학습 기록 이전 완료: 변환 {migrated['변환']}건, 피드백 {migrated['피드백']}건")
+
+    @staticmethod
+    def _store_conversion(conn: sqlite3.Connection, entry: Dict[str, Any]) -> None:
+        """변환 행 추가 + 누적 집계 갱신"""
+        content_type = entry.get("content_type") or "unknown"
+        page_count = int(entry.get("page_count") or 0)
+        ocr_used = 1 if entry.get("ocr_used") else 0
+        processing_time = float(entry.get("processing_time") or 0)
+        party = (entry.get("extracted_data") or {}).get("party") or ""
+
+        conn.execute(
+            "INSERT INTO conversions (job_id, timestamp, content_type, page_count, ocr_used, processing_time, party) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (entry.get("job_id", ""), entry.get("timestamp") or datetime.now().isoformat(),
+             content_type, page_count, ocr_used, processing_time, party)
+        )
+        timed = 1 if processing_time else 0
+        conn.execute(
+            "INSERT INTO conversion_totals (content_type, conversions, page_count_sum, ocr_used, timed_count, processing_time_sum) "
+            "VALUES (?, 1, ?, ?, ?, ?) "
+            "ON CONFLICT(content_type) DO UPDATE SET "
+            "conversions = conversions + 1, "
+            "page_count_sum = page_count_sum + excluded.page_count_sum, "
+            "ocr_used = ocr_used + excluded.ocr_used, "
+            "timed_count = timed_count + excluded.timed_count, "
+            "processing_time_sum = processing_time_sum + excluded.processing_time_sum",
+            (content_type, page_count, ocr_used, timed, processing_time)
+        )
+        if party:
+            LearningSystem._increment_counter(conn, "party", party)
+
+    @staticmethod
+    def _store_feedback(conn: sqlite3.Connection, entry: Dict[str, Any]) -> None:
+        """피드백 행 추가 + 누적 집계 갱신"""
+        rating = int(entry.get("rating") or 0)
+        issues = [issue for issue in entry.get("issues") or [] if issue]
+
+        conn.execute(
+            "INSERT INTO feedback (job_id, timestamp, rating, accuracy, completeness, issues) VALUES (?, ?, ?, ?, ?, ?)",
+            (entry.get("job_id", ""), entry.get("timestamp") or datetime.now().isoformat(), rating,
+             int(entry.get("accuracy") or 0), int(entry.get("completeness") or 0),
+             json.dumps(issues, ensure_ascii=False))
+        )
+        rated = 1 if rating > 0 else 0
+        conn.execute(
+            "INSERT INTO feedback_totals (id, feedback_count, rating_count, rating_sum, success_count) "
+            "VALUES (1, 1, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET "
+            "feedback_count = feedback_count + 1, "
+            "rating_count = rating_count + excluded.rating_count, "
+            "rating_sum = rating_sum + excluded.rating_sum, "
+            "success_count = success_count + excluded.success_count",
+            (rated, rating if rated else 0, 1 if rating >= 4 else 0)
+        )
+        for issue in issues:
+            LearningSystem._increment_counter(conn, "issue", issue)
+
+    @staticmethod
+    def _increment_counter(conn: sqlite3.Connection, kind: str, key: str) -> None:
+        conn.execute(
+            "INSERT INTO stat_counters (kind, key, count) VALUES (?, ?, 1) "
+            "ON CONFLICT(kind, key) DO UPDATE SET count = count + 1",
+            (kind, key)
+        )
+
     def log_conversion(self, job_id: str, conversion_data: Dict[str, Any]) -> None:
         """변환 작업 기록"""
         try:
@@ -64,7 +287,8 @@ class LearningSystem:
                 "page_count": conversion_data.get("page_count", 0),
                 "is_image_based": conversion_data.get("is_image_based", False),
                 "ocr_used": conversion_data.get("ocr_used", False),
-                "processing_time": conversion_data.get("processing_time", 0),
+                "processing_time": conversion_data.get("processing_time", 0),  # 초
+                "stage_timings": conversion_data.get("stage_timings", {}),  # 단계별 ms
                 "extracted_data": extracted_data
             }
 
@@ -72,6 +296,9 @@ class LearningSystem:
             with open(self.conversions_file, "a", encoding="utf-8") as f:
                 f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
 
+            with self._transaction() as conn:
+                self._store_conversion(conn, log_entry)
+
             logger.info(f"[학습] 변환 기록 저장: {job_id}")
 
         except Exception as e:
@@ -94,6 +321,9 @@ class LearningSystem:
             with open(self.feedback_file, "a", encoding="utf-8") as f:
                 f.write(json.dumps(feedback_entry, ensure_ascii=False) + "\n")
 
+            with self._transaction() as conn:
+                self._store_feedback(conn, feedback_entry)
+
             logger.info(f"[학습] 피드백 저장: {job_id} (평점: {feedback_data.get('rating', 0)})")
 
             # 피드백 기반으로 패턴 학습
@@ -102,9 +332,34 @@ class LearningSystem:
         except Exception as e:
             logger.error(f"피드백 저장 실패: {str(e)}", exc_info=True)
 
-    def get_statistics(self) -> Dict[str, Any]:
-        """전체 통계 분석"""
+    def get_statistics(self, content_type: Optional[str] = None,
+                       since: TimeBound = None, until: TimeBound = None) -> Dict[str, Any]:
+        """전체 통계 분석
+
+        Args:
+            content_type: 특정 콘텐츠 타입만 집계 (피드백은 해당 타입 변환의 피드백만)
+            since, until: 기록 시각 범위 (ISO 문자열 또는 datetime, until은 미포함)
+
+        조건이 없으면 누적 집계 테이블만 읽고, 조건이 있으면 인덱스 범위만 집계합니다.
+        """
         try:
+            conn = self._connect()
+            if content_type is None and since is None and until is None:
+                conversion_rows = conn.execute(
+                    "SELECT content_type, conversions, page_count_sum, ocr_used, timed_count, processing_time_sum "
+                    "FROM conversion_totals"
+                ).fetchall()
+                feedback_row = conn.execute(
+                    "SELECT feedback_count, rating_count, rating_sum, success_count FROM feedback_totals WHERE id = 1"
+                ).fetchone()
+                parties = Counter({row["key"]: row["count"] for row in conn.execute(
+                    "SELECT key, count FROM stat_counters WHERE kind = 'party'")})
+                issues = Counter({row["key"]: row["count"] for row in conn.execute(
+                    "SELECT key, count FROM stat_counters WHERE kind = 'issue'")})
+            else:
+                conversion_rows, feedback_row, parties, issues = self._query_range(
+                    conn, content_type, _iso(since), _iso(until))
+
             stats = {
                 "total_conversions": 0,
                 "content_types": Counter(),
@@ -112,79 +367,36 @@ class LearningSystem:
                 "ocr_usage_rate": 0,
                 "feedback_count": 0,
                 "average_rating": 0,
-                "common_issues": Counter(),
+                "common_issues": issues,
                 "success_rate": 0,
-                "top_parties": Counter(),
-                "processing_times": []
+                "top_parties": parties,
             }
 
-            # 변환 기록 분석
-            if self.conversions_file.exists():
-                conversions = []
-                with open(self.conversions_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        if line.strip():
-                            conversions.append(json.loads(line))
-
-                stats["total_conversions"] = len(conversions)
-
-                if conversions:
-                    # 콘텐츠 타입 통계
-                    for conv in conversions:
-                        stats["content_types"][conv.get("content_type", "unknown")] += 1
-                        if conv.get("processing_time"):
-                            stats["processing_times"].append(conv["processing_time"])
-
-                        # 정당 통계
-                        party = conv.get("extracted_data", {}).get("party", "")
-                        if party:
-                            stats["top_parties"][party] += 1
-
-                    # 평균 계산
-                    page_counts = [c.get("page_count", 0) for c in conversions]
-                    stats["average_page_count"] = sum(page_counts) / len(page_counts)
-
-                    ocr_used = sum(1 for c in conversions if c.get("ocr_used", False))
-                    stats["ocr_usage_rate"] = (ocr_used / len(conversions)) * 100
-
-                    if stats["processing_times"]:
-                        stats["average_processing_time"] = sum(stats["processing_times"]) / len(stats["processing_times"])
-
-            # 피드백 분석
-            if self.feedback_file.exists():
-                feedbacks = []
-                with open(self.feedback_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        if line.strip():
-                            feedbacks.append(json.loads(line))
-
-                stats["feedback_count"] = len(feedbacks)
-
-                if feedbacks:
-                    ratings = [f.get("rating", 0) for f in feedbacks if f.get("rating", 0) > 0]
-                    if ratings:
-                        stats["average_rating"] = sum(ratings) / len(ratings)
-
-                    # 일반적인 문제 수집
-                    for fb in feedbacks:
-                        for issue in fb.get("issues", []):
-                            stats["common_issues"][issue] += 1
-
-                    # 성공률 (평점 4+ 비율)
-                    success = sum(1 for r in ratings if r >= 4)
-                    stats["success_rate"] = (success / len(ratings) * 100) if ratings else 0
-
-            # 통계 파일 저장
-            with open(self.stats_file, "w", encoding="utf-8") as f:
-                # Counter 객체를 dict로 변환
-                stats_serializable = {
-                    **stats,
-                    "content_types": dict(stats["content_types"]),
-                    "common_issues": dict(stats["common_issues"]),
-                    "top_parties": dict(stats["top_parties"]),
-                    "last_updated": datetime.now().isoformat()
-                }
-                json.dump(stats_serializable, f, ensure_ascii=False, indent=2)
+            # 변환 기록 집계
+            page_count_sum = ocr_used = timed_count = 0
+            processing_time_sum = 0.0
+            for row in conversion_rows:
+                if not row["conversions"]:
+                    continue
+                stats["content_types"][row["content_type"]] = row["conversions"]
+                stats["total_conversions"] += row["conversions"]
+                page_count_sum += row["page_count_sum"]
+                ocr_used += row["ocr_used"]
+                timed_count += row["timed_count"]
+                processing_time_sum += row["processing_time_sum"]
+
+            if stats["total_conversions"]:
+                stats["average_page_count"] = page_count_sum / stats["total_conversions"]
+                stats["ocr_usage_rate"] = (ocr_used / stats["total_conversions"]) * 100
+                if timed_count:
+                    stats["average_processing_time"] = processing_time_sum / timed_count
+
+            # 피드백 집계 (성공률 = 평점 4+ 비율)
+            if feedback_row and feedback_row["feedback_count"]:
+                stats["feedback_count"] = feedback_row["feedback_count"]
+                if feedback_row["rating_count"]:
+                    stats["average_rating"] = feedback_row["rating_sum"] / feedback_row["rating_count"]
+                    stats["success_rate"] = feedback_row["success_count"] / feedback_row["rating_count"] * 100
 
             return stats
 
@@ -192,6 +404,60 @@ class LearningSystem:
             logger.error(f"통계 분석 실패: {str(e)}", exc_info=True)
             return {}
 
+    @staticmethod
+    def _query_range(conn: sqlite3.Connection, content_type: Optional[str],
+                     since: Optional[str], until: Optional[str]):
+        """조건부 통계 - 인덱스 범위 안의 행만 집계"""
+        conditions, params = [], []
+        if content_type is not None:
+            conditions.append("content_type = ?")
+            params.append(content_type)
+        if since:
+            conditions.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            conditions.append("timestamp < ?")
+            params.append(until)
+        where = " AND ".join(conditions) or "1"
+
+        conversion_rows = conn.execute(
+            "SELECT content_type, COUNT(*) AS conversions, SUM(page_count) AS page_count_sum, "
+            "SUM(ocr_used) AS ocr_used, SUM(processing_time > 0) AS timed_count, "
+            "SUM(processing_time) AS processing_time_sum "
+            f"FROM conversions WHERE {where} GROUP BY content_type",
+            params
+        ).fetchall()
+        parties = Counter({row["party"]: row["count"] for row in conn.execute(
+            f"SELECT party, COUNT(*) AS count FROM conversions WHERE {where} AND party != '' GROUP BY party",
+            params
+        )})
+
+        # 피드백은 기록 시각 기준, 콘텐츠 타입은 같은 job_id의 변환 기록으로 판단
+        fb_conditions, fb_params = [], []
+        if content_type is not None:
+            fb_conditions.append("job_id IN (SELECT job_id FROM conversions WHERE content_type = ?)")
+            fb_params.append(content_type)
+        if since:
+            fb_conditions.append("timestamp >= ?")
+            fb_params.append(since)
+        if until:
+            fb_conditions.append("timestamp < ?")
+            fb_params.append(until)
+        fb_where = " AND ".join(fb_conditions) or "1"
+
+        feedback_row = conn.execute(
+            "SELECT COUNT(*) AS feedback_count, SUM(rating > 0) AS rating_count, "
+            "SUM(CASE WHEN rating > 0 THEN rating ELSE 0 END) AS rating_sum, "
+            "SUM(rating >= 4) AS success_count "
+            f"FROM feedback WHERE {fb_where}",
+            fb_params
+        ).fetchone()
+        issues = Counter()
+        for row in conn.execute(f"SELECT issues FROM feedback WHERE {fb_where} AND issues != '[]'", fb_params):
+            issues.update(json.loads(row["issues"]))
+
+        return conversion_rows, feedback_row, parties, issues
+
     def _learn_from_feedback(self, feedback: Dict[str, Any]) -> None:
         """피드백으로부터 패턴 학습"""
         try:
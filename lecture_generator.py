@@ -22,15 +22,21 @@
 
     generator = LectureHTMLGenerator()
     html = generator.generate(extracted_data, title="미적분학 개론")
+
+    # 큰 문서(base64 이미지 등)는 문자열로 합치지 않고 청크 단위로 기록
+    from html_stream import write_chunks
+    write_chunks(output_path, generator.generate_chunks(extracted_data))
 """
 
 import json
 import logging
 import re
 import hashlib
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 
+from html_stream import iter_slots, slot
+
 logger = logging.getLogger(__name__)
 
 
@@ -668,6 +674,21 @@ class LectureHTMLGenerator:
         Returns:
             완성된 HTML 문자열
         """
+        return "".join(self.generate_chunks(extracted_data, title, subject, options))
+
+    def generate_chunks(
+        self,
+        extracted_data: Dict[str, Any],
+        title: str = "",
+        subject: str = None,
+        options: Dict = None
+    ) -> Iterator[str]:
+        """
+        강의자료 HTML을 청크 단위로 생성 (인자는 generate와 같음)
+
+        구조 추출/플래시카드/퀴즈는 호출 시점에 끝나고,
+        챕터/표/이미지는 반환된 이터레이터를 읽는 동안 하나씩 생성
+        """
         options = options or {}
         show_flashcards = options.get("show_flashcards", True)
         show_quiz = options.get("show_quiz", True)
@@ -697,7 +718,7 @@ class LectureHTMLGenerator:
         quiz = self.generate_quiz(structure, all_text) if show_quiz else []
 
         # HTML 빌드
-        html = self._build_html(
+        return self._iter_html(
             title=final_title,
             structure=structure,
             theme=theme,
@@ -714,8 +735,6 @@ class LectureHTMLGenerator:
             metadata=metadata
         )
 
-        return html
-
     def _build_toc_html(self, sections: List[Dict]) -> str:
         """목차 HTML 생성 (기존 호환용)"""
         return self._build_toc_items_html(sections)
@@ -748,10 +767,10 @@ class LectureHTMLGenerator:
 
     def _build_chapters_html(self, sections: List[Dict], theme: Dict) -> str:
         """새 스타일 챕터 섹션 HTML 생성"""
-        if not sections:
-            return ""
+        return "".join(self._iter_chapters_html(sections, theme))
 
-        html_parts = []
+    def _iter_chapters_html(self, sections: List[Dict], theme: Dict) -> Iterator[str]:
+        """챕터 섹션 HTML을 챕터 하나씩 생성 (챕터 사이는 줄바꿈)"""
         chapter_num = 0
 
         for i, section in enumerate(sections):
@@ -763,12 +782,15 @@ class LectureHTMLGenerator:
             # 콘텐츠 처리 (코드 블록, 수식, 특별 박스 등)
             processed_content = self._process_content_enhanced(content)
 
+            if i:
+                yield "\n"
+
             # 레벨 1은 메인 챕터, 레벨 2 이상은 서브섹션
             if level == 1:
                 chapter_num += 1
                 display_number = number if number else str(chapter_num)
 
-                html_parts.append(f'''
+                yield f'''
                 <section class="chapter-section" id="chapter-{i}" data-chapter="{i}">
                     <div class="chapter-header">
                         <div class="chapter-header-left">
@@ -783,11 +805,11 @@ class LectureHTMLGenerator:
                         </div>
                     </div>
                 </section>
-                ''')
+                '''
             else:
                 # 서브섹션은 이전 챕터 내에 포함
                 display_number = number if number else f"{chapter_num}.{level - 1}"
-                html_parts.append(f'''
+                yield f'''
                 <section class="chapter-section sub-chapter" id="chapter-{i}" data-chapter="{i}">
                     <div class="chapter-header">
                         <div class="chapter-header-left">
@@ -801,9 +823,7 @@ class LectureHTMLGenerator:
                         </div>
                     </div>
                 </section>
-                ''')
-
-        return "\n".join(html_parts)
+                '''
 
     def _process_content_enhanced(self, content: str) -> str:
         """향상된 콘텐츠 처리 (특별 박스 포함)"""
@@ -1119,7 +1139,7 @@ $${eq}$$
         </div>
         '''
 
-    def _build_html(
+    def _iter_html(
         self,
         title: str,
         structure: Dict,
@@ -1130,8 +1150,8 @@ $${eq}$$
         quiz: List[Dict],
         options: Dict,
         metadata: Dict
-    ) -> str:
-        """최종 HTML 문서 생성 - 고품질 템플릿 적용"""
+    ) -> Iterator[str]:
+        """최종 HTML 문서 생성 - 고품질 템플릿 적용 (챕터/표/이미지는 slot 자리에 청크로 이어 붙임)"""
 
         # 수학 수식 포함 여부
         has_math = bool(structure.get("equations")) or '$' in all_text or '\\[' in all_text
@@ -1142,9 +1162,6 @@ $${eq}$$
         sections = structure.get("sections", [])
         toc_items = self._build_toc_items_html(sections) if options.get("show_toc") else ""
 
-        # 챕터 섹션 HTML (고급 스타일)
-        chapters_html = self._build_chapters_html(sections, theme)
-
         # 핵심 개념 HTML
         concepts_html = self._build_key_concepts_html(structure.get("key_concepts", []))
 
@@ -1154,31 +1171,18 @@ $${eq}$$
         # 퀴즈 HTML
         quiz_html = self._build_quiz_html(quiz) if options.get("show_quiz") else ""
 
-        # 표 HTML (섹션 내부로 통합)
-        tables_html = ""
-        for table in structure.get("tables", []):
-            tables_html += self._build_table_html(table)
+        # 표 HTML (섹션 내부로 통합) - 표 하나씩
+        tables_html = (self._build_table_html(table) for table in structure.get("tables", []))
 
-        # 이미지 HTML (섹션 내부로 통합)
-        images_html = ""
-        for img in structure.get("images", []):
-            if img.get("base64"):
-                images_html += f'''
-                <div class="image-container">
-                    <img src="data:image/png;base64,{img["base64"]}" alt="{img.get("caption", "")}">
-                    {f'<p class="image-caption">{img["caption"]}</p>' if img.get("caption") else ''}
-                </div>
-                '''
-            elif img.get("path"):
-                images_html += f'''
-                <div class="image-container">
-                    <img src="{img["path"]}" alt="{img.get("caption", "")}">
-                    {f'<p class="image-caption">{img["caption"]}</p>' if img.get("caption") else ''}
-                </div>
-                '''
+        # 이미지 HTML (섹션 내부로 통합) - base64 이미지를 하나씩 내보냄
+        images_html = self._iter_images_html(structure.get("images", []))
 
         # 메인 콘텐츠 (섹션이 없으면 전체 텍스트)
-        main_content = chapters_html if chapters_html else f'''
+        if sections:
+            # 챕터 섹션 HTML (고급 스타일)
+            main_content = self._iter_chapters_html(sections, theme)
+        else:
+            main_content = f'''
         <div class="chapter-section" id="chapter-1">
             <div class="chapter-title">
                 <div class="chapter-number">1</div>
@@ -1223,7 +1227,7 @@ $${eq}$$
     <script>hljs.highlightAll();</script>
 ''' if has_code else ""
 
-        return f'''<!DOCTYPE html>
+        skeleton = f'''<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
@@ -2626,13 +2630,13 @@ $${eq}$$
         {concepts_html}
 
         <!-- 메인 콘텐츠 (챕터들) -->
-        {main_content}
+        {slot("main-content")}
 
         <!-- 표 -->
-        {tables_html}
+        {slot("tables")}
 
         <!-- 이미지 -->
-        {images_html}
+        {slot("images")}
 
         <!-- 플래시카드 -->
         {flashcards_html}
@@ -3123,6 +3127,30 @@ $${eq}$$
 </body>
 </html>'''
 
+        return iter_slots(skeleton, {
+            "main-content": main_content,
+            "tables": tables_html,
+            "images": images_html,
+        })
+
+    def _iter_images_html(self, images: List[Dict]) -> Iterator[str]:
+        """이미지 HTML (base64 또는 경로) - 이미지 하나씩"""
+        for img in images:
+            if img.get("base64"):
+                yield f'''
+                <div class="image-container">
+                    <img src="data:image/png;base64,{img["base64"]}" alt="{img.get("caption", "")}">
+                    {f'<p class="image-caption">{img["caption"]}</p>' if img.get("caption") else ''}
+                </div>
+                '''
+            elif img.get("path"):
+                yield f'''
+                <div class="image-container">
+                    <img src="{img["path"]}" alt="{img.get("caption", "")}">
+                    {f'<p class="image-caption">{img["caption"]}</p>' if img.get("caption") else ''}
+                </div>
+                '''
+
     def _build_table_html(self, table: Dict) -> str:
         """표 HTML 생성"""
         html = '<div class="table-container"><table class="data-table">'
@@ -0,0 +1,246 @@
+"""
+성능 계측 모듈 - 변환 핫패스의 단계별 소요 시간과 호출 수를 수집해 Prometheus 텍스트 형식으로 노출
+
+- 단계 히스토그램: studysnap_stage_duration_seconds{stage, content_type}
+  - 파이프라인 단계(작업 큐): render, ocr, merge, html, verify ...
+  - 세부 작업: page_render, page_encode, vision_call, vision_parse, db_write, db_flush
+- 작업 카운터/소요 시간: studysnap_jobs_total, studysnap_job_duration_seconds
+- Vision API: 요청 수(캐시 적중/미스), 지연 시간, 입력/출력 토큰 수
+- content_type은 작업 스레드에 바인딩된 값을 사용 (작업 밖에서는 "unknown")
+
+사용법:
+    from metrics import timed, get_metrics
+
+    with timed("vision_call"):
+        ...
+
+    @timed("vision_parse")
+    def _parse_response(self, text): ...
+
+    text = get_metrics().render()   # GET /metrics
+"""
+
+import time
+import bisect
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 버킷 (초) - 페이지 렌더링(ms 단위)부터 Vision 호출/전체 작업(수십 초)까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+UNKNOWN = "unknown"
+
+_content_type: ContextVar[str] = ContextVar("metrics_content_type", default=UNKNOWN)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def bind_content_type(content_type: Optional[str]) -> Token:
+    """현재 실행 흐름의 content_type 설정 (reset_content_type으로 되돌림)"""
+    return _content_type.set(content_type or UNKNOWN)
+
+
+def reset_content_type(token: Token) -> None:
+    _content_type.reset(token)
+
+
+def current_content_type() -> str:
+    return _content_type.get()
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(key) + ([extra] if extra else [])
+    if not items:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in items) + "}"
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Histogram:
+    """라벨 조합별 누적 버킷 카운트 + 합계"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 -> [버킷별 카운트(비누적)..., +Inf 카운트], 합계
+        self.series: Dict[LabelKey, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, key: LabelKey, value: float) -> None:
+        counts, total = self.series.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+
+class MetricsRegistry:
+    """카운터/히스토그램 저장소 (스레드 안전)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, _Histogram] = {}
+        self._help: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        self.describe("studysnap_stage_duration_seconds", "변환 단계별 소요 시간")
+        self.describe("studysnap_stage_errors_total", "예외로 끝난 변환 단계 수")
+        self.describe("studysnap_jobs_total", "종료된 변환 작업 수")
+        self.describe("studysnap_job_duration_seconds", "변환 작업 전체 소요 시간")
+        self.describe("studysnap_vision_requests_total", "Vision OCR 요청 수 (cache=hit|miss)")
+        self.describe("studysnap_vision_latency_seconds", "Vision API 호출 지연 시간 (캐시 미스만)")
+        self.describe("studysnap_vision_tokens_total", "Vision API 토큰 사용량 (direction=input|output)")
+
+    def describe(self, name: str, help_text: str) -> None:
+        self._help[name] = help_text
+
+    # ---------- 기록 ----------
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = _Histogram(self.buckets)
+            histogram.observe(key, value)
+
+    def observe_stage(self, stage: str, seconds: float, content_type: Optional[str] = None,
+                      failed: bool = False) -> None:
+        """단계 소요 시간 기록 (content_type 생략 시 현재 작업 값)"""
+        content_type = content_type or current_content_type()
+        self.observe("studysnap_stage_duration_seconds", seconds, stage=stage, content_type=content_type)
+        if failed:
+            self.inc("studysnap_stage_errors_total", stage=stage, content_type=content_type)
+
+    def record_job(self, kind: str, content_type: str, status: str, seconds: float) -> None:
+        """작업 종료 기록"""
+        self.inc("studysnap_jobs_total", kind=kind, content_type=content_type, status=status)
+        self.observe("studysnap_job_duration_seconds", seconds, kind=kind, content_type=content_type)
+
+    def record_vision_call(self, model: str, cached: bool, seconds: float = 0.0,
+                           input_tokens: int = 0, output_tokens: int = 0) -> None:
+        """Vision OCR 요청 기록 (캐시 적중이면 지연/토큰은 기록하지 않음)"""
+        content_type = current_content_type()
+        self.inc("studysnap_vision_requests_total", model=model, content_type=content_type,
+                 cache="hit" if cached else "miss")
+        if cached:
+            return
+        self.observe("studysnap_vision_latency_seconds", seconds, model=model, content_type=content_type)
+        self.observe_stage("vision_call", seconds, content_type)
+        if input_tokens:
+            self.inc("studysnap_vision_tokens_total", input_tokens, model=model,
+                     content_type=content_type, direction="input")
+        if output_tokens:
+            self.inc("studysnap_vision_tokens_total", output_tokens, model=model,
+                     content_type=content_type, direction="output")
+
+    @contextmanager
+    def timed(self, stage: str, content_type: Optional[str] = None) -> Iterator[None]:
+        """블록 소요 시간을 단계 히스토그램에 기록 (데코레이터로도 사용 가능)"""
+        started = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.observe_stage(stage, time.perf_counter() - started, content_type, failed)
+
+    # ---------- 노출 ----------
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식 (text/plain; version=0.0.4)"""
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                self._render_header(lines, name, "counter")
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_number(value)}")
+
+            for name in sorted(self._histograms):
+                histogram = self._histograms[name]
+                self._render_header(lines, name, "histogram")
+                for key, (counts, total) in sorted(histogram.series.items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + (float("inf"),), counts):
+                        cumulative += count
+                        lines.append(
+                            f"{name}_bucket{_format_labels(key, ('le', _format_number(bound)))} {cumulative}"
+                        )
+                    lines.append(f"{name}_sum{_format_labels(key)} {_format_number(round(total[0], 6))}")
+                    lines.append(f"{name}_count{_format_labels(key)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+    def _render_header(self, lines: List[str], name: str, metric_type: str) -> None:
+        if name in self._help:
+            lines.append(f"# HELP {name} {self._help[name]}")
+        lines.append(f"# TYPE {name} {metric_type}")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+class StageTimer:
+    """작업 큐를 거치지 않는 엔드포인트용 단계 타이머 - 단계 시간을 모아 변환 기록에 남김"""
+
+    def __init__(self, content_type: Optional[str] = None):
+        self.content_type = content_type or UNKNOWN
+        self.started = time.perf_counter()
+        self.timings: Dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            with get_metrics().timed(name, self.content_type):
+                yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0) + int((time.perf_counter() - started) * 1000)
+
+    def elapsed_ms(self) -> int:
+        return int((time.perf_counter() - self.started) * 1000)
+
+
+# 싱글톤 인스턴스
+_metrics = None
+_metrics_lock = threading.Lock()
+
+def get_metrics() -> MetricsRegistry:
+    """성능 계측 저장소 싱글톤 인스턴스 가져오기"""
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = MetricsRegistry()
+    return _metrics
+
+
+def timed(stage: str, content_type: Optional[str] = None):
+    """get_metrics().timed 단축 (with 블록 또는 데코레이터)"""
+    return get_metrics().timed(stage, content_type)
@@ -7,9 +7,11 @@ NewsletterAI - 지자체 소식지 전용 HTML 생성기
 
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 from datetime import datetime
 
+from html_stream import iter_slots, slot
+
 logger = logging.getLogger(__name__)
 
 
@@ -158,13 +160,17 @@ class NewsletterHTMLGenerator:
                 ]
             }
         """
+        return "".join(self.generate_chunks(data))
+
+    def generate_chunks(self, data: Dict[str, Any]) -> Iterator[str]:
+        """소식지 HTML을 청크 단위로 생성 - 페이지 본문은 한 페이지씩 만들면서 내보냄"""
         title = data.get("title", "지자체 소식지")
         issue = data.get("issue", "")
         date = data.get("date", "")
         publisher = data.get("publisher", "")
         pages = data.get("pages", [])
 
-        html = f'''<!DOCTYPE html>
+        skeleton = f'''<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
@@ -190,7 +196,7 @@ class NewsletterHTMLGenerator:
     {self._build_nav_tabs(pages)}
 
     <main class="container">
-        {self._build_pages_content(pages)}
+        {slot("pages")}
     </main>
 
     {self._build_footer(data)}
@@ -206,7 +212,7 @@ class NewsletterHTMLGenerator:
 </body>
 </html>'''
 
-        return html
+        return iter_slots(skeleton, {"pages": self._iter_pages_content(pages)})
 
     def _get_css(self) -> str:
         """CSS 스타일"""
@@ -893,10 +899,8 @@ class NewsletterHTMLGenerator:
         }
         return icons.get(category, "📌")
 
-    def _build_pages_content(self, pages: List[Dict]) -> str:
-        """페이지 콘텐츠 생성 (표준화된 카테고리로 그룹핑)"""
-        content = []
-
+    def _iter_pages_content(self, pages: List[Dict]) -> Iterator[str]:
+        """페이지 콘텐츠 생성 (표준화된 카테고리로 그룹핑, 섹션/페이지 단위 청크)"""
         # 표준화된 카테고리 순서
         category_order = ["특집", "스마트도시", "복지", "교육", "공동체", "생활정보", "문화", "캐릭터", "기타"]
 
@@ -917,17 +921,14 @@ class NewsletterHTMLGenerator:
         for i, cat in enumerate(sorted_categories):
             active = "active" if i == 0 else ""
             cat_pages = categories[cat]
-            section_content = []
 
-            for page in cat_pages:
-                section_content.append(self._build_page_content(page))
-
-            content.append(f'''
+            yield f'''
             <section class="page-section {active}" id="tab-{i}">
-                {''.join(section_content)}
-            </section>''')
-
-        return ''.join(content)
+                '''
+            for page in cat_pages:
+                yield self._build_page_content(page)
+            yield '''
+            </section>'''
 
     def _build_page_content(self, page: Dict) -> str:
         """개별 페이지 콘텐츠 생성 (아코디언 형식)"""
@@ -0,0 +1,387 @@
+"""
+생성 결과물 전송 모듈 - outputs 파일을 미리 압축(br/gzip)해 두고 ETag/Range 요청을 처리
+
+- 결과물을 쓸 때(write_output) 백그라운드에서 .br/.gz 변형을 미리 만들어 둠
+  (outputs 폴더 목록/ZIP에 섞이지 않도록 cache/outputs/ 아래에 같은 경로로 저장)
+- write_output은 생성기의 청크 제너레이터도 받아 임시 파일에 이어 쓰고 원자적으로 교체 (html_stream)
+- 변형의 수정 시각을 원본과 맞춰 두고, 원본이 바뀌면 오래된 변형은 쓰지 않고 다시 압축
+- ETag: 원본 내용 해시 (인코딩별로 -br/-gzip 접미사), If-None-Match/If-Modified-Since → 304
+- Accept-Encoding(q값 포함) 협상, Range(단일 구간)/If-Range → 206/416
+- brotli 패키지가 없으면 gzip만 사용
+
+사용법:
+    from output_delivery import get_output_delivery
+
+    delivery = get_output_delivery()
+    delivery.write_output(output_path, html_content)  # 문자열 또는 청크 제너레이터
+    return delivery.response(full_path, request)
+"""
+
+import os
+import gzip
+import hashlib
+import logging
+import threading
+import mimetypes
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import quote
+
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response, StreamingResponse
+
+from html_stream import write_chunks
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT_DIR = Path(__file__).parent / "outputs"
+DEFAULT_CACHE_DIR = Path(__file__).parent / "cache" / "outputs"
+
+# 압축 대상 형식 (이미지/PDF 등 이미 압축된 형식은 제외)
+COMPRESSIBLE_TYPES = frozenset({
+    "text/html", "text/css", "text/plain", "text/xml", "text/csv", "text/markdown",
+    "application/javascript", "text/javascript", "application/json", "application/xml",
+    "image/svg+xml",
+})
+MIN_COMPRESS_SIZE = 1024
+CHUNK_SIZE = 64 * 1024
+
+# (Content-Encoding, 확장자) - 우선순위 순
+ENCODINGS: Tuple[Tuple[str, str], ...] = (("br", ".br"), ("gzip", ".gz"))
+
+
+def guess_media_type(path: Union[str, Path]) -> str:
+    mime_type, _ = mimetypes.guess_type(str(path))
+    return mime_type or "application/octet-stream"
+
+
+def is_compressible(path: Union[str, Path]) -> bool:
+    return guess_media_type(path) in COMPRESSIBLE_TYPES
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Accept-Encoding → {인코딩: q값}"""
+    accepted: Dict[str, float] = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[token] = q
+    return accepted
+
+
+def _etag_matches(header: str, base_tag: str) -> bool:
+    """If-None-Match/If-Range 비교 (약한 비교, 인코딩 접미사는 무시)"""
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        candidate = candidate.strip('"')
+        for encoding, _ in ENCODINGS:
+            candidate = candidate.removesuffix(f"-{encoding}")
+        if candidate == base_tag:
+            return True
+    return False
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """단일 bytes 구간 → (시작, 끝 포함). 여러 구간/형식 오류는 None(전체 전송), 범위 밖은 ValueError"""
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_text, sep, end_text = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if not start_text:
+            length = int(end_text)
+        else:
+            start = int(start_text)
+            end = int(end_text) if end_text else size - 1
+    except ValueError:
+        return None
+    if not start_text:
+        # 접미 구간 (bytes=-N) - 길이 0은 만족할 수 없는 구간
+        if length <= 0:
+            raise ValueError("빈 구간")
+        start, end = max(0, size - length), size - 1
+    if start >= size or start > end:
+        raise ValueError("범위 밖")
+    return start, min(end, size - 1)
+
+
+def _iter_file_range(path: Path, start: int, length: int) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        while length > 0:
+            data = f.read(min(CHUNK_SIZE, length))
+            if not data:
+                break
+            length -= len(data)
+            yield data
+
+
+class OutputDelivery:
+    """outputs 파일 전송 - 미리 압축된 변형 관리 + 조건부/구간 요청 처리"""
+
+    def __init__(self, output_dir: Optional[Path] = None, cache_dir: Optional[Path] = None,
+                 max_workers: Optional[int] = None):
+        self.output_dir = Path(output_dir or DEFAULT_OUTPUT_DIR).resolve()
+        self.cache_dir = Path(cache_dir or os.getenv("OUTPUT_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        self.brotli_quality = int(os.getenv("OUTPUT_BROTLI_QUALITY", "11"))
+        self.gzip_level = int(os.getenv("OUTPUT_GZIP_LEVEL", "9"))
+        self.max_age = int(os.getenv("OUTPUT_CACHE_MAX_AGE", "3600"))
+
+        # 경로 -> (mtime_ns, 크기, 내용 해시)
+        self._etags: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+        self._etag_limit = 4096
+        self._pending: set = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or int(os.getenv("OUTPUT_COMPRESS_WORKERS", "1")),
+            thread_name_prefix="precompress"
+        )
+
+    # ---------- 변형 파일 ----------
+
+    def _variant_path(self, path: Path, suffix: str) -> Optional[Path]:
+        try:
+            relative = Path(path).resolve().relative_to(self.output_dir)
+        except ValueError:
+            return None
+        return self.cache_dir / relative.parent / (relative.name + suffix)
+
+    def _available_encodings(self) -> List[Tuple[str, str]]:
+        return [(name, suffix) for name, suffix in ENCODINGS if name != "br" or brotli is not None]
+
+    def _compress(self, data: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(data, quality=self.brotli_quality)
+        return gzip.compress(data, compresslevel=self.gzip_level, mtime=0)
+
+    def precompress(self, path: Union[str, Path]) -> List[str]:
+        """br/gzip 변형 생성 (원본보다 작을 때만 저장) - 만든 인코딩 목록 반환"""
+        path = Path(path)
+        try:
+            stat = path.stat()
+            if stat.st_size < MIN_COMPRESS_SIZE or not is_compressible(path):
+                return []
+            data = path.read_bytes()
+        except OSError:
+            return []
+
+        self._remember_etag(path, stat, hashlib.sha256(data).hexdigest()[:32])
+        created = []
+        for encoding, suffix in self._available_encodings():
+            target = self._variant_path(path, suffix)
+            if target is None:
+                continue
+            compressed = self._compress(data, encoding)
+            if len(compressed) >= stat.st_size:
+                continue
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = target.with_name(f"{target.name}.{threading.get_ident()}.tmp")
+                tmp_path.write_bytes(compressed)
+                # 원본 수정 시각을 기록해 두고 전송 시 같은지 비교 (다르면 오래된 변형)
+                os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+                os.replace(tmp_path, target)
+                created.append(encoding)
+            except OSError as e:
+                logger.warning(f"압축 변형 저장 실패: {target} ({e})")
+        return created
+
+    def schedule_precompress(self, path: Union[str, Path]) -> None:
+        """백그라운드에서 압축 변형 생성 (같은 파일 중복 예약은 무시)"""
+        key = str(path)
+        if not is_compressible(path):
+            return
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+
+        def run():
+            try:
+                self.precompress(path)
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+
+        try:
+            self._executor.submit(run)
+        except RuntimeError:
+            # 종료 중이면 예약하지 않음 (다음 요청 때 다시 예약)
+            with self._lock:
+                self._pending.discard(key)
+
+    def write_output(self, path: Union[str, Path], content: Union[str, Iterable[str]]) -> None:
+        """결과물 저장 + 압축 변형 예약
+
+        content는 문자열 또는 생성기의 청크 제너레이터 (generate_chunks 등) - 청크는 받는 대로 기록
+        """
+        write_chunks(path, (content,) if isinstance(content, str) else content)
+        self.schedule_precompress(path)
+
+    def _fresh_variant(self, path: Path, stat: os.stat_result, suffix: str) -> Optional[Tuple[Path, os.stat_result]]:
+        target = self._variant_path(path, suffix)
+        if target is None:
+            return None
+        try:
+            variant_stat = target.stat()
+        except OSError:
+            return None
+        if variant_stat.st_mtime_ns != stat.st_mtime_ns:
+            return None
+        return target, variant_stat
+
+    # ---------- ETag ----------
+
+    def _remember_etag(self, path: Path, stat: os.stat_result, digest: str) -> None:
+        with self._lock:
+            self._etags[str(path)] = (stat.st_mtime_ns, stat.st_size, digest)
+            self._etags.move_to_end(str(path))
+            while len(self._etags) > self._etag_limit:
+                self._etags.popitem(last=False)
+
+    def content_hash(self, path: Path, stat: os.stat_result) -> str:
+        """원본 내용 해시 (수정 시각/크기가 같으면 재계산하지 않음)"""
+        with self._lock:
+            cached = self._etags.get(str(path))
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha.update(chunk)
+        digest = sha.hexdigest()[:32]
+        self._remember_etag(path, stat, digest)
+        return digest
+
+    # ---------- 응답 ----------
+
+    def response(self, path: Union[str, Path], request: Request) -> Response:
+        """조건부 요청/인코딩 협상/Range를 처리한 응답 (파일 읽기/해시가 있으므로 스레드에서 호출)"""
+        path = Path(path)
+        stat = path.stat()
+        media_type = guess_media_type(path)
+        compressible = media_type in COMPRESSIBLE_TYPES and stat.st_size >= MIN_COMPRESS_SIZE
+        digest = self.content_hash(path, stat)
+        last_modified = formatdate(stat.st_mtime, usegmt=True)
+
+        headers = {
+            "Cache-Control": f"public, max-age={self.max_age}",
+            "Last-Modified": last_modified,
+            "Content-Disposition": f"inline; filename*=UTF-8''{quote(path.name)}",
+            "Accept-Ranges": "bytes",
+        }
+        if compressible:
+            headers["Vary"] = "Accept-Encoding"
+
+        # 조건부 요청 → 304
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            not_modified = _etag_matches(if_none_match, digest)
+        else:
+            not_modified = self._not_modified_since(request.headers.get("if-modified-since"), stat)
+        if not_modified and request.method in ("GET", "HEAD"):
+            headers["ETag"] = f'"{digest}"'
+            headers.pop("Content-Disposition")
+            return Response(status_code=304, headers=headers)
+
+        # Range 요청은 원본(identity) 기준
+        range_header = request.headers.get("range")
+        if range_header and self._if_range_ok(request.headers.get("if-range"), digest, last_modified):
+            try:
+                byte_range = _parse_range(range_header, stat.st_size)
+            except ValueError:
+                return Response(status_code=416, headers={"Content-Range": f"bytes */{stat.st_size}",
+                                                          "ETag": f'"{digest}"'})
+            if byte_range is not None:
+                start, end = byte_range
+                length = end - start + 1
+                headers.update({
+                    "ETag": f'"{digest}"',
+                    "Content-Range": f"bytes {start}-{end}/{stat.st_size}",
+                    "Content-Length": str(length),
+                })
+                return StreamingResponse(_iter_file_range(path, start, length), status_code=206,
+                                         media_type=media_type, headers=headers)
+
+        # Accept-Encoding 협상 → 미리 압축된 변형
+        if compressible:
+            accepted = parse_accept_encoding(request.headers.get("accept-encoding", ""))
+            candidates = []
+            for encoding, suffix in self._available_encodings():
+                q = accepted.get(encoding, accepted.get("*", 0.0))
+                if q > 0:
+                    candidates.append((q, encoding, suffix))
+            # q값이 같으면 ENCODINGS 순서(br 우선)
+            candidates.sort(key=lambda item: -item[0])
+            for _, encoding, suffix in candidates:
+                variant = self._fresh_variant(path, stat, suffix)
+                if variant is None:
+                    continue
+                variant_path, variant_stat = variant
+                headers["ETag"] = f'"{digest}-{encoding}"'
+                headers["Content-Encoding"] = encoding
+                return FileResponse(variant_path, media_type=media_type, headers=headers, stat_result=variant_stat)
+            if candidates:
+                # 변형이 없거나 원본보다 오래됨 → 이번엔 원본 전송, 다음 요청부터 압축본
+                self.schedule_precompress(path)
+
+        headers["ETag"] = f'"{digest}"'
+        return FileResponse(path, media_type=media_type, headers=headers, stat_result=stat)
+
+    @staticmethod
+    def _not_modified_since(header: Optional[str], stat: os.stat_result) -> bool:
+        if not header:
+            return False
+        try:
+            return int(stat.st_mtime) <= parsedate_to_datetime(header).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def _if_range_ok(header: Optional[str], digest: str, last_modified: str) -> bool:
+        """If-Range가 없거나 현재 표현과 같을 때만 구간 전송 (강한 비교)"""
+        if not header:
+            return True
+        header = header.strip()
+        if header.startswith('"'):
+            return header.strip('"') == digest
+        return header == last_modified
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+# 싱글톤 인스턴스
+_output_delivery = None
+
+def get_output_delivery() -> OutputDelivery:
+    """결과물 전송 싱글톤 인스턴스 가져오기"""
+    global _output_delivery
+    if _output_delivery is None:
+        _output_delivery = OutputDelivery()
+    return _output_delivery
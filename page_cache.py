@@ -0,0 +1,217 @@
+"""
+렌더링 페이지 캐시 - 같은 PDF 페이지를 여러 변환기가 반복 래스터화하지 않도록 공유
+
+- 문서 내용 해시 기준: (문서 해시, 페이지, DPI, 변형) 단위로 렌더링 결과를 메모이즈
+- 필요한 페이지만 요청 시점에 렌더링 (전체 페이지 일괄 렌더링 없음)
+- 메모리 상한(PAGE_CACHE_MAX_MB) 초과 시 오래 안 쓴 항목부터 제거
+
+사용법:
+    from page_cache import get_page_cache
+
+    with get_page_cache().open(pdf_path) as raster:
+        text = raster.doc[0].get_text()
+        png = raster.image_bytes(0, dpi=150, fmt="png")
+"""
+
+import io
+import os
+import base64
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+from PIL import Image
+
+from metrics import timed
+
+logger = logging.getLogger(__name__)
+
+# (문서 해시, 0-based 페이지, DPI, 변형)
+CacheKey = Tuple[str, int, int, str]
+
+
+def mobile_jpeg_variant(max_width: int, quality: int) -> str:
+    """모바일 JPEG 캐시 변형 이름 (프로세스 풀 렌더링 결과와 키를 맞추기 위해 공유)"""
+    return f"jpeg:w{max_width}:q{quality}"
+
+
+def encode_mobile_jpeg(img: Image.Image, max_width: int = 800, quality: int = 85) -> bytes:
+    """PIL 이미지를 max_width로 축소 후 JPEG 인코딩"""
+    if img.width > max_width:
+        ratio = max_width / img.width
+        img = img.resize((max_width, int(img.height * ratio)), Image.LANCZOS)
+    buffer = io.BytesIO()
+    img.save(buffer, format="JPEG", quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+def hash_document(source: Union[str, Path, bytes]) -> str:
+    """PDF 내용 해시 (경로 또는 바이트)"""
+    sha = hashlib.sha256()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        sha.update(source)
+    else:
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha.update(chunk)
+    return sha.hexdigest()
+
+
+class RasterDocument:
+    """열린 PDF 하나 - 페이지 렌더링은 공유 캐시를 거쳐 요청 시점에 수행"""
+
+    def __init__(self, cache: "PageRasterCache", source: Union[str, Path, bytes], doc_hash: Optional[str] = None):
+        if fitz is None:
+            raise ImportError("PyMuPDF가 설치되지 않았습니다")
+
+        self.cache = cache
+        self.doc_hash = doc_hash or hash_document(source)
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self.doc = fitz.open(stream=bytes(source), filetype="pdf")
+        else:
+            self.doc = fitz.open(str(source))
+        # fitz 문서는 스레드 안전하지 않으므로 렌더링/페이지 접근은 문서 단위로 직렬화
+        self.lock = threading.RLock()
+
+    @property
+    def page_count(self) -> int:
+        return len(self.doc)
+
+    def __len__(self) -> int:
+        return len(self.doc)
+
+    def _memoize(self, page_index: int, dpi: int, variant: str, render):
+        key = (self.doc_hash, page_index, dpi, variant)
+        value = self.cache.get(key)
+        if value is None:
+            with self.lock:
+                value = self.cache.get(key)
+                if value is None:
+                    # page_encode는 캐시에 없던 pixmap 렌더링 시간도 포함
+                    with timed("page_render" if variant == "pixmap" else "page_encode"):
+                        value = render()
+                    self.cache.put(key, value)
+        return value
+
+    def pixmap(self, page_index: int, dpi: int = 150):
+        """페이지 Pixmap (RGB, 알파 없음)"""
+        def render():
+            zoom = dpi / 72
+            return self.doc[page_index].get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+
+        return self._memoize(page_index, dpi, "pixmap", render)
+
+    def image_bytes(self, page_index: int, dpi: int = 150, fmt: str = "png") -> bytes:
+        """페이지를 PNG/JPEG 바이트로 렌더링"""
+        return self._memoize(page_index, dpi, fmt, lambda: self.pixmap(page_index, dpi).tobytes(fmt))
+
+    def image_base64(self, page_index: int, dpi: int = 150, fmt: str = "png") -> str:
+        """페이지를 base64 문자열로 렌더링 (Vision API 입력용)"""
+        return base64.standard_b64encode(self.image_bytes(page_index, dpi, fmt)).decode("utf-8")
+
+    def pil_image(self, page_index: int, dpi: int = 150) -> Image.Image:
+        """페이지를 PIL 이미지로 렌더링 (호출자마다 새 이미지 객체)"""
+        pix = self.pixmap(page_index, dpi)
+        return Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+
+    def mobile_jpeg(self, page_index: int, dpi: int = 150, max_width: int = 800, quality: int = 85) -> bytes:
+        """모바일 최적화 JPEG (max_width로 축소)"""
+        return self._memoize(
+            page_index, dpi, mobile_jpeg_variant(max_width, quality),
+            lambda: encode_mobile_jpeg(self.pil_image(page_index, dpi), max_width, quality)
+        )
+
+    def close(self) -> None:
+        """문서 닫기 (렌더링 결과는 캐시에 유지)"""
+        with self.lock:
+            if self.doc is not None and not self.doc.is_closed:
+                self.doc.close()
+
+    def __enter__(self) -> "RasterDocument":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class PageRasterCache:
+    """렌더링된 페이지를 (문서 해시, 페이지, DPI, 변형) 단위로 보관하는 메모리 LRU 캐시"""
+
+    def __init__(self, max_size_mb: Optional[int] = None):
+        self.max_size_bytes = (max_size_mb or int(os.getenv("PAGE_CACHE_MAX_MB", "256"))) * 1024 * 1024
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def open(self, source: Union[str, Path, bytes], doc_hash: Optional[str] = None) -> RasterDocument:
+        """PDF 열기 (경로 또는 바이트)"""
+        return RasterDocument(self, source, doc_hash)
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        if isinstance(value, (bytes, bytearray)):
+            return len(value)
+        # fitz.Pixmap
+        return value.size
+
+    def get(self, key: CacheKey) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        size = self._sizeof(value)
+        if size > self.max_size_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._total_bytes += size
+
+            while self._total_bytes > self.max_size_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._total_bytes,
+                "max_size_bytes": self.max_size_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+# 싱글톤 인스턴스
+_page_cache = None
+
+def get_page_cache() -> PageRasterCache:
+    """렌더링 페이지 캐시 싱글톤 인스턴스 가져오기"""
+    global _page_cache
+    if _page_cache is None:
+        _page_cache = PageRasterCache()
+    return _page_cache
@@ -10,6 +10,8 @@ import os
 import re
 import base64
 import logging
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
@@ -19,8 +21,7 @@ except ImportError:
     fitz = None
     print("경고: PyMuPDF가 설치되지 않았습니다. pip install pymupdf 실행 필요")
 
-from PIL import Image
-import io
+from page_cache import get_page_cache
 
 # Vision OCR 임포트
 try:
@@ -35,11 +36,18 @@ logger = logging.getLogger(__name__)
 class PDFConverter:
     """PDF 파일에서 텍스트/이미지를 추출하는 클래스"""
 
-    def __init__(self, dpi: int = 150, max_width: int = 800, use_vision_ocr: bool = True, include_images: bool = False):
+    def __init__(self, dpi: int = 150, max_width: int = 800, use_vision_ocr: bool = True, include_images: bool = False,
+                 ocr_concurrency: Optional[int] = None, process_pool_min_pages: Optional[int] = None):
         self.dpi = dpi
         self.max_width = max_width
         self.use_vision_ocr = use_vision_ocr
         self.include_images = include_images  # OCR 사용 시에도 이미지 포함 여부
+        # 이미지 기반 PDF의 페이지별 Vision OCR 동시 호출 수 (1이면 순차 처리)
+        self.ocr_concurrency = max(1, ocr_concurrency or int(os.getenv("VISION_OCR_CONCURRENCY", "4")))
+        # 이 페이지 수 이상이면 렌더링/리사이즈/JPEG 인코딩을 프로세스 풀에서 병렬 처리 (0이면 사용 안 함)
+        if process_pool_min_pages is None:
+            process_pool_min_pages = int(os.getenv("RASTER_PROCESS_POOL_MIN_PAGES", "8"))
+        self.process_pool_min_pages = process_pool_min_pages
         self.vision_ocr = VisionOCR() if (use_vision_ocr and VisionOCR) else None
 
     def extract_from_pdf(self, pdf_path: str, content_type: str = "general", exclude_pages: list = None) -> Optional[Dict[str, Any]]:
@@ -57,7 +65,9 @@ class PDFConverter:
             exclude_pages = []
 
         try:
-            doc = fitz.open(pdf_path)
+            # 페이지 렌더링은 공유 캐시를 거쳐 필요한 페이지만 수행
+            raster = get_page_cache().open(pdf_path)
+            doc = raster.doc
             pages = []
             total_text_length = 0
 
@@ -87,24 +97,19 @@ class PDFConverter:
 
                 # Vision OCR 사용 가능하면 OCR 시도
                 if self.vision_ocr and self.vision_ocr.client:
-                    logger.info("Claude Vision OCR 사용하여 텍스트 추출 시작")
-                    pages = []
-                    all_structured_data = []
+                    logger.info(f"Claude Vision OCR 사용하여 텍스트 추출 시작 (동시 처리: {self.ocr_concurrency})")
+                    page_indexes = []
 
                     for page_num in range(len(doc)):
                         # 제외할 페이지는 건너뛰기
                         if (page_num + 1) in exclude_pages:
                             logger.info(f"페이지 {page_num + 1} 제외됨 (OCR)")
                             continue
+                        page_indexes.append(page_num)
 
-                        page = doc[page_num]
-                        page_data = self._process_page_with_vision(
-                            page, page_num + 1, content_type
-                        )
-                        pages.append(page_data)
-
-                        if page_data.get("structured"):
-                            all_structured_data.append(page_data["structured"])
+                    self._prerender_pages(raster, pdf_path, page_indexes)
+                    pages = self._process_pages_with_vision(raster, page_indexes, content_type)
+                    all_structured_data = [p["structured"] for p in pages if p.get("structured")]
 
                     # 구조화된 데이터 병합
                     merged_structured = self._merge_structured_data(all_structured_data)
@@ -124,6 +129,9 @@ class PDFConverter:
                 else:
                     # Vision OCR 없으면 이미지로 렌더링 (기존 방식)
                     logger.warning("Vision OCR 사용 불가 - 이미지 렌더링으로 대체")
+                    self._prerender_pages(
+                        raster, pdf_path, [i for i in range(len(doc)) if (i + 1) not in exclude_pages]
+                    )
                     pages = []
                     for page_num in range(len(doc)):
                         # 제외할 페이지는 건너뛰기
@@ -131,8 +139,7 @@ class PDFConverter:
                             logger.info(f"페이지 {page_num + 1} 제외됨 (이미지)")
                             continue
 
-                        page = doc[page_num]
-                        page_data = self._process_page_as_image(page, page_num + 1)
+                        page_data = self._process_page_as_image(raster, page_num)
                         pages.append(page_data)
 
                     result = {
@@ -160,37 +167,91 @@ class PDFConverter:
                     "ocr_used": False
                 }
 
-            doc.close()
+            raster.close()
             return result
 
         except Exception as e:
             logger.error(f"PDF 추출 오류: {str(e)}", exc_info=True)
             return self._create_demo_data(pdf_path)
 
-    def _process_page_with_vision(self, page, page_num: int, content_type: str) -> Dict[str, Any]:
+    def _process_pages_with_vision(self, raster, page_indexes: List[int], content_type: str) -> List[Dict[str, Any]]:
+        """여러 페이지 Vision OCR - 렌더링은 순차, OCR 호출은 ocr_concurrency개까지 병렬 (페이지 순서 유지)
+
+        fitz 문서 객체는 스레드 간 공유가 안전하지 않으므로 렌더링은 현재 스레드에서 하고,
+        렌더링된 이미지의 Vision API 호출만 스레드 풀로 보낸다.
+        """
+        if self.ocr_concurrency <= 1 or len(page_indexes) <= 1:
+            return [self._process_page_with_vision(raster, idx, content_type) for idx in page_indexes]
+
+        doc = raster.doc
+        workers = min(self.ocr_concurrency, len(page_indexes))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vision-ocr") as executor:
+            futures = []
+            for idx in page_indexes:
+                page = doc[idx]
+                page_num = idx + 1
+                try:
+                    base64_img = self._render_page_base64(raster, idx)
+                except Exception as e:
+                    logger.error(f"페이지 {page_num} 렌더링 오류: {str(e)}", exc_info=True)
+                    futures.append(None)
+                    continue
+                futures.append(executor.submit(
+                    contextvars.copy_context().run, self._ocr_page_image, base64_img, page_num, content_type,
+                    page.rect.width, page.rect.height
+                ))
+
+            pages = []
+            for idx, future in zip(page_indexes, futures):
+                if future is None:
+                    page = doc[idx]
+                    pages.append(self._empty_page(idx + 1, page.rect.width, page.rect.height))
+                else:
+                    pages.append(future.result())
+            return pages
+
+    def _process_page_with_vision(self, raster, page_index: int, content_type: str) -> Dict[str, Any]:
         """페이지를 이미지로 렌더링 후 Vision OCR로 텍스트 추출"""
+        page = raster.doc[page_index]
+        page_num = page_index + 1
         try:
-            # 줌 계산 (DPI 기반)
-            zoom = self.dpi / 72
-            mat = fitz.Matrix(zoom, zoom)
+            base64_img = self._render_page_base64(raster, page_index)
+        except Exception as e:
+            logger.error(f"페이지 {page_num} Vision OCR 오류: {str(e)}", exc_info=True)
+            return self._empty_page(page_num, page.rect.width, page.rect.height)
+
+        return self._ocr_page_image(base64_img, page_num, content_type, page.rect.width, page.rect.height)
 
-            # 페이지 렌더링
-            pix = page.get_pixmap(matrix=mat)
+    def _prerender_pages(self, raster, pdf_path: str, page_indexes: List[int]) -> None:
+        """페이지가 많으면 프로세스 풀에서 미리 렌더링해 공유 페이지 캐시를 채움
+
+        각 워커가 문서를 직접 열어 래스터화 + LANCZOS 리사이즈 + JPEG 인코딩까지 처리하므로
+        GIL에 묶이지 않고 모든 코어를 사용한다. 이후 _render_page_base64는 캐시에서 바로 가져온다.
+        """
+        if not self.process_pool_min_pages or len(page_indexes) < self.process_pool_min_pages:
+            return
 
-            # PIL 이미지로 변환
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+        try:
+            from job_queue import get_job_manager
 
-            # 모바일 최적화 리사이즈
-            if img.width > self.max_width:
-                ratio = self.max_width / img.width
-                new_height = int(img.height * ratio)
-                img = img.resize((self.max_width, new_height), Image.LANCZOS)
+            logger.info(f"프로세스 풀 렌더링: {len(page_indexes)}페이지")
+            get_job_manager().render_pages(
+                str(pdf_path), page_indexes, dpi=self.dpi, fmt="jpeg",
+                max_width=self.max_width, quality=85, doc_hash=raster.doc_hash
+            )
+        except Exception as e:
+            # 실패해도 이후 페이지별 렌더링이 현재 스레드에서 처리
+            logger.warning(f"프로세스 풀 렌더링 실패, 순차 렌더링으로 진행: {e}")
 
-            # JPEG로 압축
-            buffer = io.BytesIO()
-            img.save(buffer, format="JPEG", quality=85, optimize=True)
-            base64_img = base64.b64encode(buffer.getvalue()).decode()
+    def _render_page_base64(self, raster, page_index: int) -> str:
+        """페이지를 모바일 최적화 JPEG(base64)로 렌더링 (공유 페이지 캐시 사용)"""
+        jpeg_bytes = raster.mobile_jpeg(page_index, dpi=self.dpi, max_width=self.max_width, quality=85)
+        return base64.b64encode(jpeg_bytes).decode()
 
+    def _ocr_page_image(self, base64_img: str, page_num: int, content_type: str,
+                        width: float, height: float) -> Dict[str, Any]:
+        """렌더링된 페이지 이미지를 Vision OCR로 분석 (스레드 풀에서 호출 가능)"""
+        try:
             # Vision OCR 호출
             logger.info(f"페이지 {page_num} OCR 처리 시작")
 
@@ -215,37 +276,31 @@ class PDFConverter:
                 "page_number": page_num,
                 "image": image_data,
                 "text": text,
-                "width": page.rect.width,
-                "height": page.rect.height,
+                "width": width,
+                "height": height,
                 "structured": structured
             }
 
         except Exception as e:
             logger.error(f"페이지 {page_num} Vision OCR 오류: {str(e)}", exc_info=True)
-            return {
-                "page_number": page_num,
-                "image": "",
-                "text": "",
-                "width": page.rect.width,
-                "height": page.rect.height,
-            }
+            return self._empty_page(page_num, width, height)
+
+    def _empty_page(self, page_num: int, width: float, height: float) -> Dict[str, Any]:
+        """처리 실패한 페이지의 빈 결과"""
+        return {
+            "page_number": page_num,
+            "image": "",
+            "text": "",
+            "width": width,
+            "height": height,
+        }
 
-    def _process_page_as_image(self, page, page_num: int) -> Dict[str, Any]:
+    def _process_page_as_image(self, raster, page_index: int) -> Dict[str, Any]:
         """페이지를 이미지로 렌더링 (OCR 없이)"""
+        page = raster.doc[page_index]
+        page_num = page_index + 1
         try:
-            zoom = self.dpi / 72
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-
-            if img.width > self.max_width:
-                ratio = self.max_width / img.width
-                new_height = int(img.height * ratio)
-                img = img.resize((self.max_width, new_height), Image.LANCZOS)
-
-            buffer = io.BytesIO()
-            img.save(buffer, format="JPEG", quality=85, optimize=True)
-            base64_img = base64.b64encode(buffer.getvalue()).decode()
+            base64_img = self._render_page_base64(raster, page_index)
 
             return {
                 "page_number": page_num,
@@ -257,13 +312,7 @@ class PDFConverter:
 
         except Exception as e:
             logger.error(f"페이지 {page_num} 이미지 렌더링 오류: {str(e)}", exc_info=True)
-            return {
-                "page_number": page_num,
-                "image": "",
-                "text": "",
-                "width": page.rect.width,
-                "height": page.rect.height,
-            }
+            return self._empty_page(page_num, page.rect.width, page.rect.height)
 
     def _merge_structured_data(self, data_list: List[Dict]) -> Dict:
         """여러 페이지의 구조화된 데이터 병합"""
@@ -1,16 +1,24 @@
 """
 고객 맞춤형 출력 템플릿 엔진
 사용자가 원하는 출력 형식을 자유롭게 정의할 수 있는 시스템
+
+- 모든 템플릿은 공유 Jinja2 Environment로 한 번만 컴파일해 재사용
+  (바이트코드는 cache/templates/에 저장 → 서버 재시작 후에도 다시 컴파일하지 않음)
+- create_custom_template으로 내용이 바뀌면 해당 템플릿만 다시 컴파일
+- generate()로 출력 조각을 차례로 받는 스트리밍 렌더링 지원
 """
 
 import json
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from typing import Dict, Iterator, List, Any, Optional
 from pathlib import Path
-from jinja2 import Template, Environment, FileSystemLoader, select_autoescape
+from jinja2 import Template, Environment, FunctionLoader, FileSystemBytecodeCache
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BYTECODE_DIR = Path(__file__).parent / "cache" / "templates"
+
 
 class OutputTemplate:
     """출력 템플릿 정의"""
@@ -20,16 +28,30 @@ class OutputTemplate:
         self.name = name
         self.description = description
         self.template_content = template_content
+        # 컴파일된 Jinja2 템플릿 (TemplateEngine이 공유 Environment로 채움, 없으면 처음 렌더링 시 컴파일)
+        self.compiled: Optional[Template] = None
+
+    def _template(self) -> Template:
+        if self.compiled is None:
+            self.compiled = Template(self.template_content)
+        return self.compiled
 
     def render(self, data: Dict[str, Any]) -> str:
         """템플릿 렌더링"""
         try:
-            template = Template(self.template_content)
-            return template.render(**data)
+            return self._template().render(**data)
         except Exception as e:
             logger.error(f"템플릿 렌더링 실패: {str(e)}", exc_info=True)
             return f"<!-- 렌더링 오류: {str(e)} -->"
 
+    def generate(self, data: Dict[str, Any]) -> Iterator[str]:
+        """스트리밍 렌더링 - 큰 출력을 메모리에 모으지 않고 조각 단위로 반환"""
+        try:
+            yield from self._template().generate(**data)
+        except Exception as e:
+            logger.error(f"템플릿 렌더링 실패: {str(e)}", exc_info=True)
+            yield f"<!-- 렌더링 오류: {str(e)} -->"
+
 
 class TemplateEngine:
     """고객 맞춤형 템플릿 엔진"""
@@ -38,6 +60,15 @@ class TemplateEngine:
         self.templates_dir = Path(templates_dir)
         self.templates_dir.mkdir(exist_ok=True)
 
+        # 공유 Environment - 템플릿 ID로 로드, 내용이 바뀐 템플릿만 다시 컴파일 (auto_reload + uptodate)
+        DEFAULT_BYTECODE_DIR.mkdir(parents=True, exist_ok=True)
+        self.environment = Environment(
+            loader=FunctionLoader(self._load_source),
+            bytecode_cache=FileSystemBytecodeCache(str(DEFAULT_BYTECODE_DIR)),
+            auto_reload=True,
+        )
+        self._compile_lock = threading.Lock()
+
         # 내장 템플릿 (기본 제공)
         self.builtin_templates = self._create_builtin_templates()
 
@@ -243,18 +274,32 @@ Generated by StudySnap
 
         return custom_templates
 
-    def get_template(self, template_id: str) -> Optional[OutputTemplate]:
-        """템플릿 ID로 템플릿 가져오기"""
+    def _lookup(self, template_id: str) -> Optional[OutputTemplate]:
         # 커스텀 템플릿 우선
-        if template_id in self.custom_templates:
-            return self.custom_templates[template_id]
-
-        # 내장 템플릿
-        if template_id in self.builtin_templates:
-            return self.builtin_templates[template_id]
+        return self.custom_templates.get(template_id) or self.builtin_templates.get(template_id)
+
+    def _load_source(self, template_id: str):
+        """Environment 로더 - (소스, 파일명, 최신 여부 확인 함수)"""
+        template = self._lookup(template_id)
+        if template is None:
+            return None
+        # 같은 ID의 템플릿 객체가 교체되면(create_custom_template) 다시 컴파일
+        return template.template_content, None, lambda: self._lookup(template_id) is template
+
+    def _compile(self, template: OutputTemplate) -> OutputTemplate:
+        """공유 Environment로 컴파일 (메모리 캐시 → 바이트코드 캐시 → 컴파일 순)"""
+        if template.compiled is None:
+            with self._compile_lock:
+                if template.compiled is None:
+                    template.compiled = self.environment.get_template(template.template_id)
+        return template
 
-        logger.warning(f"템플릿을 찾을 수 없음: {template_id}")
-        return None
+    def get_template(self, template_id: str) -> Optional[OutputTemplate]:
+        """템플릿 ID로 템플릿 가져오기"""
+        template = self._lookup(template_id)
+        if template is None:
+            logger.warning(f"템플릿을 찾을 수 없음: {template_id}")
+        return template
 
     def list_templates(self) -> List[Dict[str, str]]:
         """사용 가능한 모든 템플릿 목록"""
@@ -283,12 +328,19 @@ Generated by StudySnap
     def create_custom_template(self, template_id: str, name: str, description: str,
                                template_content: str) -> bool:
         """새로운 커스텀 템플릿 생성"""
+        previous = self.custom_templates.get(template_id)
         try:
-            # 유효성 검사
-            Template(template_content)  # Jinja2 문법 검증
-
             template = OutputTemplate(template_id, name, description, template_content)
             self.custom_templates[template_id] = template
+            try:
+                # Jinja2 문법 검증 겸 컴파일 (이전 내용으로 컴파일된 결과는 더 이상 쓰지 않음)
+                self._compile(template)
+            except Exception:
+                if previous is None:
+                    self.custom_templates.pop(template_id, None)
+                else:
+                    self.custom_templates[template_id] = previous
+                raise
 
             # 저장
             self._save_custom_templates()
@@ -323,11 +375,29 @@ Generated by StudySnap
 
     def render(self, template_id: str, data: Dict[str, Any]) -> Optional[str]:
         """템플릿 렌더링"""
-        template = self.get_template(template_id)
+        template = self._prepare(template_id)
         if template:
             return template.render(data)
         return None
 
+    def generate(self, template_id: str, data: Dict[str, Any]) -> Optional[Iterator[str]]:
+        """스트리밍 렌더링 - 출력 조각 이터레이터 (템플릿이 없으면 None)"""
+        template = self._prepare(template_id)
+        if template:
+            return template.generate(data)
+        return None
+
+    def _prepare(self, template_id: str) -> Optional[OutputTemplate]:
+        template = self.get_template(template_id)
+        if template is None:
+            return None
+        try:
+            return self._compile(template)
+        except Exception as e:
+            # 컴파일 오류는 OutputTemplate.render에서 오류 주석으로 표시
+            logger.error(f"템플릿 컴파일 실패: {template_id} ({e})")
+            return template
+
 
 # 싱글톤 인스턴스
 _template_engine = None
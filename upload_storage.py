@@ -0,0 +1,120 @@
+"""
+업로드 저장 모듈 - 업로드 파일을 메모리에 통째로 올리지 않고 디스크로 스트리밍 저장
+
+- 청크 단위로 업로드 폴더에 쓰면서 SHA-256 해시 계산
+- 크기 제한을 넘는 순간 저장 중단 + 임시 파일 삭제 (HTTP 413)
+- 변환기에는 bytes 대신 저장된 파일 경로(+ 해시)를 전달
+- Content-Length가 제한을 넘는 요청은 본문을 받기 전에 미들웨어에서 거절
+"""
+
+import os
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from fastapi import HTTPException, UploadFile
+from starlette.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+# 업로드 파일 최대 크기 (기본 50MB)
+MAX_UPLOAD_SIZE = int(os.getenv("MAX_FILE_SIZE_MB", "50")) * 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+# multipart 경계/폼 필드 여유분
+MULTIPART_OVERHEAD = 1024 * 1024
+
+
+@dataclass
+class StoredUpload:
+    """디스크에 저장된 업로드 파일"""
+    path: Path
+    size: int
+    sha256: str
+    original_filename: str
+
+    def read_bytes(self) -> bytes:
+        """파일 내용 전체 (꼭 bytes가 필요한 경우에만 사용)"""
+        return self.path.read_bytes()
+
+
+def _size_error(max_size: int) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"파일 크기는 {max_size // (1024 * 1024)}MB를 초과할 수 없습니다"
+    )
+
+
+async def save_upload(file: UploadFile, dest_path: Path, max_size: int = MAX_UPLOAD_SIZE,
+                      chunk_size: int = CHUNK_SIZE) -> StoredUpload:
+    """업로드 파일을 청크 단위로 dest_path에 저장
+
+    Args:
+        file: FastAPI UploadFile
+        dest_path: 저장 경로
+        max_size: 최대 크기 (바이트), 넘으면 저장을 중단하고 413 발생
+
+    Returns:
+        StoredUpload (경로, 크기, SHA-256)
+    """
+    dest_path = Path(dest_path)
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+    sha = hashlib.sha256()
+    size = 0
+    f = await asyncio.to_thread(open, dest_path, "wb")
+    try:
+        while True:
+            chunk = await file.read(chunk_size)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_size:
+                raise _size_error(max_size)
+            sha.update(chunk)
+            await asyncio.to_thread(f.write, chunk)
+    except BaseException:
+        f.close()
+        dest_path.unlink(missing_ok=True)
+        raise
+    f.close()
+
+    logger.info(f"업로드 저장: {dest_path.name} ({size / 1024 / 1024:.1f}MB)")
+    return StoredUpload(path=dest_path, size=size, sha256=sha.hexdigest(),
+                        original_filename=file.filename or dest_path.name)
+
+
+class UploadSizeLimitMiddleware:
+    """Content-Length가 제한을 넘는 업로드 요청을 본문 수신 전에 413으로 거절하는 ASGI 미들웨어
+
+    Args:
+        paths: 제한을 적용할 경로 (단일 파일 업로드 엔드포인트)
+        max_size: 파일 최대 크기 (multipart 여유분은 자동 추가)
+    """
+
+    def __init__(self, app, paths: Iterable[str], max_size: int = MAX_UPLOAD_SIZE):
+        self.app = app
+        self.paths = set(paths)
+        self.max_size = max_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "POST" and scope["path"] in self.paths:
+            content_length = self._content_length(scope)
+            if content_length is not None and content_length > self.max_size + MULTIPART_OVERHEAD:
+                logger.warning(f"업로드 거절 (본문 수신 전): {scope['path']} {content_length} bytes")
+                response = JSONResponse(status_code=413, content={"detail": _size_error(self.max_size).detail})
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _content_length(scope) -> Optional[int]:
+        for name, value in scope.get("headers", []):
+            if name == b"content-length":
+                try:
+                    return int(value)
+                except ValueError:
+                    return None
+        return None
@@ -0,0 +1,261 @@
+"""
+Vision OCR 결과 캐시 - 같은 페이지 이미지를 다시 변환할 때 Claude Vision API 재호출 방지
+
+- 키: (페이지 이미지 해시, 프롬프트 해시, 모델, max_tokens) → 내용 기반(content-addressed)
+- 저장: 캐시 디렉터리에 키별 JSON 파일 (프로세스 재시작 후에도 유지)
+- 정리: 보관 기간(일) 초과 항목 삭제 + 전체 용량 초과 시 오래 안 쓴 항목부터 삭제
+- 적중/미스 카운터, 강제 새로고침(force_refresh) 지원
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / "cache" / "vision_ocr"
+
+
+class VisionCache:
+    """Vision API 응답 텍스트를 디스크에 저장하는 내용 기반 캐시"""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size_mb: Optional[int] = None,
+                 max_age_days: Optional[int] = None, enabled: Optional[bool] = None):
+        self.cache_dir = Path(cache_dir or os.getenv("VISION_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        # 0도 유효한 값 (용량 0 = 저장하지 않음, 보관 기간 0 = 즉시 만료)
+        if max_size_mb is None:
+            max_size_mb = int(os.getenv("VISION_CACHE_MAX_MB", "200"))
+        if max_age_days is None:
+            max_age_days = int(os.getenv("VISION_CACHE_MAX_AGE_DAYS", "30"))
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.max_age_seconds = max_age_days * 86400
+        if enabled is None:
+            enabled = os.getenv("VISION_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+        self.enabled = enabled
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        # key -> (파일 크기, 마지막 사용 시각)
+        self._index: Optional[Dict[str, Tuple[int, float]]] = None
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    # ---------- 키 ----------
+
+    @staticmethod
+    def make_key(image_base64: str, prompt: str, model: str, max_tokens: int = 0) -> str:
+        """(이미지 해시, 프롬프트 해시, 모델) 조합 키 생성"""
+        image_hash = hashlib.sha256(image_base64.encode("ascii", "ignore")).hexdigest()
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return hashlib.sha256(f"{image_hash}:{prompt_hash}:{model}:{max_tokens}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _load_index_locked(self) -> Dict[str, Tuple[int, float]]:
+        """디스크의 캐시 파일 목록을 한 번만 스캔해 인덱스 구성"""
+        if self._index is None:
+            self._index = {}
+            self._total_bytes = 0
+            if self.cache_dir.exists():
+                for path in self.cache_dir.glob("*/*.json"):
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    self._index[path.stem] = (stat.st_size, stat.st_mtime)
+                    self._total_bytes += stat.st_size
+            logger.info(f"Vision 캐시 로드: {len(self._index)}개, {self._total_bytes / 1024 / 1024:.1f}MB")
+        return self._index
+
+    def _remove_locked(self, key: str) -> None:
+        index = self._load_index_locked()
+        size, _ = index.pop(key, (0, 0.0))
+        self._total_bytes -= size
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    # ---------- 조회/저장 ----------
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 응답 텍스트 (없거나 만료되면 None)"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            index = self._load_index_locked()
+            if key not in index:
+                self.misses += 1
+                return None
+
+            path = self._path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                self._remove_locked(key)
+                self.misses += 1
+                return None
+
+            if time.time() - entry.get("created_at", 0) > self.max_age_seconds:
+                self._remove_locked(key)
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            # 마지막 사용 시각 갱신 (용량 초과 시 정리 순서 기준)
+            now = time.time()
+            index[key] = (index[key][0], now)
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+
+            self.hits += 1
+            return entry.get("text")
+
+    def put(self, key: str, text: str, model: str = "") -> None:
+        """응답 텍스트 저장 (빈 응답은 저장하지 않음)"""
+        if not self.enabled or not text or self.max_size_bytes <= 0:
+            return
+
+        data = json.dumps({"model": model, "created_at": time.time(), "text": text}, ensure_ascii=False)
+        path = self._path(key)
+
+        with self._lock:
+            index = self._load_index_locked()
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Vision 캐시 저장 실패: {e}")
+                return
+
+            size = path.stat().st_size
+            old_size, _ = index.get(key, (0, 0.0))
+            index[key] = (size, time.time())
+            self._total_bytes += size - old_size
+            self.writes += 1
+
+            if self._total_bytes > self.max_size_bytes:
+                self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        """용량 초과 시 오래 안 쓴 항목부터 최대 용량의 90%까지 삭제"""
+        index = self._load_index_locked()
+        target = int(self.max_size_bytes * 0.9)
+        for key, _ in sorted(index.items(), key=lambda item: item[1][1]):
+            if self._total_bytes <= target:
+                break
+            self._remove_locked(key)
+            self.evictions += 1
+
+    def clear(self) -> int:
+        """캐시 전체 삭제, 삭제한 항목 수 반환"""
+        with self._lock:
+            index = self._load_index_locked()
+            count = len(index)
+            for key in list(index.keys()):
+                self._remove_locked(key)
+            return count
+
+    def get_stats(self) -> Dict:
+        """적중/미스 카운터와 캐시 용량"""
+        with self._lock:
+            index = self._load_index_locked()
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(index),
+                "size_bytes": self._total_bytes,
+                "max_size_bytes": self.max_size_bytes,
+                "max_age_days": self.max_age_seconds // 86400,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+            }
+
+    # ---------- Vision API 호출 ----------
+
+    def create_message(self, client, model: str, max_tokens: int, image_base64: str, media_type: str,
+                       prompt: str, force_refresh: bool = False) -> str:
+        """이미지 + 프롬프트 Vision API 호출 (캐시 적중 시 API 호출 생략)
+
+        Args:
+            client: Anthropic 클라이언트
+            force_refresh: True면 캐시를 무시하고 API를 호출해 결과를 덮어씀
+
+        Returns:
+            응답 텍스트 (API 오류는 호출자에게 그대로 전달)
+        """
+        key = self.make_key(image_base64, prompt, model, max_tokens)
+        if not force_refresh:
+            cached = self.get(key)
+            if cached is not None:
+                logger.info(f"Vision 캐시 적중: {key[:12]}")
+                get_metrics().record_vision_call(model, cached=True)
+                return cached
+
+        started = time.perf_counter()
+        message = client.messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "image",
+                            "source": {
+                                "type": "base64",
+                                "media_type": media_type,
+                                "data": image_base64,
+                            },
+                        },
+                        {
+                            "type": "text",
+                            "text": prompt
+                        }
+                    ],
+                }
+            ],
+        )
+
+        usage = getattr(message, "usage", None)
+        get_metrics().record_vision_call(
+            model, cached=False, seconds=time.perf_counter() - started,
+            input_tokens=getattr(usage, "input_tokens", 0) or 0,
+            output_tokens=getattr(usage, "output_tokens", 0) or 0,
+        )
+
+        text = message.content[0].text
+        self.put(key, text, model)
+        return text
+
+
+# 싱글톤 인스턴스
+_vision_cache = None
+
+def get_vision_cache() -> VisionCache:
+    """Vision OCR 캐시 싱글톤 인스턴스 가져오기"""
+    global _vision_cache
+    if _vision_cache is None:
+        _vision_cache = VisionCache()
+    return _vision_cache
@@ -6,10 +6,13 @@ Claude Vision OCR 모듈
 import os
 import base64
 import logging
-import anthropic
 from typing import Optional
 from dotenv import load_dotenv
 
+from anthropic_pool import get_client_pool
+from vision_cache import get_vision_cache
+from metrics import timed
+
 load_dotenv()
 
 # 로거 설정
@@ -19,19 +22,33 @@ logger = logging.getLogger(__name__)
 class VisionOCR:
     """Claude Vision API를 사용한 OCR"""
 
-    def __init__(self):
+    MODEL = "claude-sonnet-4-20250514"
+
+    def __init__(self, force_refresh: bool = False):
+        """
+        Args:
+            force_refresh: True면 Vision 캐시를 무시하고 API를 다시 호출 (결과는 캐시에 덮어씀)
+        """
+        self.force_refresh = force_refresh
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             logger.warning("ANTHROPIC_API_KEY가 설정되지 않았습니다. Vision OCR 기능을 사용할 수 없습니다.")
             self.client = None
         else:
             try:
-                self.client = anthropic.Anthropic(api_key=api_key)
+                self.client = get_client_pool().get(api_key)
                 logger.info("Claude Vision OCR 클라이언트 초기화 완료")
             except Exception as e:
                 logger.error(f"Claude Vision OCR 클라이언트 초기화 실패: {str(e)}")
                 self.client = None
 
+    def _create_message(self, image_base64: str, media_type: str, prompt: str, max_tokens: int = 4096) -> str:
+        """이미지 + 프롬프트 Vision API 호출 (같은 이미지/프롬프트/모델이면 캐시된 응답 사용)"""
+        return get_vision_cache().create_message(
+            self.client, self.MODEL, max_tokens, image_base64, media_type, prompt,
+            force_refresh=self.force_refresh
+        )
+
     def extract_text_from_image(self, image_base64: str, media_type: str = "image/jpeg") -> str:
         """이미지에서 텍스트 추출"""
         if not self.client:
@@ -42,24 +59,7 @@ class VisionOCR:
             if "base64," in image_base64:
                 image_base64 = image_base64.split("base64,")[1]
 
-            message = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": media_type,
-                                    "data": image_base64,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": """이 이미지에서 모든 텍스트를 추출해주세요.
+            prompt = """이 이미지에서 모든 텍스트를 추출해주세요.
 
 규칙:
 1. 이미지에 보이는 텍스트를 그대로 추출
@@ -69,13 +69,10 @@ class VisionOCR:
 5. 불필요한 설명 없이 텍스트만 반환
 
 추출된 텍스트:"""
-                            }
-                        ],
-                    }
-                ],
-            )
 
-            return message.content[0].text.strip()
+            response_text = self._create_message(image_base64, media_type, prompt, max_tokens=4096)
+
+            return response_text.strip()
 
         except Exception as e:
             logger.error(f"Vision OCR 텍스트 추출 오류: {str(e)}", exc_info=True)
@@ -382,31 +379,9 @@ class VisionOCR:
 [안내사항] (있으면)
 - 일정, 모집, 공지 등 중요 정보"""
 
-            message = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": media_type,
-                                    "data": image_base64,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ],
-                    }
-                ],
-            )
+            response_text = self._create_message(image_base64, media_type, prompt, max_tokens=4096)
 
-            text = message.content[0].text.strip()
+            text = response_text.strip()
             structured = self._parse_newsletter_response(text, page_number)
 
             return {
@@ -418,6 +393,7 @@ class VisionOCR:
             logger.error(f"소식지 정보 추출 오류 (페이지 {page_number}): {str(e)}", exc_info=True)
             return {"text": "", "structured": {}}
 
+    @timed("vision_parse")
     def _parse_newsletter_response(self, text: str, page_number: int) -> dict:
         """소식지 응답 파싱 (유연한 파싱)"""
         import re
@@ -655,24 +631,7 @@ class VisionOCR:
             elif page_number >= 11:
                 page_context = "이것은 경력 및 연락처 페이지입니다. 경력, 마무리 문구, 선거사무소, SNS 정보를 추출하세요."
 
-            message = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": media_type,
-                                    "data": image_base64,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": f"""{page_context}
+            prompt = f"""{page_context}
 
 이 선거 공보물 이미지를 **페이지별로** 정확하게 분석하여 정보를 추출해주세요.
 
@@ -730,13 +689,10 @@ class VisionOCR:
 - 모든 텍스트를 순서대로 추출하세요
 - 제목과 내용을 명확히 구분하세요
 - 숫자, 기호, 특수문자도 정확히 추출하세요"""
-                            }
-                        ],
-                    }
-                ],
-            )
 
-            raw_text = message.content[0].text.strip()
+            response_text = self._create_message(image_base64, media_type, prompt, max_tokens=4096)
+
+            raw_text = response_text.strip()
             return {
                 "text": raw_text,
                 "structured": self._parse_election_response(raw_text)
@@ -746,6 +702,7 @@ class VisionOCR:
             logger.error(f"선거 정보 추출 오류: {str(e)}", exc_info=True)
             return {"text": "", "structured": {}}
 
+    @timed("vision_parse")
     def _parse_election_response(self, text: str) -> dict:
         """Claude 응답을 구조화된 데이터로 파싱 - 페이지별 상세 파싱"""
         result = {
@@ -1110,31 +1067,9 @@ class VisionOCR:
 [페이지 내용]
 (보이는 모든 텍스트를 순서대로 추출)"""
 
-            message = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=8192,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": media_type,
-                                    "data": image_base64,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ],
-                    }
-                ],
-            )
+            response_text = self._create_message(image_base64, media_type, prompt, max_tokens=8192)
 
-            raw_text = message.content[0].text.strip()
+            raw_text = response_text.strip()
             return {
                 "text": raw_text,
                 "structured": self._parse_church_bulletin_response(raw_text)
@@ -1144,6 +1079,7 @@ class VisionOCR:
             logger.error(f"교회 주보 정보 추출 오류: {str(e)}", exc_info=True)
             return {"text": "", "structured": {}}
 
+    @timed("vision_parse")
     def _parse_church_bulletin_response(self, text: str) -> dict:
         """교회 주보 응답을 구조화된 데이터로 파싱 - 상세 버전"""
         result = {
@@ -1558,24 +1494,7 @@ class VisionOCR:
             if "base64," in image_base64:
                 image_base64 = image_base64.split("base64,")[1]
 
-            message = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=8192,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": media_type,
-                                    "data": image_base64,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": f"""이 강의 자료 이미지(페이지 {page_number})를 분석하여 구조화된 정보를 추출해주세요.
+            prompt = f"""이 강의 자료 이미지(페이지 {page_number})를 분석하여 구조화된 정보를 추출해주세요.
 
 **추출 형식:**
 
@@ -1625,13 +1544,10 @@ class VisionOCR:
 - 모든 텍스트를 순서대로 추출하세요
 - 수식이나 코드가 있으면 그대로 추출하세요
 - 표와 차트의 데이터도 추출하세요"""
-                            }
-                        ],
-                    }
-                ],
-            )
 
-            raw_text = message.content[0].text.strip()
+            response_text = self._create_message(image_base64, media_type, prompt, max_tokens=8192)
+
+            raw_text = response_text.strip()
             return {
                 "text": raw_text,
                 "structured": self._parse_lecture_response(raw_text),
@@ -1642,6 +1558,7 @@ class VisionOCR:
             logger.error(f"강의 정보 추출 오류: {str(e)}", exc_info=True)
             return {"text": "", "structured": {}, "page_number": page_number}
 
+    @timed("vision_parse")
     def _parse_lecture_response(self, text: str) -> dict:
         """강의 자료 응답을 구조화된 데이터로 파싱"""
         result = {
@@ -1740,24 +1657,7 @@ class VisionOCR:
             if "base64," in image_base64:
                 image_base64 = image_base64.split("base64,")[1]
 
-            message = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=8192,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": media_type,
-                                    "data": image_base64,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": f"""이 카탈로그/브로셔 이미지(페이지 {page_number})를 분석하여 구조화된 정보를 추출해주세요.
+            prompt = f"""이 카탈로그/브로셔 이미지(페이지 {page_number})를 분석하여 구조화된 정보를 추출해주세요.
 
 **추출 형식:**
 
@@ -1805,13 +1705,10 @@ SNS:
 - 모든 제품/서비스 정보를 빠짐없이 추출하세요
 - 가격, 할인 정보를 정확히 추출하세요
 - 제품 사양/스펙을 상세히 추출하세요"""
-                            }
-                        ],
-                    }
-                ],
-            )
 
-            raw_text = message.content[0].text.strip()
+            response_text = self._create_message(image_base64, media_type, prompt, max_tokens=8192)
+
+            raw_text = response_text.strip()
             return {
                 "text": raw_text,
                 "structured": self._parse_catalog_response(raw_text),
@@ -1822,6 +1719,7 @@ SNS:
             logger.error(f"카탈로그 정보 추출 오류: {str(e)}", exc_info=True)
             return {"text": "", "structured": {}, "page_number": page_number}
 
+    @timed("vision_parse")
     def _parse_catalog_response(self, text: str) -> dict:
         """카탈로그 응답을 구조화된 데이터로 파싱"""
         result = {
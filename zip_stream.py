@@ -0,0 +1,93 @@
+"""
+ZIP 스트리밍 모듈 - 압축 파일 전체를 메모리에 만들지 않고 청크 단위로 생성
+
+- zipfile을 탐색 불가능한(seek 없는) 출력에 쓰는 모드로 사용 → 항목마다 데이터 디스크립터 기록
+- 원본 파일을 청크로 읽으면서 압축된 바이트가 CHUNK_SIZE만큼 모이면 바로 내보냄
+- 이미 압축된 이미지/압축 파일(jpg, png, webp 등)은 재압축하지 않고 저장(ZIP_STORED)만 함
+- 동기 제너레이터이므로 StreamingResponse가 스레드 풀에서 실행 → 압축이 이벤트 루프를 막지 않음
+
+사용법:
+    from zip_stream import iter_folder_zip
+
+    return StreamingResponse(iter_folder_zip(folder), media_type="application/zip")
+"""
+
+import zipfile
+import logging
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+# 다시 압축해도 크기가 거의 줄지 않는 형식
+STORED_SUFFIXES = frozenset({
+    ".jpg", ".jpeg", ".png", ".webp", ".gif", ".avif", ".heic",
+    ".mp3", ".mp4", ".m4a", ".webm",
+    ".zip", ".gz", ".br", ".7z", ".woff", ".woff2",
+})
+
+
+class _ChunkSink:
+    """zipfile 출력 버퍼 - write()로 받은 바이트를 모아두고 청크로 꺼냄 (seek 미지원)"""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self._buffered = 0
+        self._position = 0
+
+    def write(self, data) -> int:
+        if data:
+            self._parts.append(bytes(data))
+            self._buffered += len(data)
+            self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def take(self, min_size: int = 0) -> Iterator[bytes]:
+        """모인 바이트가 min_size 이상이면 하나의 청크로 꺼냄"""
+        if self._buffered and self._buffered >= min_size:
+            chunk = b"".join(self._parts)
+            self._parts.clear()
+            self._buffered = 0
+            yield chunk
+
+
+def compress_type_for(path: Union[str, Path]) -> int:
+    """파일 형식별 압축 방식 (이미 압축된 형식은 ZIP_STORED)"""
+    return zipfile.ZIP_STORED if Path(path).suffix.lower() in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+
+
+def iter_zip(entries: Iterable[Tuple[Path, str]], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """(파일 경로, ZIP 내 경로) 목록을 ZIP으로 압축하며 청크 단위로 반환"""
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for path, arcname in entries:
+            info = zipfile.ZipInfo.from_file(path, arcname)
+            info.compress_type = compress_type_for(path)
+            with open(path, "rb") as src, zip_file.open(info, "w") as dst:
+                while True:
+                    data = src.read(chunk_size)
+                    if not data:
+                        break
+                    dst.write(data)
+                    yield from sink.take(chunk_size)
+    # 중앙 디렉터리(파일 목록)는 close 시점에 기록됨
+    yield from sink.take()
+
+
+def iter_folder_zip(folder: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """폴더 전체를 ZIP 스트림으로 (ZIP 안의 경로는 폴더 이름부터 시작)"""
+    folder = Path(folder)
+    entries = (
+        (file_path, file_path.relative_to(folder.parent).as_posix())
+        for file_path in sorted(folder.rglob("*"))
+        if file_path.is_file()
+    )
+    return iter_zip(entries, chunk_size)